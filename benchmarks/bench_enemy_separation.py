@@ -0,0 +1,116 @@
+"""
+Enemy Separation Benchmark
+==========================
+Times one pass of enemy-enemy separation (the push that stops enemies
+stacking) for the old O(n²) pairwise loop and the sort-and-sweep version
+used by Game._check_enemy_enemy_collisions.
+
+Enemies are scattered over a 4000x4000 world (the size of level_3/level_4)
+and jittered a little every frame, as if they were chasing the player.
+
+Usage:
+    python benchmarks/bench_enemy_separation.py
+    python benchmarks/bench_enemy_separation.py --counts 50 500 2000 --frames 60
+"""
+import argparse
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.game import Game
+from src.entities.enemy import Enemy
+from src.utils.enums import EnemyType
+
+WORLD_SIZE = 4000
+
+
+def pairwise_separation(enemies):
+    """The original O(n²) separation loop, kept here as the reference"""
+    for i, enemy1 in enumerate(enemies):
+        for enemy2 in enemies[i+1:]:
+            dx = enemy2.x - enemy1.x
+            dy = enemy2.y - enemy1.y
+            dist = math.sqrt(dx**2 + dy**2)
+            min_dist = enemy1.size + enemy2.size
+
+            if dist < min_dist and dist > 0:
+                overlap = min_dist - dist
+                push_x = (dx / dist) * overlap * 0.5
+                push_y = (dy / dist) * overlap * 0.5
+
+                enemy1.x -= push_x
+                enemy1.y -= push_y
+                enemy2.x += push_x
+                enemy2.y += push_y
+
+
+def sweep_separation(enemies):
+    """Run the game's separation pass without constructing a full Game"""
+    Game._check_enemy_enemy_collisions(SimpleNamespace(enemies=enemies))
+
+
+def make_enemies(count, seed):
+    rng = random.Random(seed)
+    return [
+        Enemy(rng.uniform(0, WORLD_SIZE), rng.uniform(0, WORLD_SIZE), rng.choice(list(EnemyType)), 0)
+        for _ in range(count)
+    ]
+
+
+def time_frames(separate, count, frames, seed):
+    """Return per-frame milliseconds for `frames` separation passes"""
+    enemies = make_enemies(count, seed)
+    rng = random.Random(seed + 1)
+    samples = []
+
+    for _ in range(frames):
+        # Small per-frame movement so the sweep's sort sees realistic churn
+        for enemy in enemies:
+            enemy.x += rng.uniform(-3, 3)
+            enemy.y += rng.uniform(-3, 3)
+
+        start = time.perf_counter()
+        separate(enemies)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return samples
+
+
+def describe(samples):
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return statistics.mean(samples), p95
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--counts', type=int, nargs='+', default=[50, 500, 2000])
+    parser.add_argument('--frames', type=int, default=60, help='frames timed for sort-and-sweep')
+    parser.add_argument('--pairwise-frames', type=int, default=5,
+                        help='frames timed for the O(n²) reference (slow at high counts)')
+    parser.add_argument('--seed', type=int, default=2500)
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print("Enemy separation: ms per frame (mean / p95)")
+    print("=" * 72)
+    print(f"{'enemies':>8}  {'pairwise':>20}  {'sort-and-sweep':>20}  {'speedup':>8}")
+
+    for count in args.counts:
+        old_mean, old_p95 = describe(time_frames(pairwise_separation, count, args.pairwise_frames, args.seed))
+        new_mean, new_p95 = describe(time_frames(sweep_separation, count, args.frames, args.seed))
+        speedup = old_mean / new_mean if new_mean > 0 else float('inf')
+        print(f"{count:>8}  {old_mean:>9.3f} / {old_p95:>8.3f}  {new_mean:>9.3f} / {new_p95:>8.3f}  {speedup:>7.1f}x")
+
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
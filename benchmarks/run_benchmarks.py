@@ -0,0 +1,225 @@
+"""
+Frame Cost Benchmarks
+=====================
+Runs every scenario in benchmarks/scenarios.py on a headless Game and
+reports p50/p95/p99 milliseconds for Game.update and Game.draw separately.
+Results are written to benchmarks/results/latest.json and compared with
+benchmarks/baseline.json; the script exits with status 1 if any scenario
+regressed beyond the tolerance.
+
+Usage:
+    python benchmarks/run_benchmarks.py                        # Run all, compare to baseline
+    python benchmarks/run_benchmarks.py --scenario bullet_storm
+    python benchmarks/run_benchmarks.py --ticks 1200 --warmup 120
+    python benchmarks/run_benchmarks.py --update-baseline      # Accept current numbers
+    python benchmarks/run_benchmarks.py --list
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+os.chdir(BASE_DIR)  # Map paths are relative to the repository root
+
+import numpy as np
+import pygame
+from src.game import Game
+from src.systems.input_source import ScriptedInput
+from src.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from benchmarks.scenarios import SCENARIOS
+
+BENCH_DIR = os.path.join(BASE_DIR, 'benchmarks')
+BASELINE_PATH = os.path.join(BENCH_DIR, 'baseline.json')
+RESULTS_PATH = os.path.join(BENCH_DIR, 'results', 'latest.json')
+PERCENTILES = (50, 95, 99)
+
+
+def summarize(samples):
+    """Percentiles and mean of a list of millisecond samples"""
+    values = np.asarray(samples)
+    summary = {f'p{p}': round(float(np.percentile(values, p)), 4) for p in PERCENTILES}
+    summary['mean'] = round(float(values.mean()), 4)
+    return summary
+
+
+def build_game(spec, seed):
+    """Load the scenario's map headless and run its setup"""
+    with contextlib.redirect_stdout(io.StringIO()):  # load_level is chatty
+        game = Game(SCREEN_WIDTH, SCREEN_HEIGHT, FPS, headless=True,
+                    input_source=ScriptedInput(spec['script']), seed=seed,
+                    start_level=spec['level'])
+        spec['setup'](game, random.Random(seed))
+    return game
+
+
+def run_scenario(spec, ticks, warmup, seed):
+    """Tick a scenario and time update() and draw() separately"""
+    game = build_game(spec, seed)
+    update_ms = []
+    draw_ms = []
+    peak_bullets = 0
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for tick in range(warmup + ticks):
+            game.input.advance()
+            game.handle_events()
+
+            start = time.perf_counter()
+            game.update()
+            middle = time.perf_counter()
+            game.draw()
+            end = time.perf_counter()
+
+            if tick >= warmup:
+                update_ms.append((middle - start) * 1000)
+                draw_ms.append((end - middle) * 1000)
+                peak_bullets = max(peak_bullets, len(game.bullets))
+
+    return {
+        'level': spec['level'],
+        'update': summarize(update_ms),
+        'draw': summarize(draw_ms),
+        'entities': {
+            'walls': len(game.walls),
+            'enemies_end': len(game.enemies),
+            'peak_bullets': peak_bullets,
+        },
+    }
+
+
+def compare(results, baseline, tolerance, min_delta):
+    """
+    Compare p50/p95 of each phase against the baseline
+
+    Returns:
+        List of (scenario, phase, stat, baseline_ms, current_ms) regressions
+    """
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for phase in ('update', 'draw'):
+            for stat in ('p50', 'p95'):
+                old = reference[phase][stat]
+                new = current[phase][stat]
+                if new > old * (1 + tolerance) and new - old > min_delta:
+                    regressions.append((name, phase, stat, old, new))
+    return regressions
+
+
+def print_table(results, baseline):
+    print(f"\n{'scenario':<24} {'update p50/p95/p99 ms':>24} {'draw p50/p95/p99 ms':>24} {'vs base p95':>14}")
+    print("-" * 90)
+    for name, result in results.items():
+        update = result['update']
+        draw = result['draw']
+        change = ""
+        if name in baseline:
+            old = baseline[name]['update']['p95'] + baseline[name]['draw']['p95']
+            new = update['p95'] + draw['p95']
+            change = f"{(new - old) / old * 100:+.0f}%" if old else ""
+        print(f"{name:<24} "
+              f"{update['p50']:>7.2f}/{update['p95']:>6.2f}/{update['p99']:>6.2f}   "
+              f"{draw['p50']:>7.2f}/{draw['p95']:>6.2f}/{draw['p99']:>6.2f}   "
+              f"{change:>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenario', action='append', help='run only this scenario (repeatable)')
+    parser.add_argument('--ticks', type=int, default=600, help='measured ticks per scenario')
+    parser.add_argument('--warmup', type=int, default=60, help='unmeasured ticks before timing starts')
+    parser.add_argument('--seed', type=int, default=2500)
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed relative slowdown before a regression is reported')
+    parser.add_argument('--min-delta', type=float, default=0.05,
+                        help='ignore slowdowns smaller than this many ms (timer noise)')
+    parser.add_argument('--output', default=RESULTS_PATH, help='where to write results JSON')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true', help='save these results as the new baseline')
+    parser.add_argument('--list', action='store_true', help='list scenarios and exit')
+    args = parser.parse_args()
+
+    if args.list:
+        for name, spec in SCENARIOS.items():
+            print(f"  {name:<24} {spec['description']}")
+        return 0
+
+    names = args.scenario or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        print(f"❌ Unknown scenario(s): {', '.join(unknown)} (see --list)")
+        return 2
+
+    print("=" * 90)
+    print(f"⏱️  Frame cost benchmarks: {len(names)} scenario(s), {args.ticks} ticks each")
+    print("=" * 90)
+
+    results = {}
+    for name in names:
+        print(f"   running {name}...", flush=True)
+        results[name] = run_scenario(SCENARIOS[name], args.ticks, args.warmup, args.seed)
+
+    report = {
+        'meta': {
+            'created_at': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'numpy': np.__version__,
+            'machine': platform.platform(),
+            'ticks': args.ticks,
+            'warmup': args.warmup,
+            'seed': args.seed,
+        },
+        'scenarios': results,
+    }
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f).get('scenarios', {})
+
+    print_table(results, baseline)
+    print(f"\n   Results: {os.path.relpath(args.output, BASE_DIR)}")
+
+    if args.update_baseline:
+        # Merge so a partial run only replaces the scenarios it measured
+        merged = dict(baseline)
+        merged.update(results)
+        report['scenarios'] = merged
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"   ✅ Baseline updated: {os.path.relpath(args.baseline, BASE_DIR)}")
+        return 0
+
+    if not baseline:
+        print("   (No baseline yet; run with --update-baseline to create one)")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance, args.min_delta)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for name, phase, stat, old, new in regressions:
+            print(f"   {name}: {phase} {stat} {old:.3f} → {new:.3f} ms")
+        return 1
+
+    print("\n✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Benchmark scenarios for run_benchmarks.py
+
+Each scenario names a real map from assets/maps/json, a setup function
+that stages the world on a freshly loaded headless Game, and an optional
+input script (see ScriptedInput) that drives the player every tick.
+The player is made effectively unkillable so a death never resets the
+scene halfway through a run.
+"""
+import math
+import pygame
+from src.entities.enemy import Enemy
+from src.utils.constants import *
+from src.utils.enums import EnemyType, TankType
+
+SCENARIOS = {}
+
+
+def scenario(name, level, description, script=None):
+    """Register a setup function as a named scenario"""
+    def register(setup):
+        SCENARIOS[name] = {
+            'level': level,
+            'description': description,
+            'setup': setup,
+            'script': script,
+        }
+        return setup
+    return register
+
+
+# ========== HELPERS ==========
+
+def make_invulnerable(game):
+    game.player.max_hp = 10 ** 9
+    game.player.hp = game.player.max_hp
+
+
+def spawn_around_player(game, rng, enemy_type, count, min_radius=150, max_radius=450, aggro=True):
+    """Place enemies on open floor in a ring around the player"""
+    spawned = 0
+    attempts = 0
+    while spawned < count and attempts < count * 50:
+        attempts += 1
+        angle = rng.uniform(0, math.pi * 2)
+        radius = rng.uniform(min_radius, max_radius)
+        x = game.player.x + math.cos(angle) * radius
+        y = game.player.y + math.sin(angle) * radius
+        if not (0 < x < game.world_width and 0 < y < game.world_height):
+            continue
+
+        enemy = Enemy(x, y, enemy_type, game.current_level_number)
+        rect = pygame.Rect(x - enemy.size, y - enemy.size, enemy.size * 2, enemy.size * 2)
+        if game.wall_grid.first_collision(rect):
+            continue
+
+        enemy.is_aggroed = aggro
+        game.enemies.append(enemy)
+        spawned += 1
+
+    game.index_enemies()
+    game.initial_enemy_count = len(game.enemies)
+
+
+def sweep_fire(input_source, tick):
+    """Hold fire and sweep the aim in a circle around the player"""
+    angle = tick * 0.05
+    input_source.mouse_pos = (
+        SCREEN_WIDTH // 2 + int(math.cos(angle) * 200),
+        SCREEN_HEIGHT // 2 + int(math.sin(angle) * 200)
+    )
+    input_source.mouse_buttons = (True, False, False)
+
+
+def use_tank(game, tank_type):
+    game.player.tank_type = tank_type
+    game.player.stats['reload'] = 7
+    game.player.stats['bullet_speed'] = 7
+
+
+# ========== SHIPPED LEVELS ==========
+
+def _register_level(level):
+    @scenario(f'level_{level}_idle', level, f"level_{level} as shipped, every spawn alive, player idle")
+    def setup(game, rng):
+        make_invulnerable(game)
+
+
+for _level in range(5):
+    _register_level(_level)
+
+
+@scenario('level_3_sweep_fire', 3, "level_3 spawns, BASIC tank firing in a sweeping circle", script=sweep_fire)
+def setup_level_3_sweep_fire(game, rng):
+    make_invulnerable(game)
+
+
+# ========== ENEMY SWARMS ==========
+
+def _register_swarm(enemy_type, count):
+    name = f'swarm_{enemy_type.name.lower()}'
+    description = f"{count} aggroed {enemy_type.name} around the player on level_3"
+
+    @scenario(name, 3, description)
+    def setup(game, rng):
+        make_invulnerable(game)
+        spawn_around_player(game, rng, enemy_type, count)
+
+
+for _enemy_type in EnemyType:
+    _register_swarm(_enemy_type, 60)
+
+
+# ========== SUSTAINED FIRE ==========
+
+@scenario('octo_fire', 4, "OCTO tank at max reload firing nonstop through level_4 spawns", script=sweep_fire)
+def setup_octo_fire(game, rng):
+    make_invulnerable(game)
+    use_tank(game, TankType.OCTO)
+    spawn_around_player(game, rng, EnemyType.SQUARE_TURRET, 20, 300, 600, aggro=False)
+
+
+@scenario('machine_gun_fire', 4, "MACHINE_GUN at max reload firing nonstop through level_4 spawns", script=sweep_fire)
+def setup_machine_gun_fire(game, rng):
+    make_invulnerable(game)
+    use_tank(game, TankType.MACHINE_GUN)
+    spawn_around_player(game, rng, EnemyType.SQUARE_TURRET, 20, 300, 600, aggro=False)
+
+
+@scenario('bullet_storm', 4, "40 aggroed PENTAGON_GUNNERs and 20 turrets firing at an OCTO tank", script=sweep_fire)
+def setup_bullet_storm(game, rng):
+    make_invulnerable(game)
+    use_tank(game, TankType.OCTO)
+    spawn_around_player(game, rng, EnemyType.PENTAGON_GUNNER, 40, 300, 500)
+    spawn_around_player(game, rng, EnemyType.SQUARE_TURRET, 20, 200, 400)
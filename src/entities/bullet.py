@@ -1,40 +1,185 @@
-
 import pygame
-import math
+import numpy as np
 from src.utils.constants import *
 
-class Bullet:
-    def __init__(self, x, y, angle, speed, damage, penetration, owner_type="player"):
-        self.x = x
-        self.y = y
-        self.angle = angle
-        self.speed = speed
-        self.damage = damage
-        self.health = penetration * 10  # Penetration determines bullet health
-        self.max_health = self.health
-        self.owner_type = owner_type
-        self.radius = 5
+# Owner codes stored in BulletPool.owner
+OWNER_PLAYER = 0
+OWNER_ENEMY = 1
+OWNER_CODES = {"player": OWNER_PLAYER, "enemy": OWNER_ENEMY}
+
+
+class BulletPool:
+    """
+    Structure-of-arrays store for every live projectile.
+
+    Each bullet is a row across the field arrays. Live bullets always occupy
+    rows [0, count); removing a bullet moves the last live row into its slot.
+    """
+
+    FIELDS = ('x', 'y', 'prev_x', 'prev_y', 'vx', 'vy', 'damage', 'health', 'max_health', 'radius', 'owner')
+
+    def __init__(self, capacity=512):
         self.z_index = 25  # Layer: Bullets drawn below enemies and player
+        self.count = 0
+        self.capacity = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Allocate (or grow) field arrays, keeping live rows"""
+        def grow(old, dtype):
+            new = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                new[:self.count] = old[:self.count]
+            return new
+
+        for field in self.FIELDS:
+            dtype = np.int8 if field == 'owner' else np.float64
+            setattr(self, field, grow(getattr(self, field, None), dtype))
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Remove every bullet"""
+        self.count = 0
+
+    def spawn(self, x, y, angle, speed, damage, penetration, owner_type="player", radius=5):
+        """Spawn a single bullet"""
+        self.spawn_batch([x], [y], [angle], speed, damage, penetration, owner_type, radius)
+
+    def spawn_batch(self, xs, ys, angles, speed, damage, penetration, owner_type="player", radius=5):
+        """
+        Spawn several bullets sharing speed, damage and penetration
+
+        Args:
+            xs, ys: Spawn positions (sequences of equal length)
+            angles: Travel direction of each bullet in radians
+            speed: Pixels per 60 Hz frame
+            damage: Damage dealt on hit
+            penetration: Penetration stat; bullet health is penetration * 10
+            owner_type: "player" or "enemy"
+            radius: Collision and draw radius
+        """
+        amount = len(angles)
+        if amount == 0:
+            return
+
+        start = self.count
+        end = start + amount
+        if end > self.capacity:
+            self._allocate(max(end, self.capacity * 2))
+
+        angles = np.asarray(angles, dtype=np.float64)
+        self.x[start:end] = xs
+        self.y[start:end] = ys
+        self.prev_x[start:end] = xs
+        self.prev_y[start:end] = ys
+        self.vx[start:end] = np.cos(angles) * speed
+        self.vy[start:end] = np.sin(angles) * speed
+        self.damage[start:end] = damage
+        self.health[start:end] = penetration * 10  # Penetration determines bullet health
+        self.max_health[start:end] = penetration * 10
+        self.radius[start:end] = radius
+        self.owner[start:end] = OWNER_CODES[owner_type]
+        self.count = end
+
+    def integrate(self, dt=1):
+        """Advance every bullet by its velocity over dt 60 Hz frames"""
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+
+    def begin_interpolation(self, alpha):
+        """
+        Move bullets alpha of the way from their previous to current tick position
         
-        # Calculate velocity
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed
-        
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        
+        Returns:
+            The true positions, to hand back to end_interpolation
+        """
+        n = self.count
+        true_x = self.x[:n].copy()
+        true_y = self.y[:n].copy()
+        self.x[:n] = self.prev_x[:n] + (true_x - self.prev_x[:n]) * alpha
+        self.y[:n] = self.prev_y[:n] + (true_y - self.prev_y[:n]) * alpha
+        return true_x, true_y
+
+    def end_interpolation(self, true_positions):
+        """Restore the positions saved by begin_interpolation"""
+        true_x, true_y = true_positions
+        n = len(true_x)
+        self.x[:n] = true_x
+        self.y[:n] = true_y
+
+    def cull(self, camera_x, camera_y):
+        """Despawn bullets that left the screen margin or ran out of health"""
+        n = self.count
+        screen_x = self.x[:n] - camera_x
+        screen_y = self.y[:n] - camera_y
+        dead = ((screen_x < -100) | (screen_x > SCREEN_WIDTH + 100) |
+                (screen_y < -100) | (screen_y > SCREEN_HEIGHT + 100) |
+                (self.health[:n] <= 0))
+        self.remove_mask(dead)
+
+    def indices_of(self, owner_type):
+        """Indices of live bullets belonging to owner_type"""
+        return np.flatnonzero(self.owner[:self.count] == OWNER_CODES[owner_type])
+
+    def remove(self, index):
+        """Remove one bullet by moving the last live bullet into its slot"""
+        last = self.count - 1
+        if index != last:
+            for field in self.FIELDS:
+                array = getattr(self, field)
+                array[index] = array[last]
+        self.count = last
+
+    def remove_mask(self, dead):
+        """
+        Remove every bullet flagged in a boolean mask of length count.
+        Holes below the new count are filled from live rows above it
+        (swap-with-last compaction, done for all holes at once).
+        """
+        n = self.count
+        dead_indices = np.flatnonzero(dead)
+        if len(dead_indices) == 0:
+            return
+
+        new_count = n - len(dead_indices)
+        holes = dead_indices[dead_indices < new_count]
+        if len(holes):
+            fillers = np.flatnonzero(~dead[new_count:n]) + new_count
+            for field in self.FIELDS:
+                array = getattr(self, field)
+                array[holes] = array[fillers]
+        self.count = new_count
+
+    def remove_indices(self, indices):
+        """Remove the bullets at the given indices"""
+        if len(indices) == 0:
+            return
+        dead = np.zeros(self.count, dtype=bool)
+        dead[indices] = True
+        self.remove_mask(dead)
+
     def draw(self, screen, camera_x, camera_y):
-        screen_x = int(self.x - camera_x)
-        screen_y = int(self.y - camera_y)
-        
-        # Draw bullet with health-based transparency
-        health_percent = self.health / self.max_health
-        color = CLEAN_BLUE if self.owner_type == "player" else CORRUPTION_ORANGE
-        pygame.draw.circle(screen, color, (screen_x, screen_y), self.radius)
-        
-    def is_off_screen(self, camera_x, camera_y):
-        screen_x = self.x - camera_x
-        screen_y = self.y - camera_y
-        return (screen_x < -100 or screen_x > SCREEN_WIDTH + 100 or 
-                screen_y < -100 or screen_y > SCREEN_HEIGHT + 100)
+        n = self.count
+        screen_x = (self.x[:n] - camera_x).astype(np.int32)
+        screen_y = (self.y[:n] - camera_y).astype(np.int32)
+        radius = self.radius[:n]
+
+        # Bullets live up to 100px past the screen edge; only draw the ones in view
+        visible = ((screen_x + radius >= 0) & (screen_x - radius < screen.get_width()) &
+                   (screen_y + radius >= 0) & (screen_y - radius < screen.get_height()))
+        screen_xs = screen_x[visible].tolist()
+        screen_ys = screen_y[visible].tolist()
+        radii = radius[visible].tolist()
+        owners = self.owner[:n][visible].tolist()
+
+        rects = []
+        for screen_x, screen_y, radius, owner in zip(screen_xs, screen_ys, radii, owners):
+            color = CLEAN_BLUE if owner == OWNER_PLAYER else CORRUPTION_ORANGE
+            rects.append(pygame.draw.circle(screen, color, (screen_x, screen_y), radius))
+        return rects
@@ -3,12 +3,14 @@ import math
 import random
 from src.utils.constants import *
 from src.utils.enums import EnemyType
-from src.entities.bullet import Bullet
+from src.systems.enemy_renderer import EnemyRenderer
 
 class Enemy:
     def __init__(self, x, y, enemy_type, lvl):
         self.x = x
         self.y = y
+        self.prev_x = x  # Position at the previous tick (for render interpolation)
+        self.prev_y = y
         self.type = enemy_type
         self.angle = 0
         self.health = 50
@@ -95,11 +97,12 @@ class Enemy:
         self.health -= damage
         self.is_aggroed = True  # Getting hit always aggros
     
-    def update(self, player_x, player_y, bullets):
+    def update(self, player_x, player_y, bullets, dt=1):
+        """Aggro, move and shoot; dt is the tick length in 60 Hz frames"""
         # Calculate distance to player
         dx = player_x - self.x
         dy = player_y - self.y
-        distance = math.sqrt(dx**2 + dy**2)
+        distance = math.sqrt(dx * dx + dy * dy)
         
         # Check aggro status
         if not self.is_aggroed:
@@ -111,27 +114,28 @@ class Enemy:
         
         # Boss shield mechanics
         if self.is_boss:
-            self._update_boss_shield()
+            self._update_boss_shield(dt)
         
         # Only act if aggroed
         if self.is_aggroed and distance > 0:
             self.angle = math.atan2(dy, dx)
             
             # Movement based on type
+            step = self.speed * dt
             if self.type == EnemyType.TRIANGLE_BLADE:
-                self.x += (dx / distance) * self.speed
-                self.y += (dy / distance) * self.speed
+                self.x += (dx / distance) * step
+                self.y += (dy / distance) * step
             elif self.type == EnemyType.SQUARE_TURRET:
                 if distance > 400:
-                    self.x += (dx / distance) * self.speed * 0.3
-                    self.y += (dy / distance) * self.speed * 0.3
+                    self.x += (dx / distance) * step * 0.3
+                    self.y += (dy / distance) * step * 0.3
             elif self.type == EnemyType.PENTAGON_GUNNER:
                 if distance < 300:
-                    self.x -= (dx / distance) * self.speed
-                    self.y -= (dy / distance) * self.speed
+                    self.x -= (dx / distance) * step
+                    self.y -= (dy / distance) * step
                 elif distance > 400:
-                    self.x += (dx / distance) * self.speed
-                    self.y += (dy / distance) * self.speed
+                    self.x += (dx / distance) * step
+                    self.y += (dy / distance) * step
 
             '''
             elif self.type == EnemyType.SNIPER:
@@ -140,48 +144,55 @@ class Enemy:
             elif self.type == EnemyType.BOSS:
                 # Boss keeps medium distance
                 if distance < 250:
-                    self.x -= (dx / distance) * self.speed
-                    self.y -= (dy / distance) * self.speed
+                    self.x -= (dx / distance) * step
+                    self.y -= (dy / distance) * step
                 elif distance > 350:
-                    self.x += (dx / distance) * self.speed
-                    self.y += (dy / distance) * self.speed
+                    self.x += (dx / distance) * step
+                    self.y += (dy / distance) * step
             
             '''
             # Shooting
-            self.shoot_cooldown -= 1
+            self.shoot_cooldown -= dt
             if self.shoot_cooldown <= 0 and self.shoot_delay > 0:
                 # Check range for shooting
                 shoot_range = 800 #if self.type == EnemyType.SNIPER else 500
                 if distance < shoot_range:
                     self.shoot(bullets)
-                    self.shoot_cooldown = self.shoot_delay
+                    # Carry this tick's overshoot into the next reload (but not time spent
+                    # waiting for the player to come in range), so longer ticks keep the
+                    # 60 Hz fire rate
+                    overshoot = self.shoot_cooldown if self.shoot_cooldown > -dt else 0
+                    self.shoot_cooldown = math.ceil(self.shoot_delay) + overshoot
         else:
-            # Idle behavior
-            self.angle += 0.02
+            self.idle(dt)
     
-    def _update_boss_shield(self):
+    def idle(self, dt=1):
+        """Idle behavior: turn slowly in place"""
+        self.angle += 0.02 * dt
+    
+    def _update_boss_shield(self, dt=1):
         """Update boss shield mechanics"""
         # Update shield duration
         if self.shield_active:
-            self.shield_duration -= 1
+            self.shield_duration -= dt
             if self.shield_duration <= 0:
                 self.shield_active = False
                 self.shield_cooldown = 420  # 7 seconds cooldown
         
         # Update shield cooldown
         if not self.shield_active and self.shield_cooldown > 0:
-            self.shield_cooldown -= 1
+            self.shield_cooldown -= dt
             if self.shield_cooldown <= 0:
                 # Activate shield
                 self.shield_active = True
                 self.shield_duration = 180  # 3 seconds of shield
     
-    def update_boss_spawning(self):
+    def update_boss_spawning(self, dt=1):
         """Check if boss should spawn enemies - called from game.py"""
         if not self.can_spawn_enemies or not self.is_aggroed:
             return None
         
-        self.spawn_timer -= 1
+        self.spawn_timer -= dt
         if self.spawn_timer <= 0:
             self.spawn_timer = self.spawn_cooldown
             # Return spawn positions around the boss
@@ -199,103 +210,22 @@ class Enemy:
         dmg_multi = 1 + (self.game_level * 0.1)
         
         if self.type == EnemyType.SQUARE_TURRET:
-            bullets.append(Bullet(self.x, self.y, self.angle, 8, 10 * dmg_multi, 3, "enemy"))
+            bullets.spawn(self.x, self.y, self.angle, 8, 10 * dmg_multi, 3, "enemy")
         elif self.type == EnemyType.PENTAGON_GUNNER:
             # 5-way shot
-            for i in range(5):
-                angle_offset = (i - 2) * 0.3
-                bullets.append(Bullet(self.x, self.y, self.angle + angle_offset, 7, 8 * dmg_multi, 2, "enemy"))
+            angles = [self.angle + (i - 2) * 0.3 for i in range(5)]
+            bullets.spawn_batch([self.x] * 5, [self.y] * 5, angles, 7, 8 * dmg_multi, 2, "enemy")
         '''
         elif self.type == EnemyType.SNIPER:
             # High damage, fast bullet
-            bullets.append(Bullet(self.x, self.y, self.angle, 15, 25 * dmg_multi, 5, "enemy"))
+            bullets.spawn(self.x, self.y, self.angle, 15, 25 * dmg_multi, 5, "enemy")
         elif self.type == EnemyType.BOSS:
             # 5-way shot with bigger bullets
-            for i in range(5):
-                angle_offset = (i - 2) * 0.25
-                bullet = Bullet(self.x, self.y, self.angle + angle_offset, 9, 15 * dmg_multi, 4, "enemy")
-                bullet.radius = 10  # Bigger bullets
-                bullets.append(bullet)
+            angles = [self.angle + (i - 2) * 0.25 for i in range(5)]
+            bullets.spawn_batch([self.x] * 5, [self.y] * 5, angles, 9, 15 * dmg_multi, 4, "enemy",
+                                radius=10)  # Bigger bullets
         '''
     
     def draw(self, screen, camera_x, camera_y):
-        screen_x = int(self.x - camera_x)
-        screen_y = int(self.y - camera_y)
-        
-        # Draw shield effect for boss
-        if self.shield_active:
-            pygame.draw.circle(screen, (100, 200, 255), (screen_x, screen_y), self.size + 10, 2)
-            pygame.draw.circle(screen, (100, 200, 255, 50), (screen_x, screen_y), self.size + 8, 1)
-        
-        # Choose color based on aggro state and type
-        if self.type == EnemyType.SQUARE_TURRET:
-            color = CORRUPTION_PINK if self.is_aggroed else CLEAN_BLUE
-            pygame.draw.rect(screen, color, 
-                           (screen_x - self.size//2, screen_y - self.size//2, self.size, self.size), 2)
-        elif self.type == EnemyType.TRIANGLE_BLADE:
-            color = CORRUPTION_ORANGE if self.is_aggroed else CORRUPTION_PINK
-            points = [
-                (screen_x + math.cos(self.angle) * self.size, 
-                 screen_y + math.sin(self.angle) * self.size),
-                (screen_x + math.cos(self.angle + 2.4) * self.size, 
-                 screen_y + math.sin(self.angle + 2.4) * self.size),
-                (screen_x + math.cos(self.angle - 2.4) * self.size, 
-                 screen_y + math.sin(self.angle - 2.4) * self.size)
-            ]
-            pygame.draw.polygon(screen, color, points, 2)
-        elif self.type == EnemyType.PENTAGON_GUNNER or self.type == EnemyType.BOSS:
-            if self.is_boss:
-                color = (255, 50, 50) if self.is_aggroed else (200, 100, 0)
-                thickness = 4
-            else:
-                color = (255, 100, 100) if self.is_aggroed else CORRUPTION_ORANGE
-                thickness = 2
-            
-            points = []
-            for i in range(5):
-                angle = self.angle + (i * math.pi * 2 / 5)
-                points.append((screen_x + math.cos(angle) * self.size,
-                             screen_y + math.sin(angle) * self.size))
-            pygame.draw.polygon(screen, color, points, thickness)
-        '''
-        elif self.type == EnemyType.SNIPER:
-            color = (150, 0, 200) if self.is_aggroed else (100, 0, 150)
-            # Draw octagon for sniper
-            points = []
-            for i in range(8):
-                angle = self.angle + (i * math.pi * 2 / 8)
-                points.append((screen_x + math.cos(angle) * self.size,
-                             screen_y + math.sin(angle) * self.size))
-            pygame.draw.polygon(screen, color, points, 2)
-            
-            # Draw sniper barrel
-            barrel_length = self.size * 1.5
-            barrel_end_x = screen_x + math.cos(self.angle) * barrel_length
-            barrel_end_y = screen_y + math.sin(self.angle) * barrel_length
-            pygame.draw.line(screen, color, (screen_x, screen_y), 
-                           (barrel_end_x, barrel_end_y), 3)
-        '''
-        
-        # Optional: Draw aggro range indicator (for debugging)
-        if not self.is_aggroed:
-            pygame.draw.circle(screen, (100, 100, 100), (screen_x, screen_y), self.aggro_range, 1)
-        
-        # Health bar
-        bar_width = 40 if not self.is_boss else 80
-        bar_height = 4 if not self.is_boss else 8
-        health_percent = self.health / self.max_health
-        pygame.draw.rect(screen, UI_GRAY, 
-                        (screen_x - bar_width//2, screen_y - self.size - 15, bar_width, bar_height))
-        
-        # Health bar color changes for boss
-        health_color = (255, 0, 0) if self.is_boss else CORRUPTION_PINK
-        pygame.draw.rect(screen, health_color, 
-                        (screen_x - bar_width//2, screen_y - self.size - 15, 
-                         int(bar_width * health_percent), bar_height))
-        
-        # Boss name tag
-        if self.is_boss:
-            font = pygame.font.Font(None, 24)
-            name_text = font.render("BOSS", True, (255, 50, 50))
-            text_rect = name_text.get_rect(center=(screen_x, screen_y - self.size - 30))
-            screen.blit(name_text, text_rect)
\ No newline at end of file
+        """Draw this enemy on its own (the game batches enemies through EnemyLayer)"""
+        return EnemyRenderer.draw_enemies(screen, [self], camera_x, camera_y)
\ No newline at end of file
@@ -2,7 +2,6 @@ import pygame
 import math
 from src.utils.constants import *
 from src.utils.enums import *
-from src.entities.bullet import Bullet
 from src.systems.tank_renderer import TankRenderer
 from src.systems.attack_system import ShootingSystem
 from src.configs.tank_configs import TANK_CONFIGS
@@ -14,6 +13,8 @@ class Player:
     def __init__(self, x, y):
         self.x = x
         self.y = y
+        self.prev_x = x  # Position at the previous tick (for render interpolation)
+        self.prev_y = y
         self.angle = 0
         self.tank_type = TankType.BASIC
         self.z_index = 100  # Layer: Player drawn on top of enemies and bullets
@@ -57,7 +58,12 @@ class Player:
     def get_reload_speed(self):
         return max(5, self.base_reload - (self.stats['reload'] * 2))
     
-    def update(self, keys, mouse_pos, camera_x, camera_y):
+    def update(self, keys, mouse_pos, camera_x, camera_y, current_time=None, dt=1):
+        """
+        Args:
+            current_time: Game time in ms (falls back to pygame's clock)
+            dt: Tick length in 60 Hz frames (1 at the default tick rate)
+        """
         # Movement
         dx = 0
         dy = 0
@@ -75,8 +81,8 @@ class Player:
             dx *= 0.707
             dy *= 0.707
         
-        self.x += dx * self.speed
-        self.y += dy * self.speed
+        self.x += dx * self.speed * dt
+        self.y += dy * self.speed * dt
         
         # Aim towards mouse
         screen_mouse_x, screen_mouse_y = mouse_pos
@@ -86,13 +92,16 @@ class Player:
         
         # Decrease cooldown
         if self.shoot_cooldown > 0:
-            self.shoot_cooldown -= 1
+            self.shoot_cooldown -= dt
+        else:
+            self.shoot_cooldown = 0  # Ready since last tick: no overshoot to carry into the next reload
         
         # Health regeneration (simplified)
-        current_time = pygame.time.get_ticks()
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         if current_time - self.last_damage_time > 5000:  # 5 seconds no damage
             regen_amount = 0.5 + ((self.stats['health_regen'] + 1) * 0.3)
-            self.hp = min(self.max_hp, self.hp + regen_amount)
+            self.hp = min(self.max_hp, self.hp + regen_amount * dt)
     
     def shoot(self, bullets):
         ShootingSystem.shoot(self, bullets)
@@ -132,4 +141,4 @@ class Player:
             #self.skill_points += 1
     
     def draw(self, screen, camera_x, camera_y):
-        TankRenderer.draw_tank(screen, self, camera_x, camera_y)
\ No newline at end of file
+        return TankRenderer.draw_tank(screen, self, camera_x, camera_y)
\ No newline at end of file
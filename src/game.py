@@ -1,10 +1,14 @@
+import os
+import time
 import pygame
 import random
 import math
+import numpy as np
 
 from src.ui.game_over import GameOverScreen
 from src.entities.player import Player
 from src.entities.enemy import Enemy
+from src.entities.bullet import BulletPool
 #from src.levels.level_manager import LevelManager
 #from src.ui.hud import HUD
 from src.utils.constants import *
@@ -12,18 +16,69 @@ from src.utils.enums import *
 from src.ui.stat_upgrade_ui import StatUpgradeUI
 from src.entities.wall import Wall
 from src.systems.collisions import CollisionSystem
-from src.levels.map_generator import MapGenerator
+from src.systems.wall_grid import WallGrid
+from src.systems.spatial_hash import SpatialHash
+from src.systems.world_layer import StaticWorldLayer
+from src.systems.input_source import LiveInput, ScriptedInput
+from src.systems.frame_profiler import FrameProfiler
+from src.systems.enemy_renderer import EnemyRenderer, EnemyLayer
+from src.systems.dirty_rects import DirtyRectRenderer
+from src.systems.render_queue import RenderQueue
+from src.systems.ai_scheduler import AIScheduler
+from src.systems.enemy_batch import EnemyBatch
+from src.levels.level_loader import LevelLoader
 from src.ui.level_transition import LevelTransition
 from src.ui.level_progress_ui import LevelProgressUI
 from src.ui.minimap import Minimap
+from src.ui.profiler_overlay import ProfilerOverlay
+from src.ui.text_cache import text_cache
 
 
 class Game:
-    def __init__(self, width, height, fps):
-        self.screen = pygame.display.set_mode((width, height))
-        pygame.display.set_caption("Nano Drone Combat")
+    def __init__(self, width, height, fps, headless=False, input_source=None, seed=None, start_level=0,
+                 profile=False, tick_rate=SIM_TICK_RATE, dirty_rects=DIRTY_RECTS, ai_lod=AI_LOD,
+                 enemy_batch=ENEMY_BATCH):
+        """
+        Args:
+            width, height: Screen size
+            fps: Render frame cap for run()
+            headless: Never open a window; render (if at all) to an offscreen surface
+            input_source: Where events/keys/mouse/time come from
+                          (defaults to LiveInput, or an idle ScriptedInput when headless)
+            seed: Seed for the random module so enemy types and spread repeat
+            start_level: Level loaded on startup
+            profile: Record per-phase frame timings from the start (otherwise only while F3 overlay is up)
+            tick_rate: Fixed game-logic updates per second (gameplay is the same at any rate)
+            dirty_rects: Repaint and present only the regions that changed while the camera holds still
+            ai_lod: Update idle enemies far from the player less often (AIScheduler)
+            enemy_batch: Run enemy AI through the vectorised EnemyBatch (same gameplay)
+        """
+        self.headless = headless
+        if headless:
+            # The dummy video driver lets pygame's mouse/event modules work without a display
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            pygame.init()
+            self.screen = pygame.Surface((width, height))
+        else:
+            self.screen = pygame.display.set_mode((width, height))
+            pygame.display.set_caption("Nano Drone Combat")
+        self.dirty_rects = DirtyRectRenderer((width, height)) if dirty_rects else None
+        
+        if seed is not None:
+            random.seed(seed)
+        
+        self.input = input_source or (ScriptedInput() if headless else LiveInput())
         self.clock = pygame.time.Clock()
+        self.fps = fps
         self.running = True
+        
+        # Fixed timestep: every update() advances the game by exactly one tick
+        self.tick_rate = tick_rate
+        self.dt = BASE_TICK_RATE / tick_rate  # Tick length in the 60 Hz frames gameplay is tuned in
+        self.sim_ticks = 0
+        self.sim_time = 0  # Game time in ms; drives regen and damage timers
+        self.stalled = False  # A blocking screen held up run(); the time it took is not caught up on
+        self.deaths = 0
 
         # Level Manangment
         self.current_level_number = 0
@@ -31,20 +86,35 @@ class Game:
 
         # Game world
         self.walls = []
+        self.wall_grid = WallGrid(self.walls)
         self.world_width = 3000
         self.world_height = 3000
+        self.world_layer = StaticWorldLayer(self.world_width, self.world_height, self.walls)
         
         # Camera
         self.camera_x = 0
         self.camera_y = 0
+        self.prev_camera_x = 0
+        self.prev_camera_y = 0
         
         # Game objects
         self.player = Player(self.world_width // 2, self.world_height // 2)
-        self.bullets = []
+        self.bullets = BulletPool()
         self.enemies = []
 
         # Enemies
         self.enemy_spawn_points = []
+        self.enemy_hash = SpatialHash(cell_size=100)  # Broad phase for bullet hits and draw culling
+        self.enemy_reach = 0  # Farthest any enemy's drawing extends from its centre
+        # Which enemies think this tick, and how
+        self.ai_scheduler = AIScheduler(self.enemy_hash, enabled=ai_lod,
+                                        batch=EnemyBatch() if enemy_batch else None)
+        
+        # Z-layered draw list: bullets, one batch per enemy z_index, player
+        self.render_queue = RenderQueue()
+        self.render_queue.add(self.bullets)
+        self.render_queue.add(self.player)
+        self.enemy_layers = {}  # z_index -> EnemyLayer
 
         # Boss Fight implementation
         self.has_boss = False
@@ -54,11 +124,15 @@ class Game:
         self.collision_system = CollisionSystem() if 'CollisionSystem' in dir() else None
         
         # UI
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 18)
+        self.font = text_cache.font(None, 24)
+        self.small_font = text_cache.font(None, 18)
         self.stat_ui = StatUpgradeUI() #Ui representing stat points upgrade
         self.level_progress_ui = LevelProgressUI()
         self.minimap = Minimap(self.world_width, self.world_height)
+        
+        # Frame timing (F3); near-free while disabled
+        self.profiler = FrameProfiler(enabled=profile)
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
 
         # Level progress
         self.initial_enemy_count = 0
@@ -66,7 +140,7 @@ class Game:
         self.next_level_button_rect = None
 
         # Load first level
-        self.load_level(0)
+        self.load_level(start_level)
 
 
         # Spawn initial enemies
@@ -75,22 +149,33 @@ class Game:
 
 
     def load_level(self, level_number):
-        """Load a level by number"""
+        """Load a level by number, blocking until it is ready"""
         print(f"\n{'='*60}")
         print(f"Loading Level {level_number}...")
         print(f"{'='*60}")
         
-        # Generate map from JSON
-        map_result = MapGenerator.generate_map_from_json(level_number)
+        self.install_level(level_number, LevelLoader.prepare(level_number))
+    
+    def install_level(self, level_number, map_result):
+        """
+        Switch the game over to a prepared level
+        
+        Only swaps references and resets entities, so it is cheap enough to
+        run between two frames after a background load.
         
+        Args:
+            level_number: Level that was prepared
+            map_result: LevelLoader.prepare() result (None if loading failed)
+        """
         if map_result:
             # Update walls
             self.walls = map_result['walls']
-            print(len(map_result['walls']))
+            self.wall_grid = map_result['wall_grid']
             self.enemy_barriers = map_result.get('barriers', [])
             
             # Update world size
             self.world_width, self.world_height = map_result['map_size']
+            self.world_layer = map_result['world_layer']
             
             # Update level info
             self.current_level_number = level_number
@@ -111,16 +196,23 @@ class Game:
             self.enemies.clear()
             self.bullets.clear()
 
-            # Spawn enemies
-            self.spawn_enemies(self.current_level_number)
+            # Enemies were built with the level
+            self.enemies.extend(map_result['enemies'])
+            self.index_enemies()
 
             # Track initial enemy count for progress bar
             self.initial_enemy_count = len(self.enemies)
             self.level_complete = False
             
-            # Update minimap world size
-            self.minimap.world_width = self.world_width
-            self.minimap.world_height = self.world_height
+            # Minimap rebuilds its wall layer from the tile grid
+            self.minimap.set_level(self.world_width, self.world_height, map_result.get('tiles'),
+                                   self.walls + self.enemy_barriers)
+            
+            # Teleported: don't interpolate from the old level
+            self.update_camera()
+            self.store_previous_positions()
+            if self.dirty_rects:
+                self.dirty_rects.invalidate()
             
             print(f"✅ Level loaded successfully!")
             print(f"   Name: {self.level_name}")
@@ -131,13 +223,13 @@ class Game:
         else:
             print(f"❌ Failed to load level {level_number}, using empty map")
             self.walls = []
+            self.wall_grid = WallGrid(self.walls)
+            self.world_layer = StaticWorldLayer(self.world_width, self.world_height, self.walls)
+            self.minimap.set_level(self.world_width, self.world_height)
     
     def spawn_enemies(self, current_lvl): # Difficulty
-        spawn_points = self.enemy_spawn_points
-        for i in range(len(spawn_points)):
-            spawn_x, spawn_y = spawn_points[i]
-            enemy_type = random.choice(list(EnemyType)) # change this to choose what enemy type is
-            self.enemies.append(Enemy(spawn_x, spawn_y, enemy_type, current_lvl))
+        self.enemies.extend(LevelLoader.build_enemies(self.enemy_spawn_points, current_lvl))
+        self.index_enemies()
 
         '''
         for _ in range(count):
@@ -153,15 +245,42 @@ class Game:
             self.enemies.append(Enemy(x, y, enemy_type))
         '''
     
+    def index_enemies(self):
+        """Rebuild the spatial hash, AI tiers and render layers after self.enemies was replaced"""
+        self.enemy_hash.rebuild(self.enemies)
+        self.enemy_reach = max(map(EnemyRenderer.reach, self.enemies), default=0)
+        self.ai_scheduler.reset(self.enemies)
+        
+        for layer in self.enemy_layers.values():
+            layer.clear()
+        for enemy in self.enemies:
+            layer = self.enemy_layers.get(enemy.z_index)
+            if layer is None:
+                layer = self.enemy_layers[enemy.z_index] = EnemyLayer(enemy.z_index, self.visible_enemies)
+                self.render_queue.add(layer)
+            layer.add(enemy)
+    
+    def remove_enemy(self, enemy):
+        """Take a dead enemy out of the game, the AI tiers, the spatial hash and its render layer"""
+        self.enemies.remove(enemy)
+        self.ai_scheduler.remove(enemy)
+        self.enemy_hash.remove(enemy)
+        self.enemy_layers[enemy.z_index].remove(enemy)
+    
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.input.get_events():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                if self.dirty_rects:
+                    self.dirty_rects.invalidate()  # The window was uncovered; repaint all of it
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
                 elif event.key == pygame.K_m:  # ADD THIS
                     self.minimap.toggle()
+                elif event.key == pygame.K_F3:
+                    self.profiler_overlay.toggle()
                 elif event.key == pygame.K_1:
                     self.player.tank_type = TankType.BASIC
                 elif event.key == pygame.K_2 and self.player.level >= 3:
@@ -180,6 +299,7 @@ class Game:
                     self.player.tank_type = TankType.MACHINE_GUN
                 elif event.key == pygame.K_c:  # Press 'C' to clear all enemies for testing purposes
                     self.enemies.clear() 
+                    self.index_enemies()
 
 
                 elif event.key == pygame.K_k:
@@ -197,11 +317,21 @@ class Game:
         """Handle transition to next level"""
         next_level = self.current_level_number + 1
         
-        # Show transition screen
-        transition = LevelTransition(self.current_level_number, next_level)
-        if transition.show(self.screen):
-            # Load next level
+        if self.headless:
             self.load_level(next_level)
+            return
+        
+        # Load the next level on a worker thread while the transition plays
+        print(f"\n{'='*60}")
+        print(f"Loading Level {next_level}...")
+        print(f"{'='*60}")
+        loader = LevelLoader(next_level).start()
+        
+        transition = LevelTransition(self.current_level_number, next_level)
+        shown = transition.show(self.screen, loader)
+        self.stalled = True
+        if shown:
+            self.install_level(next_level, loader.wait())
         else:
             # User closed window during transition
             self.running = False
@@ -220,13 +350,12 @@ class Game:
                 self.player.size * 2
             )
         
-        for wall in self.walls:
-            if wall.collides_with(player_rect):
-                self.player.x = old_x
-                self.player.y = old_y
-                if hasattr(self.player, 'rect'):
-                    self.player.rect.center = (old_x, old_y)
-                return True
+        if self.wall_grid.first_collision(player_rect):
+            self.player.x = old_x
+            self.player.y = old_y
+            if hasattr(self.player, 'rect'):
+                self.player.rect.center = (old_x, old_y)
+            return True
         return False
     
     def handle_enemy_collisions(self, enemy_old_positions):
@@ -257,13 +386,12 @@ class Game:
     
     def _check_enemy_wall_collision(self, enemy, enemy_rect, old_x, old_y):
         """Check if enemy collides with walls and revert position if so"""
-        for wall in self.walls:
-            if wall.collides_with(enemy_rect):
-                enemy.x = old_x
-                enemy.y = old_y
-                if hasattr(enemy, 'rect'):
-                    enemy.rect.center = (old_x, old_y)
-                return True
+        if self.wall_grid.first_collision(enemy_rect):
+            enemy.x = old_x
+            enemy.y = old_y
+            if hasattr(enemy, 'rect'):
+                enemy.rect.center = (old_x, old_y)
+            return True
         return False
     
     def _check_enemy_player_collision(self, enemy):
@@ -288,7 +416,7 @@ class Game:
             dmg_multi = 1 + (self.current_level_number * 0.1)
             
             # Deal contact damage
-            current_time = pygame.time.get_ticks()
+            current_time = self.sim_time
             if not hasattr(enemy, 'last_contact_damage') or current_time - enemy.last_contact_damage > 1000:
                 self.player.hp -= 5 * dmg_multi
                 self.player.last_damage_time = current_time
@@ -298,28 +426,34 @@ class Game:
     
     def _check_enemy_enemy_collisions(self):
         """Prevent enemies from stacking on each other"""
-        for i, enemy1 in enumerate(self.enemies):
-            for enemy2 in self.enemies[i+1:]:
-                dx = enemy2.x - enemy1.x
-                dy = enemy2.y - enemy1.y
-                dist = math.sqrt(dx**2 + dy**2)
-                min_dist = enemy1.size + enemy2.size
+        enemies = self.enemies
+        
+        # Sort-and-sweep finds overlapping pairs; resolve them in list order
+        for i, j in CollisionSystem.find_overlapping_circles(enemies):
+            enemy1 = enemies[i]
+            enemy2 = enemies[j]
+            
+            # Re-measure: earlier pushes this pass may have moved either enemy
+            dx = enemy2.x - enemy1.x
+            dy = enemy2.y - enemy1.y
+            dist = math.sqrt(dx**2 + dy**2)
+            min_dist = enemy1.size + enemy2.size
+            
+            if dist < min_dist and dist > 0:
+                # Push enemies apart
+                overlap = min_dist - dist
+                push_x = (dx / dist) * overlap * 0.5
+                push_y = (dy / dist) * overlap * 0.5
+                
+                enemy1.x -= push_x
+                enemy1.y -= push_y
+                enemy2.x += push_x
+                enemy2.y += push_y
                 
-                if dist < min_dist and dist > 0:
-                    # Push enemies apart
-                    overlap = min_dist - dist
-                    push_x = (dx / dist) * overlap * 0.5
-                    push_y = (dy / dist) * overlap * 0.5
-                    
-                    enemy1.x -= push_x
-                    enemy1.y -= push_y
-                    enemy2.x += push_x
-                    enemy2.y += push_y
-                    
-                    if hasattr(enemy1, 'rect'):
-                        enemy1.rect.center = (enemy1.x, enemy1.y)
-                    if hasattr(enemy2, 'rect'):
-                        enemy2.rect.center = (enemy2.x, enemy2.y)
+                if hasattr(enemy1, 'rect'):
+                    enemy1.rect.center = (enemy1.x, enemy1.y)
+                if hasattr(enemy2, 'rect'):
+                    enemy2.rect.center = (enemy2.x, enemy2.y)
     
     def handle_bullet_collisions(self):
         """Handle all bullet collision detection"""
@@ -329,62 +463,110 @@ class Game:
     
     def _check_player_bullets_vs_enemies(self):
         """Check player bullets hitting enemies"""
-        for bullet in self.bullets[:]:
-            if bullet.owner_type == "player":
-                for enemy in self.enemies[:]:
-                    dist = math.sqrt((bullet.x - enemy.x)**2 + (bullet.y - enemy.y)**2)
-                    if dist < enemy.size:
-                        enemy.take_damage(bullet.damage)
-                        bullet.health -= 20
-                        
-                        if enemy.health <= 0:
-                            self.player.gain_xp(enemy.xp_value)
-                            self.enemies.remove(enemy)
-                        
-                        if bullet.health <= 0 and bullet in self.bullets:
-                            self.bullets.remove(bullet)
-                        break
+        bullets = self.bullets
+        spent = []
+        
+        indices = bullets.indices_of("player")
+        xs = bullets.x[indices].tolist()
+        ys = bullets.y[indices].tolist()
+        damages = bullets.damage[indices].tolist()
+        
+        enemy_hash = self.enemy_hash
+        sequence = enemy_hash.sequence
+        
+        for i, bullet_x, bullet_y, damage in zip(indices.tolist(), xs, ys, damages):
+            # Only enemies in neighbouring cells can be within enemy.size;
+            # on overlap, hit whichever comes first in self.enemies
+            target = None
+            for enemy in enemy_hash.nearby(bullet_x, bullet_y):
+                dist = math.sqrt((bullet_x - enemy.x)**2 + (bullet_y - enemy.y)**2)
+                if dist < enemy.size and (target is None or sequence[id(enemy)] < sequence[id(target)]):
+                    target = enemy
+            
+            if target is None:
+                continue
+            
+            target.take_damage(damage)
+            self.ai_scheduler.wake(target)  # Getting hit aggros, even from asleep
+            bullets.health[i] -= 20
+            
+            if target.health <= 0:
+                self.player.gain_xp(target.xp_value)
+                self.remove_enemy(target)
+            
+            if bullets.health[i] <= 0:
+                spent.append(i)
+        
+        bullets.remove_indices(spent)
     
     def _check_enemy_bullets_vs_player(self):
         """Check enemy bullets hitting player"""
-        for bullet in self.bullets[:]:
-            if bullet.owner_type == "enemy":
-                dist = math.sqrt((bullet.x - self.player.x)**2 + (bullet.y - self.player.y)**2)
-                if dist < self.player.size:
-                    dmg_multi = 1 + (self.current_level_number * 0.1)
-                    self.player.hp -= bullet.damage * dmg_multi
-                    self.player.last_damage_time = pygame.time.get_ticks()
-                    if bullet in self.bullets:
-                        self.bullets.remove(bullet)
-                    
-                    if self.player.hp <= 0:
-                        return self._handle_player_death()
+        bullets = self.bullets
+        indices = bullets.indices_of("enemy")
+        if len(indices) == 0:
+            return None
+        
+        dx = bullets.x[indices] - self.player.x
+        dy = bullets.y[indices] - self.player.y
+        hits = indices[np.sqrt(dx * dx + dy * dy) < self.player.size]
+        if len(hits) == 0:
+            return None
+        
+        # Every hit bullet is consumed, even if the player dies part way through
+        damages = bullets.damage[hits].tolist()
+        bullets.remove_indices(hits)
+        
+        dmg_multi = 1 + (self.current_level_number * 0.1)
+        for damage in damages:
+            self.player.hp -= damage * dmg_multi
+            self.player.last_damage_time = self.sim_time
+            
+            if self.player.hp <= 0:
+                return self._handle_player_death()
         return None
     
     def handle_bullet_wall_collisions(self):
         """Check if bullets hit walls and remove them"""
-        for bullet in self.bullets[:]:
+        bullets = self.bullets
+        n = bullets.count
+        if n == 0:
+            return
+        
+        xs = bullets.x[:n].tolist()
+        ys = bullets.y[:n].tolist()
+        radii = bullets.radius[:n].tolist()
+        hit_wall = np.zeros(n, dtype=bool)
+        
+        for i in range(n):
             # Create bullet rect for collision
+            radius = radii[i]
             bullet_rect = pygame.Rect(
-                bullet.x - bullet.radius,
-                bullet.y - bullet.radius,
-                bullet.radius * 2,
-                bullet.radius * 2
+                xs[i] - radius,
+                ys[i] - radius,
+                radius * 2,
+                radius * 2
             )
             
-            # Check collision with walls
-            for wall in self.walls:
-                if wall.collides_with(bullet_rect):
-                    if bullet in self.bullets:
-                        self.bullets.remove(bullet)
-                    break
+            # Check collision with nearby walls only
+            if self.wall_grid.first_collision(bullet_rect):
+                hit_wall[i] = True
+        
+        bullets.remove_mask(hit_wall)
     
     def _handle_player_death(self):
         """Handle player death and game over screen"""
         print('trying to attempt')
         self.player.hp = 0
-        game_over = GameOverScreen(score=(self.player.level - 1) * 100)
-        result = game_over.run()
+        self.deaths += 1
+        
+        if self.headless:
+            result = 'retry'  # No one to click the game over screen; keep simulating
+        else:
+            game_over = GameOverScreen(score=(self.player.level - 1) * 100)
+            result = game_over.run()
+            self.stalled = True
+            if self.dirty_rects:
+                self.dirty_rects.invalidate()  # The game over screen drew over everything
         
         if result == 'retry':
             self.player.hp = self.player.max_hp
@@ -398,6 +580,8 @@ class Game:
             self.enemies.clear()
             self.bullets.clear()
             self.spawn_enemies(self.current_level_number)
+            self.update_camera()
+            self.store_previous_positions()
         elif result == 'menu':
             self.running = False
             return 'menu'
@@ -407,43 +591,73 @@ class Game:
     
     # ========== MAIN UPDATE METHOD ==========
     
+    def store_previous_positions(self):
+        """Remember where everything is before a tick moves it (bullets do this in integrate)"""
+        player = self.player
+        player.prev_x = player.x
+        player.prev_y = player.y
+        for enemy in self.enemies:
+            enemy.prev_x = enemy.x
+            enemy.prev_y = enemy.y
+        self.prev_camera_x = self.camera_x
+        self.prev_camera_y = self.camera_y
+    
     def update(self):
-        """Main game update loop - coordinates all game systems"""
-        keys = pygame.key.get_pressed()
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_buttons = pygame.mouse.get_pressed()
+        """Advance the game by one fixed tick - coordinates all game systems"""
+        dt = self.dt
+        self.sim_time = int(self.sim_ticks * 1000 / self.tick_rate)
+        self.sim_ticks += 1
+        self.store_previous_positions()
+        
+        keys = self.input.get_keys()
+        mouse_pos = self.input.get_mouse_pos()
+        mouse_buttons = self.input.get_mouse_buttons()
 
         # Store player's old position
         old_x = self.player.x
         old_y = self.player.y
             
+        profiler = self.profiler
+            
         # Update player movement
-        self.player.update(keys, mouse_pos, self.camera_x, self.camera_y)
+        self.player.update(keys, mouse_pos, self.camera_x, self.camera_y, self.sim_time, dt)
+        profiler.mark('player')
         
         # Handle player-wall collision
         self.handle_player_wall_collision(old_x, old_y)
+        profiler.mark('walls')
         
         # Handle shooting
         if mouse_buttons[0] or keys[pygame.K_SPACE]:
             self.player.shoot(self.bullets)
+        profiler.mark('player')
         
         # Update bullets
-        for bullet in self.bullets[:]:
-            bullet.update()
-            if bullet.is_off_screen(self.camera_x, self.camera_y) or bullet.health <= 0:
-                self.bullets.remove(bullet)
+        self.bullets.integrate(dt)
+        self.bullets.cull(self.camera_x, self.camera_y)
+        profiler.mark('bullets')
         self.handle_bullet_wall_collisions()
+        profiler.mark('walls')
                 
         # Save old enemy positions
         enemy_old_positions = [(enemy.x, enemy.y) for enemy in self.enemies]
 
-        # Update enemies
-        for enemy in self.enemies[:]:
-            enemy.update(self.player.x, self.player.y, self.bullets)
+        # Update enemies (far idle ones less often, or not at all; on-screen ones every tick).
+        # A cell of slack covers outlines poking into the view and the camera moving between reduced ticks
+        view = self.view_rect(self.enemy_hash.cell_size)
+        self.ai_scheduler.update(self.player.x, self.player.y, self.bullets, dt, view)
+        profiler.mark('enemy_ai')
         
         # Handle all collision detection
         self.handle_enemy_collisions(enemy_old_positions)
+        
+        # Move enemies whose cell changed this frame
+        for enemy in self.enemies:
+            self.enemy_hash.update(enemy)
+        profiler.mark('enemy_collisions')
+        
         result = self.handle_bullet_collisions()
+        profiler.mark('bullet_hits')
         if result == 'menu':
             return 'menu'
 
@@ -451,7 +665,11 @@ class Game:
         if len(self.enemies) == 0 and self.initial_enemy_count > 0 and not self.level_complete:
             self.level_complete = True
         
-        # Update camera
+        self.update_camera()
+        profiler.mark('player')
+    
+    def update_camera(self):
+        """Center the camera on the player, clamped to world bounds"""
         self.camera_x = self.player.x - SCREEN_WIDTH // 2
         self.camera_y = self.player.y - SCREEN_HEIGHT // 2
         
@@ -459,59 +677,134 @@ class Game:
         self.camera_x = max(0, min(self.camera_x, self.world_width - SCREEN_WIDTH))
         self.camera_y = max(0, min(self.camera_y, self.world_height - SCREEN_HEIGHT))
     
-    def draw(self):
-        self.screen.fill(BLACK)
-        
-        # Draw grid
-        grid_size = 50
-        for x in range(0, self.world_width, grid_size):
-            screen_x = x - self.camera_x
-            if -grid_size < screen_x < SCREEN_WIDTH + grid_size:
-                pygame.draw.line(self.screen, (20, 40, 60), 
-                               (screen_x, 0), (screen_x, SCREEN_HEIGHT))
-        
-        for y in range(0, self.world_height, grid_size):
-            screen_y = y - self.camera_y
-            if -grid_size < screen_y < SCREEN_HEIGHT + grid_size:
-                pygame.draw.line(self.screen, (20, 40, 60), 
-                               (0, screen_y), (SCREEN_WIDTH, screen_y))
-
-        # == Draw Walls == #
-        for wall in self.walls:
-            wall.draw(self.screen, (self.camera_x, self.camera_y))
+    # ========== RENDER INTERPOLATION ==========
+    
+    def begin_interpolation(self, alpha):
+        """
+        Move the player, enemies, bullets and camera alpha of the way from
+        their previous-tick to current-tick positions for drawing
+        
+        Returns:
+            The true positions, to hand back to end_interpolation
+        """
+        entities = [(self.player, self.player.x, self.player.y)]
+        entities.extend((enemy, enemy.x, enemy.y) for enemy in self.enemies)
+        for entity, x, y in entities:
+            entity.x = entity.prev_x + (x - entity.prev_x) * alpha
+            entity.y = entity.prev_y + (y - entity.prev_y) * alpha
+        
+        camera = (self.camera_x, self.camera_y)
+        self.camera_x = self.prev_camera_x + (self.camera_x - self.prev_camera_x) * alpha
+        self.camera_y = self.prev_camera_y + (self.camera_y - self.prev_camera_y) * alpha
+        
+        return entities, camera, self.bullets.begin_interpolation(alpha)
+    
+    def end_interpolation(self, true_positions):
+        """Put everything back where the simulation left it"""
+        entities, camera, bullet_positions = true_positions
+        for entity, x, y in entities:
+            entity.x = x
+            entity.y = y
+        self.camera_x, self.camera_y = camera
+        self.bullets.end_interpolation(bullet_positions)
+    
+    def draw(self, alpha=1.0):
+        """
+        Render one frame
+        
+        Args:
+            alpha: Fraction of a tick elapsed since the last update(); positions
+                   are blended from the previous tick by this much
+        """
+        profiler = self.profiler
+        true_positions = self.begin_interpolation(alpha) if alpha < 1.0 else None
+        
+        # == Draw Grid + Walls == #
+        # Static geometry comes from pre-baked chunks; only visible ones are blitted
+        dirty = self.dirty_rects
+        if dirty and not dirty.begin_frame(self.camera_x, self.camera_y):
+            # Camera held still: only repaint where last frame drew, plus the animated walls
+            dirty.add(self.world_layer.dynamic_rects(self.camera_x, self.camera_y, self.screen.get_size()))
+            self.world_layer.draw_region(self.screen, self.camera_x, self.camera_y,
+                                         dirty.previous + dirty.current)
+        else:
+            self.world_layer.draw(self.screen, self.camera_x, self.camera_y)
+        profiler.mark('draw_world')
         
         # === Z-LAYER SYSTEM ===
-        # Collect all drawable entities
-        all_entities = []
-        all_entities.extend(self.bullets)
-        all_entities.extend(self.enemies)
-        all_entities.append(self.player)
-        
+        # Bullets, enemy layers and the player registered in the render queue,
+        # lower z_index values drawn first/behind
+        self.render_queue.draw(self.screen, self.camera_x, self.camera_y, dirty)
+        profiler.mark('draw_entities')
         
-        # Sort by z_index (lower values drawn first/behind)
-        sorted_entities = sorted(all_entities, key=lambda e: e.z_index)
+        # Draw UI (always on top, no z_index needed)
+        ui_rects = self.draw_ui()
         
-        # Draw all entities in sorted order
-        for entity in sorted_entities:
-            entity.draw(self.screen, self.camera_x, self.camera_y)
+        overlay_rect = self.profiler_overlay.draw(self.screen)
+        profiler.mark('overlay')
         
-        # Draw UI (always on top, no z_index needed)
-        self.draw_ui()
+        if true_positions:
+            self.end_interpolation(true_positions)
         
-        pygame.display.flip()
+        if dirty:
+            dirty.add(ui_rects)
+            dirty.add(overlay_rect)
+            dirty.end_frame(present=not self.headless)
+        elif not self.headless:
+            pygame.display.flip()
+        profiler.mark('present')
+    
+    def view_rect(self, margin=0):
+        """World rect the camera shows, grown by margin on every side"""
+        view = pygame.Rect(math.floor(self.camera_x), math.floor(self.camera_y), *self.screen.get_size())
+        return view.inflate(margin * 2, margin * 2)
+    
+    def visible_enemies(self, among=None):
+        """
+        Enemies with anything to draw inside the view, looked up in the spatial hash
+
+        Args:
+            among: Optional container of enemies to restrict the result to (an EnemyLayer's)
+
+        Returns:
+            List of enemies in self.enemies order
+        """
+        view = self.view_rect()
+        # The hash files enemies by their last tick position; a cell of slack
+        # covers the interpolated positions drawn between ticks
+        margin = self.enemy_reach + self.enemy_hash.cell_size
+        candidates = self.enemy_hash.query_rect(view.inflate(margin * 2, margin * 2))
+        
+        visible = []
+        for enemy in candidates:
+            if among is not None and enemy not in among:
+                continue
+            reach = EnemyRenderer.reach(enemy)
+            if (view.left - reach < enemy.x < view.right + reach and
+                    view.top - reach < enemy.y < view.bottom + reach):
+                visible.append(enemy)
+        return visible
     
     def draw_ui(self):
+        """
+        Draw the HUD, stat upgrades and minimap
+
+        Returns:
+            List of the screen rects drawn to
+        """
+        rects = []
+        
         # Enemy progress bar
-        self.level_progress_ui.draw_enemy_progress_bar(
+        rects.append(self.level_progress_ui.draw_enemy_progress_bar(
             self.screen, 
             len(self.enemies), 
             self.initial_enemy_count, 
             self.level_complete
-        )
+        ))
 
         # Level Complete Button
         if self.level_complete:
-            self.level_progress_ui.draw_next_level_button(self.screen)
+            rects.append(self.level_progress_ui.draw_next_level_button(self.screen))
         
 
         # Health bar
@@ -520,25 +813,26 @@ class Game:
         bar_width = 300
         bar_height = 20
         
-        pygame.draw.rect(self.screen, UI_GRAY, (bar_x, bar_y, bar_width, bar_height))
+        rects.append(pygame.draw.rect(self.screen, UI_GRAY, (bar_x, bar_y, bar_width, bar_height)))
         health_percent = self.player.hp / self.player.max_hp
         pygame.draw.rect(self.screen, CLEAN_BLUE, 
                         (bar_x, bar_y, int(bar_width * health_percent), bar_height))
         
-        health_text = self.font.render(f"HP: {int(self.player.hp)}/{self.player.max_hp}", 
-                                       True, WHITE)
-        self.screen.blit(health_text, (bar_x + 5, bar_y + 2))
+        health_text = text_cache.render(self.font, f"HP: {int(self.player.hp)}/{self.player.max_hp}", 
+                                        WHITE)
+        rects.append(self.screen.blit(health_text, (bar_x + 5, bar_y + 2)))
         
         # XP bar
         xp_bar_y = bar_y + 30
-        pygame.draw.rect(self.screen, UI_GRAY, (bar_x, xp_bar_y, bar_width, 15))
+        rects.append(pygame.draw.rect(self.screen, UI_GRAY, (bar_x, xp_bar_y, bar_width, 15)))
         xp_percent = self.player.xp / self.player.xp_to_next_level
         pygame.draw.rect(self.screen, CORRUPTION_PURPLE, 
                         (bar_x, xp_bar_y, int(bar_width * xp_percent), 15))
         
-        xp_text = self.small_font.render(f"Level {self.player.level} - {self.player.xp}/{self.player.xp_to_next_level} XP", 
-                                         True, WHITE)
-        self.screen.blit(xp_text, (bar_x + 5, xp_bar_y + 1))
+        xp_text = text_cache.render(self.small_font, 
+                                    f"Level {self.player.level} - {self.player.xp}/{self.player.xp_to_next_level} XP", 
+                                    WHITE)
+        rects.append(self.screen.blit(xp_text, (bar_x + 5, xp_bar_y + 1)))
         
         # Stats display (top right)
         stats_x = SCREEN_WIDTH - 200
@@ -551,8 +845,8 @@ class Game:
         ]
         
         for i, text in enumerate(stats_text):
-            rendered = self.small_font.render(text, True, UI_CYAN)
-            self.screen.blit(rendered, (stats_x, stats_y + i * 20))
+            rendered = text_cache.render(self.small_font, text, UI_CYAN)
+            rects.append(self.screen.blit(rendered, (stats_x, stats_y + i * 20)))
         
         # Controls (bottom right)
         controls_x = SCREEN_WIDTH - 250
@@ -566,22 +860,99 @@ class Game:
         ]
         
         for i, text in enumerate(controls):
-            rendered = self.small_font.render(text, True, (100, 150, 200))
-            self.screen.blit(rendered, (controls_x, controls_y + i * 18))
+            rendered = text_cache.render(self.small_font, text, (100, 150, 200))
+            rects.append(self.screen.blit(rendered, (controls_x, controls_y + i * 18)))
+
+        self.profiler.mark('draw_ui')
 
         # Draw the stat upgrade
-        self.stat_ui.draw(self.screen, self.player)
+        rects.append(self.stat_ui.draw(self.screen, self.player))
+        self.profiler.mark('stat_ui')
 
         # Draw minimap (add at the end of draw_ui)
-        self.minimap.draw(self.screen, self.player, self.enemies, self.walls)
+        rects.append(self.minimap.draw(self.screen, self.player, self.enemies))
+        self.profiler.mark('minimap')
+        
+        return rects
     
     def run(self):
-        while self.running:
+        """
+        Fixed-timestep loop: real time accumulates and is spent in whole
+        update() ticks; every frame is drawn interpolated between the last
+        two ticks, so render rate and simulation rate are independent
+        """
+        tick_length = 1 / self.tick_rate
+        accumulator = 0.0
+        previous = time.perf_counter()
+        try:
+            while self.running:
+                self.profiler.start_frame()
+                now = time.perf_counter()
+                accumulator += min(now - previous, MAX_FRAME_TIME)
+                previous = now
+                
+                self.input.advance()
+                self.handle_events()
+                self.profiler.mark('events')
+                
+                while accumulator >= tick_length and self.running and not self.stalled:
+                    result = self.update()  # Capture the return value from update()
+                    if result == 'menu':
+                        return 'menu'  # Pass it back to main.py
+                    accumulator -= tick_length
+                
+                if self.stalled:
+                    # The level transition or game over screen ran inside this frame:
+                    # start timing afresh instead of fast-forwarding through its duration
+                    self.stalled = False
+                    accumulator = 0.0
+                    previous = time.perf_counter()
+                
+                self.draw(accumulator / tick_length)
+                self.end_profiled_frame()
+                self.clock.tick(self.fps)
+        finally:
+            self.export_profile()
+        
+        return None  # Return None if game exits normally
+    
+    def end_profiled_frame(self):
+        """Close the profiler's frame with current entity counts"""
+        self.profiler.end_frame(enemies=len(self.enemies), bullets=len(self.bullets), walls=len(self.walls),
+                                **self.ai_scheduler.counts())
+    
+    def export_profile(self, path=None):
+        """Write recorded frame timings to CSV (no-op if profiling never ran)"""
+        if path is None:
+            stamp = time.strftime('%Y%m%d_%H%M%S')
+            path = os.path.join('profiles', f'frame_profile_{stamp}.csv')
+        written = self.profiler.export_csv(path)
+        if written:
+            print(f"📈 Frame profile written to {written}")
+        return written
+    
+    def simulate(self, ticks, draw=False):
+        """
+        Run game ticks back to back with no frame cap (for headless runs)
+        
+        Args:
+            ticks: Number of update() calls to run
+            draw: Also render each tick to self.screen
+        
+        Returns:
+            'menu' if the game asked to return to the menu, else None
+        """
+        for _ in range(ticks):
+            if not self.running:
+                break
+            self.profiler.start_frame()
+            self.input.advance()
             self.handle_events()
-            result = self.update()  # Capture the return value from update()
+            self.profiler.mark('events')
+            result = self.update()
             if result == 'menu':
-                return 'menu'  # Pass it back to main.py
-            self.draw()
-            self.clock.tick(FPS)
-        
-        return None  # Return None if game exits normally
\ No newline at end of file
+                return 'menu'
+            if draw:
+                self.draw()
+            self.end_profiled_frame()
+        return None
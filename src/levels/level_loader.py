@@ -0,0 +1,130 @@
+"""
+Level Loader - Prepares a level off the main thread
+===================================================
+Everything expensive about entering a level (reading the map, building the
+wall grid and world layer, constructing enemies) touches no display state,
+so it can run on a worker thread while LevelTransition animates. The game
+then installs the prepared level on the main thread, which only swaps
+references.
+"""
+
+import random
+import threading
+from src.entities.enemy import Enemy
+from src.levels.map_generator import MapGenerator
+from src.systems.wall_grid import WallGrid
+from src.systems.world_layer import StaticWorldLayer
+from src.utils.enums import EnemyType
+
+# Share of the progress bar each stage finishes at
+MAP_LOADED = 0.6
+GRID_BUILT = 0.7
+LAYER_BUILT = 0.8
+
+
+class LevelLoader:
+    """
+    Loads one level on a daemon thread
+
+    Usage:
+        loader = LevelLoader(3).start()
+        ...draw frames showing loader.progress until loader.done...
+        game.install_level(3, loader.wait())
+    """
+
+    def __init__(self, level_number):
+        self.level_number = level_number
+        self.progress = 0.0  # 0..1, written by the worker thread only
+        self.result = None
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name=f"load-level-{level_number}", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    @property
+    def done(self):
+        """True once start()ed and finished (successfully or not)"""
+        return self._thread.ident is not None and not self._thread.is_alive()
+
+    def wait(self):
+        """
+        Block until the level is prepared
+
+        Returns:
+            The prepare() result (None if the map could not be loaded)
+        """
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def _run(self):
+        try:
+            self.result = LevelLoader.prepare(self.level_number, self._report)
+        except Exception as e:
+            self.error = e
+
+    def _report(self, progress):
+        self.progress = progress
+
+    @staticmethod
+    def prepare(level_number, report=None):
+        """
+        Load and build everything a level needs, without touching game state
+
+        Args:
+            level_number: Level to load
+            report: Optional callable taking the progress so far (0..1)
+
+        Returns:
+            The MapGenerator map result plus 'wall_grid', 'world_layer' and
+            'enemies', or None if the map could not be loaded
+        """
+        report = report or (lambda progress: None)
+
+        map_result = MapGenerator.generate_map_from_json(level_number)
+        if not map_result:
+            report(1.0)
+            return None
+        report(MAP_LOADED)
+
+        walls = map_result['walls']
+        world_width, world_height = map_result['map_size']
+
+        # Broad-phase index for every wall collision check
+        map_result['wall_grid'] = WallGrid(walls)
+        report(GRID_BUILT)
+
+        # Pre-rendered grid + walls, baked chunk by chunk as they come into view
+        map_result['world_layer'] = StaticWorldLayer(world_width, world_height, walls)
+        report(LAYER_BUILT)
+
+        map_result['enemies'] = LevelLoader.build_enemies(
+            map_result.get('enemy_spawns', []), level_number,
+            lambda built, total: report(LAYER_BUILT + (1.0 - LAYER_BUILT) * built / total)
+        )
+        report(1.0)
+        return map_result
+
+    @staticmethod
+    def build_enemies(spawn_points, level_number, report=None):
+        """
+        One enemy of a random type per spawn point
+
+        Args:
+            spawn_points: List of (x, y) world positions
+            level_number: Level the enemies scale with
+            report: Optional callable taking (enemies built, total)
+
+        Returns:
+            List of Enemy objects
+        """
+        enemies = []
+        for spawn_x, spawn_y in spawn_points:
+            enemy_type = random.choice(list(EnemyType)) # change this to choose what enemy type is
+            enemies.append(Enemy(spawn_x, spawn_y, enemy_type, level_number))
+            if report:
+                report(len(enemies), len(spawn_points))
+        return enemies
@@ -0,0 +1,217 @@
+"""
+Binary Map Format - Compact, memory-mappable level files
+=========================================================
+Written by tools/convert_map.py next to each JSON map (assets/maps/bin/*.map)
+so loading a level never parses the JSON grid or re-merges wall rectangles.
+
+Layout (little-endian):
+    header       128 bytes, see HEADER below
+    tiles        height x width uint8 tile codes (TILE_CODES), row-major
+    walls        wall_count x 4 int32 merged rectangles (x, y, w, h) in world units
+    barriers     barrier_count x 4 int32 merged rectangles, same layout
+    enemy spawns spawn_count x 2 int32 world positions
+    boss spawns  same layout
+    sniper spawns same layout
+    metadata     UTF-8 JSON of the informational metadata fields
+"""
+
+import hashlib
+import json
+import os
+import struct
+import numpy as np
+
+MAGIC = b'POMP'
+VERSION = 2
+
+# magic, version, tile_size, width, height,
+# (offset, count) for tiles/walls/barriers/enemy, boss and sniper spawns, player spawn x/y,
+# metadata offset/length, SHA-1 of the JSON and merge algorithm it was compiled from
+HEADER = struct.Struct('<4sHHII' + 'II' * 6 + 'ii' + 'II' + '20s')
+HEADER_SIZE = 128
+
+# Tile codes stored in the bitmap
+TILE_EMPTY = 0
+TILE_WALL = 1
+TILE_BARRIER = 2
+TILE_PLAYER_SPAWN = 3
+TILE_ENEMY_SPAWN = 4
+TILE_BOSS_SPAWN = 5
+TILE_SNIPER_SPAWN = 6
+TILE_CODES = {
+    'empty': TILE_EMPTY,
+    'wall': TILE_WALL,
+    'barrier': TILE_BARRIER,
+    'player_spawn': TILE_PLAYER_SPAWN,
+    'enemy_spawn': TILE_ENEMY_SPAWN,
+    'boss_spawn': TILE_BOSS_SPAWN,
+    'sniper_spawn': TILE_SNIPER_SPAWN,
+}
+TILE_NAMES = {code: name for name, code in TILE_CODES.items()}
+
+# Metadata kept only for display; geometry and spawns live in the binary sections
+INFO_FIELDS = ('source_file', 'wall_pixel_count', 'barrier_pixel_count', 'converted_at')
+
+
+def _align(offset, alignment=16):
+    return (offset + alignment - 1) // alignment * alignment
+
+
+class BinaryMap:
+    """Reads and writes the .map binary level format"""
+
+    @staticmethod
+    def path_for(json_path):
+        """assets/maps/json/level_1.json -> assets/maps/bin/level_1.map"""
+        json_dir, filename = os.path.split(json_path)
+        bin_dir = os.path.join(os.path.dirname(json_dir), 'bin')
+        return os.path.join(bin_dir, os.path.splitext(filename)[0] + '.map')
+
+    @staticmethod
+    def source_digest(json_path, merge_algorithm=''):
+        """SHA-1 of a JSON map file and the merge used (mtimes are unreliable after a git checkout)"""
+        with open(json_path, 'rb') as f:
+            digest = hashlib.sha1(f.read())
+        digest.update(merge_algorithm.encode())
+        return digest.digest()
+
+    @staticmethod
+    def is_current(bin_path, json_path, merge_algorithm=''):
+        """True if bin_path exists and was compiled from the current JSON source with merge_algorithm"""
+        if not os.path.exists(bin_path):
+            return False
+        if not os.path.exists(json_path):
+            return True  # Binary shipped on its own
+        with open(bin_path, 'rb') as f:
+            header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            return False
+        fields = HEADER.unpack(header)
+        return fields[0] == MAGIC and fields[1] == VERSION and fields[-1] == BinaryMap.source_digest(json_path, merge_algorithm)
+
+    @staticmethod
+    def encode_grid(grid):
+        """Convert a JSON grid (list of rows of tile names) to a uint8 tile array"""
+        names = np.array(grid)
+        tiles = np.zeros(names.shape, dtype=np.uint8)
+        for name, code in TILE_CODES.items():
+            tiles[names == name] = code
+        return tiles
+
+    @staticmethod
+    def write(path, tiles, tile_size, walls, barriers, player_spawn, enemy_spawns, metadata, source_digest=b'',
+              boss_spawns=(), sniper_spawns=()):
+        """
+        Write a binary map
+
+        Args:
+            path: Output .map path
+            tiles: 2D uint8 array of tile codes
+            tile_size: World units per tile
+            walls, barriers: Sequences of merged (x, y, w, h) rectangles in world units
+            player_spawn: (x, y) world position
+            enemy_spawns, boss_spawns, sniper_spawns: Sequences of (x, y) world positions
+            metadata: Dict; only INFO_FIELDS are kept
+            source_digest: source_digest() of the JSON (and merge) this map was compiled from
+        """
+        tiles = np.ascontiguousarray(tiles, dtype=np.uint8)
+        height, width = tiles.shape
+        sections = [
+            tiles,
+            np.asarray(walls, dtype='<i4').reshape(-1, 4),
+            np.asarray(barriers, dtype='<i4').reshape(-1, 4),
+            np.asarray(enemy_spawns, dtype='<i4').reshape(-1, 2),
+            np.asarray(boss_spawns, dtype='<i4').reshape(-1, 2),
+            np.asarray(sniper_spawns, dtype='<i4').reshape(-1, 2),
+        ]
+        info = {key: metadata[key] for key in INFO_FIELDS if key in metadata}
+        meta_bytes = json.dumps(info).encode('utf-8')
+
+        # Lay out each section on a 16-byte boundary
+        offsets = []
+        offset = HEADER_SIZE
+        for section in sections:
+            offset = _align(offset)
+            offsets.append(offset)
+            offset += section.nbytes
+        meta_offset = _align(offset)
+
+        header = HEADER.pack(
+            MAGIC, VERSION, tile_size, width, height,
+            offsets[0], tiles.size,
+            offsets[1], len(sections[1]),
+            offsets[2], len(sections[2]),
+            offsets[3], len(sections[3]),
+            offsets[4], len(sections[4]),
+            offsets[5], len(sections[5]),
+            int(player_spawn[0]), int(player_spawn[1]),
+            meta_offset, len(meta_bytes),
+            source_digest
+        )
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(header.ljust(HEADER_SIZE, b'\0'))
+            for section, section_offset in zip(sections, offsets):
+                f.write(b'\0' * (section_offset - f.tell()))
+                f.write(section.tobytes())
+            f.write(b'\0' * (meta_offset - f.tell()))
+            f.write(meta_bytes)
+
+    @staticmethod
+    def read(path):
+        """
+        Memory-map a binary map
+
+        Returns:
+            {
+                'tiles': (height, width) uint8 memmap of tile codes,
+                'walls', 'barriers': (n, 4) int32 arrays of (x, y, w, h),
+                'enemy_spawns', 'boss_spawns', 'sniper_spawns': (n, 2) int32 arrays,
+                'player_spawn': (x, y),
+                'metadata': Dict in the same shape as the JSON metadata
+            }
+
+        Raises:
+            ValueError: If the file is not a binary map of this version
+        """
+        data = np.memmap(path, dtype=np.uint8, mode='r')
+        if len(data) < HEADER_SIZE:
+            raise ValueError(f"{path} is too short to be a binary map")
+
+        (magic, version, tile_size, width, height,
+         tiles_offset, tile_count, walls_offset, wall_count,
+         barriers_offset, barrier_count, spawns_offset, spawn_count,
+         boss_offset, boss_count, sniper_offset, sniper_count,
+         player_x, player_y, meta_offset, meta_length, _digest) = HEADER.unpack_from(data, 0)
+
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a binary map")
+        if version != VERSION:
+            raise ValueError(f"{path} is format version {version}, expected {VERSION}")
+
+        def section(offset, count, columns):
+            end = offset + count * columns * 4
+            return data[offset:end].view('<i4').reshape(count, columns)
+
+        tiles = data[tiles_offset:tiles_offset + tile_count].reshape(height, width)
+        metadata = json.loads(bytes(data[meta_offset:meta_offset + meta_length]).decode('utf-8'))
+        metadata.update({
+            'width': width,
+            'height': height,
+            'tile_size': tile_size,
+            'world_width': width * tile_size,
+            'world_height': height * tile_size,
+            'player_spawn': [player_x, player_y],
+        })
+
+        return {
+            'tiles': tiles,
+            'walls': section(walls_offset, wall_count, 4),
+            'barriers': section(barriers_offset, barrier_count, 4),
+            'enemy_spawns': section(spawns_offset, spawn_count, 2),
+            'boss_spawns': section(boss_offset, boss_count, 2),
+            'sniper_spawns': section(sniper_offset, sniper_count, 2),
+            'player_spawn': (player_x, player_y),
+            'metadata': metadata,
+        }
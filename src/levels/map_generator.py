@@ -2,17 +2,41 @@
 Map Generator - Converts JSON grid data to game walls
 """
 
+import hashlib
 import json
 import os
 from src.entities.wall import Wall
+from src.levels.map_format import BinaryMap
+from src.levels.rect_partition import RectanglePartition
+
+# Wall merge algorithms:
+#   'greedy'  - row-first scan, grows each rectangle right then down
+#   'minimal' - provably fewest rectangles (see rect_partition.py)
+MERGE_ALGORITHMS = ('greedy', 'minimal')
+MERGE_ALGORITHM = 'minimal'
+
+# Bump when the merge output changes so old cache entries are ignored
+MERGE_VERSION = 1
+
+# Anchored to the project root, so running from another directory finds the same maps and cache
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MAPS_DIR = os.path.join(BASE_DIR, 'assets', 'maps')
+CACHE_DIR = os.path.join(BASE_DIR, '.cache', 'maps')
 
 class MapGenerator:
     """Generates Wall objects from JSON map data"""
     
+    # Merged rectangles by geometry key, kept for the life of the process
+    _rectangle_cache = {}
+    
     @staticmethod
     def generate_map_from_json(level_identifier):
         """
-        Load JSON and generate walls
+        Load a level and generate walls
+        
+        Uses the precompiled binary map (assets/maps/bin/*.map) when it was
+        compiled from the current JSON; otherwise parses the JSON grid and
+        merges wall rectangles at runtime.
         
         Args:
             level_identifier: Can be:
@@ -26,16 +50,25 @@ class MapGenerator:
                 'metadata': Dict with map info,
                 'spawn_point': Tuple (x, y) - center of map,
                 'map_size': Tuple (width, height),
-                'level_name': str - name of the level
+                'level_name': str - name of the level,
+                'tiles': 2D uint8 array of tile codes (see map_format.TILE_CODES)
             }
         """
         # Convert level identifier to path
         json_path = MapGenerator._resolve_path(level_identifier)
         
+        bin_path = BinaryMap.path_for(json_path)
+        if BinaryMap.is_current(bin_path, json_path, MERGE_ALGORITHM):
+            try:
+                return MapGenerator._load_binary_map(bin_path)
+            except (ValueError, OSError) as e:
+                print(f"⚠️  Could not read {bin_path} ({e}), falling back to JSON")
+        
         try:
             # Load JSON file
-            with open(json_path, 'r') as f:
-                map_data = json.load(f)
+            with open(json_path, 'rb') as f:
+                raw = f.read()
+            map_data = json.loads(raw)
             
             metadata = map_data['metadata']
             grid = map_data['grid']
@@ -49,8 +82,10 @@ class MapGenerator:
             print(f"   World: {metadata['world_width']}x{metadata['world_height']} units")
             print(f"   Wall pixels: {metadata['wall_pixel_count']}")
             
-            # Generate optimized walls from grid
-            walls, barriers = MapGenerator._grid_to_walls(grid, metadata)
+            # Generate optimized walls from grid (merge result is cached)
+            key = MapGenerator.geometry_key(raw, metadata, MERGE_ALGORITHM)
+            wall_rects, barrier_rects = MapGenerator._cached_rectangles(key, grid, metadata, MERGE_ALGORITHM)
+            walls, barriers = MapGenerator._walls_from_rectangles(wall_rects, barrier_rects)
             
             # Add border walls
             '''
@@ -68,6 +103,8 @@ class MapGenerator:
             ]))
 
             enemy_spawns = [tuple(spawn) for spawn in metadata.get('enemy_spawns', [])] # get all spawn points for enemies
+            boss_spawns = [tuple(spawn) for spawn in metadata.get('boss_spawns', [])]
+            sniper_spawns = [tuple(spawn) for spawn in metadata.get('sniper_spawns', [])]
             
             map_size = (metadata['world_width'], metadata['world_height'])
             
@@ -80,8 +117,11 @@ class MapGenerator:
                 'metadata': metadata,
                 'player_spawn': player_spawn,
                 'enemy_spawns': enemy_spawns,
+                'boss_spawns': boss_spawns,
+                'sniper_spawns': sniper_spawns,
                 'map_size': map_size,
-                'level_name': level_name
+                'level_name': level_name,
+                'tiles': BinaryMap.encode_grid(grid)
             }
             
         except FileNotFoundError:
@@ -96,6 +136,81 @@ class MapGenerator:
             traceback.print_exc()
             return None
     
+    @staticmethod
+    def _load_binary_map(bin_path):
+        """Build the map result from a binary map; only one Python step per merged rectangle"""
+        map_file = BinaryMap.read(bin_path)
+        metadata = map_file['metadata']
+        level_name = os.path.splitext(os.path.basename(bin_path))[0]
+        
+        walls = [Wall(x, y, w, h, "solid") for x, y, w, h in map_file['walls'].tolist()]
+        barriers = [Wall(x, y, w, h, "enemy_barrier") for x, y, w, h in map_file['barriers'].tolist()]
+        enemy_spawns = [tuple(spawn) for spawn in map_file['enemy_spawns'].tolist()]
+        boss_spawns = [tuple(spawn) for spawn in map_file['boss_spawns'].tolist()]
+        sniper_spawns = [tuple(spawn) for spawn in map_file['sniper_spawns'].tolist()]
+        
+        print(f"\n🗺️  Loading binary map: {level_name}")
+        print(f"   Grid: {metadata['width']}x{metadata['height']} tiles, {len(walls)} walls, "
+              f"{len(barriers)} barriers, {len(enemy_spawns)} enemy spawns")
+        
+        return {
+            'walls': walls,
+            'barriers': barriers,
+            'metadata': metadata,
+            'player_spawn': map_file['player_spawn'],
+            'enemy_spawns': enemy_spawns,
+            'boss_spawns': boss_spawns,
+            'sniper_spawns': sniper_spawns,
+            'map_size': (metadata['world_width'], metadata['world_height']),
+            'level_name': level_name,
+            'tiles': map_file['tiles']
+        }
+    
+    @staticmethod
+    def write_binary_map(json_path, bin_path=None, algorithm=MERGE_ALGORITHM):
+        """
+        Merge the wall rectangles of a JSON map once and save them as a binary map
+        
+        Args:
+            json_path: JSON map to compile
+            bin_path: Output .map path (defaults to BinaryMap.path_for(json_path))
+            algorithm: One of MERGE_ALGORITHMS; the game only loads binaries
+                       built with its own MERGE_ALGORITHM
+        
+        Returns:
+            The path written
+        """
+        if bin_path is None:
+            bin_path = BinaryMap.path_for(json_path)
+        with open(json_path, 'rb') as f:
+            raw = f.read()
+        map_data = json.loads(raw)
+        
+        metadata = map_data['metadata']
+        grid = map_data['grid']
+        key = MapGenerator.geometry_key(raw, metadata, algorithm)
+        wall_rects, barrier_rects = MapGenerator._cached_rectangles(key, grid, metadata, algorithm)
+        
+        player_spawn = metadata.get('player_spawn', [
+            metadata['world_width'] // 2,
+            metadata['world_height'] // 2
+        ])
+        
+        BinaryMap.write(
+            bin_path,
+            BinaryMap.encode_grid(grid),
+            metadata['tile_size'],
+            wall_rects,
+            barrier_rects,
+            player_spawn,
+            metadata.get('enemy_spawns', []),
+            metadata,
+            BinaryMap.source_digest(json_path, algorithm),
+            metadata.get('boss_spawns', []),
+            metadata.get('sniper_spawns', [])
+        )
+        return bin_path
+    
     @staticmethod
     def _resolve_path(level_identifier):
         """
@@ -110,7 +225,7 @@ class MapGenerator:
         # If it's an integer, convert to level_N format
         if isinstance(level_identifier, int):
             filename = f"level_{level_identifier}.json"
-            return os.path.join('assets', 'maps', 'json', filename)
+            return os.path.join(MAPS_DIR, 'json', filename)
         
         # If it's a string
         if isinstance(level_identifier, str):
@@ -120,14 +235,14 @@ class MapGenerator:
             
             # Otherwise, treat it as a level name
             filename = f"{level_identifier}.json"
-            return os.path.join('assets', 'maps', 'json', filename)
+            return os.path.join(MAPS_DIR, 'json', filename)
         
         raise ValueError(f"Invalid level_identifier type: {type(level_identifier)}")
     
     @staticmethod
     def _list_available_levels():
         """List all available JSON map files"""
-        json_dir = os.path.join('assets', 'maps', 'json')
+        json_dir = os.path.join(MAPS_DIR, 'json')
         
         if not os.path.exists(json_dir):
             print(f"   (No maps directory found at {json_dir})")
@@ -142,6 +257,57 @@ class MapGenerator:
         else:
             print(f"   (No JSON maps found in {json_dir})")
     
+    # ========== MERGED GEOMETRY CACHE ==========
+    
+    @staticmethod
+    def geometry_key(json_bytes, metadata, algorithm=MERGE_ALGORITHM):
+        """
+        Hash everything the merged rectangles depend on: the JSON map, its
+        source PNG (if present), the tile size and the merge algorithm/version
+        """
+        digest = hashlib.sha1(json_bytes)
+        png_path = os.path.join(MAPS_DIR, 'png', metadata.get('source_file', ''))
+        if os.path.isfile(png_path):
+            with open(png_path, 'rb') as f:
+                digest.update(f.read())
+        digest.update(f"|tile_size={metadata['tile_size']}|merge={algorithm}:{MERGE_VERSION}".encode())
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _cached_rectangles(key, grid, metadata, algorithm=MERGE_ALGORITHM):
+        """
+        Merged (wall_rects, barrier_rects) for a map, from memory, then disk,
+        then by running the merge and storing the result in both
+        """
+        cached = MapGenerator._rectangle_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        cache_path = os.path.join(CACHE_DIR, f"{key}.json")
+        try:
+            with open(cache_path, 'r') as f:
+                stored = json.load(f)
+            cached = ([tuple(rect) for rect in stored['walls']],
+                      [tuple(rect) for rect in stored['barriers']])
+        except (OSError, ValueError, KeyError):
+            cached = MapGenerator._merge_rectangles(grid, metadata, algorithm)
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with open(cache_path, 'w') as f:
+                    json.dump({'walls': cached[0], 'barriers': cached[1]}, f)
+            except OSError as e:
+                print(f"   ⚠️  Could not write map cache: {e}")
+        
+        MapGenerator._rectangle_cache[key] = cached
+        return cached
+    
+    @staticmethod
+    def _walls_from_rectangles(wall_rects, barrier_rects):
+        """Fresh Wall objects (walls carry per-level state, so they are never shared)"""
+        walls = [Wall(x, y, w, h, "solid") for x, y, w, h in wall_rects]
+        barriers = [Wall(x, y, w, h, "enemy_barrier") for x, y, w, h in barrier_rects]
+        return walls, barriers
+    
     @staticmethod
     def _grid_to_walls(grid, metadata):
         """
@@ -155,6 +321,29 @@ class MapGenerator:
         Returns:
             List of Wall objects
         """
+        return MapGenerator._walls_from_rectangles(*MapGenerator._merge_rectangles(grid, metadata))
+    
+    @staticmethod
+    def _merge_rectangles(grid, metadata, algorithm=MERGE_ALGORITHM):
+        """
+        Merge wall and barrier tiles into rectangles
+        
+        Args:
+            algorithm: One of MERGE_ALGORITHMS
+        
+        Returns:
+            (wall_rects, barrier_rects): Lists of (x, y, w, h) in world units
+        """
+        if algorithm == 'minimal':
+            tile_size = metadata['tile_size']
+            return tuple(
+                [(x * tile_size, y * tile_size, w * tile_size, h * tile_size)
+                 for x, y, w, h in RectanglePartition.minimal([[tile == target for tile in row] for row in grid])]
+                for target in ('wall', 'barrier')
+            )
+        if algorithm != 'greedy':
+            raise ValueError(f"Unknown merge algorithm: {algorithm} (expected one of {MERGE_ALGORITHMS})")
+        
         height = metadata['height']
         width = metadata['width']
         tile_size = metadata['tile_size']
@@ -180,7 +369,7 @@ class MapGenerator:
                     world_w = rect_w * tile_size
                     world_h = rect_h * tile_size
                     
-                    walls.append(Wall(world_x, world_y, world_w, world_h, "solid"))
+                    walls.append((world_x, world_y, world_w, world_h))
         
         visited_barriers = [[False] * width for _ in range(height)]
 
@@ -198,7 +387,7 @@ class MapGenerator:
                     world_w = rect_w * tile_size
                     world_h = rect_h * tile_size
                     
-                    barriers.append(Wall(world_x, world_y, world_w, world_h, "enemy_barrier"))
+                    barriers.append((world_x, world_y, world_w, world_h))
     
         return walls, barriers
     
@@ -237,10 +426,6 @@ class MapGenerator:
             for x in range(start_x, start_x + max_width):
                 visited[y][x] = True
         
-        # DEBUG: Log large rectangles
-        if max_width * max_height > 1:
-            print(f"       Found {max_width}x{max_height} rectangle at ({start_x},{start_y})")
-
         return max_width, max_height
     
     @staticmethod
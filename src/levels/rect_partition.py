@@ -0,0 +1,197 @@
+"""
+Rectangle Partition - Minimum rectangle decomposition of tile maps
+==================================================================
+Splits the filled cells of a grid into the fewest possible axis-aligned
+rectangles (exact for rectilinear regions with holes):
+
+1. Find every concave corner (a lattice point with 3 of its 4 cells filled).
+2. Find the "good chords": straight interior cuts joining two concave corners.
+3. Pick the largest set of chords that don't touch each other: a maximum
+   independent set in the bipartite horizontal-vs-vertical crossing graph,
+   found from a maximum matching (Konig's theorem).
+4. Cut along those chords, then cut every remaining concave corner vertically
+   until the cut meets the boundary or an earlier cut.
+5. The pieces left are rectangles.
+"""
+
+
+class RectanglePartition:
+    """Minimum rectangle partition of a boolean tile grid"""
+
+    @staticmethod
+    def minimal(filled):
+        """
+        Partition the filled cells into a minimum number of rectangles
+
+        Args:
+            filled: 2D list (rows) of booleans
+
+        Returns:
+            List of (x, y, w, h) in tiles, ordered by top-left corner (row-major)
+        """
+        height = len(filled)
+        width = len(filled[0]) if height else 0
+
+        def cell(x, y):
+            return 0 <= x < width and 0 <= y < height and filled[y][x]
+
+        # Concave corner -> (dx, dy) directions its horizontal/vertical cut extends in
+        concave = {}
+        for y in range(1, height):
+            for x in range(1, width):
+                nw, ne = cell(x - 1, y - 1), cell(x, y - 1)
+                sw, se = cell(x - 1, y), cell(x, y)
+                if nw + ne + sw + se != 3:
+                    continue
+                # Cuts extend away from the missing quadrant
+                if not nw:
+                    concave[(x, y)] = (1, 1)
+                elif not ne:
+                    concave[(x, y)] = (-1, 1)
+                elif not sw:
+                    concave[(x, y)] = (1, -1)
+                else:
+                    concave[(x, y)] = (-1, -1)
+
+        def horizontal_interior(x, y, dx):
+            column = x if dx > 0 else x - 1
+            return cell(column, y - 1) and cell(column, y)
+
+        def vertical_interior(x, y, dy):
+            row = y if dy > 0 else y - 1
+            return cell(x - 1, row) and cell(x, row)
+
+        # Good chords, traced from the corner whose cut runs right/down
+        horizontal = []  # (y, x1, x2)
+        vertical = []    # (x, y1, y2)
+        for (x, y), (dx, dy) in concave.items():
+            if dx > 0:
+                end = x
+                while horizontal_interior(end, y, 1):
+                    end += 1
+                if (end, y) in concave:
+                    horizontal.append((y, x, end))
+            if dy > 0:
+                end = y
+                while vertical_interior(x, end, 1):
+                    end += 1
+                if (x, end) in concave:
+                    vertical.append((x, y, end))
+
+        chosen_h, chosen_v = RectanglePartition._independent_chords(horizontal, vertical)
+
+        # Apply cuts. h_cuts holds (column, y) unit edges on horizontal lines,
+        # v_cuts holds (x, row) unit edges on vertical lines
+        h_cuts = set()
+        v_cuts = set()
+        resolved = set()
+        for y, x1, x2 in chosen_h:
+            h_cuts.update((column, y) for column in range(x1, x2))
+            resolved.update(((x1, y), (x2, y)))
+        for x, y1, y2 in chosen_v:
+            v_cuts.update((x, row) for row in range(y1, y2))
+            resolved.update(((x, y1), (x, y2)))
+
+        for (x, y), (dx, dy) in sorted(concave.items()):
+            if (x, y) in resolved:
+                continue
+            point = y
+            while vertical_interior(x, point, dy):
+                v_cuts.add((x, point if dy > 0 else point - 1))
+                point += dy
+                if (x - 1, point) in h_cuts or (x, point) in h_cuts:
+                    break
+
+        return RectanglePartition._collect_rectangles(filled, width, height, h_cuts, v_cuts)
+
+    @staticmethod
+    def _independent_chords(horizontal, vertical):
+        """
+        Largest set of pairwise non-touching chords
+
+        Returns:
+            (chosen horizontal chords, chosen vertical chords)
+        """
+        # Horizontal and vertical chords conflict when they cross or share an end
+        adjacent = [
+            [j for j, (x, y1, y2) in enumerate(vertical) if x1 <= x <= x2 and y1 <= y <= y2]
+            for y, x1, x2 in horizontal
+        ]
+
+        # Maximum bipartite matching (augmenting paths)
+        match_of_v = [-1] * len(vertical)
+        match_of_h = [-1] * len(horizontal)
+
+        def augment(h, seen):
+            for v in adjacent[h]:
+                if v in seen:
+                    continue
+                seen.add(v)
+                if match_of_v[v] == -1 or augment(match_of_v[v], seen):
+                    match_of_v[v] = h
+                    match_of_h[h] = v
+                    return True
+            return False
+
+        for h in range(len(horizontal)):
+            augment(h, set())
+
+        # Konig: vertices reachable by alternating paths from unmatched
+        # horizontal chords; the independent set is (H in Z) + (V not in Z)
+        reach_h = {h for h in range(len(horizontal)) if match_of_h[h] == -1}
+        reach_v = set()
+        frontier = list(reach_h)
+        while frontier:
+            h = frontier.pop()
+            for v in adjacent[h]:
+                if v in reach_v:
+                    continue
+                reach_v.add(v)
+                partner = match_of_v[v]
+                if partner != -1 and partner not in reach_h:
+                    reach_h.add(partner)
+                    frontier.append(partner)
+
+        chosen_h = [chord for h, chord in enumerate(horizontal) if h in reach_h]
+        chosen_v = [chord for v, chord in enumerate(vertical) if v not in reach_v]
+        return chosen_h, chosen_v
+
+    @staticmethod
+    def _collect_rectangles(filled, width, height, h_cuts, v_cuts):
+        """Flood-fill the pieces left between cuts and return their bounds"""
+        label = [[-1] * width for _ in range(height)]
+        rectangles = []
+
+        for start_y in range(height):
+            for start_x in range(width):
+                if not filled[start_y][start_x] or label[start_y][start_x] != -1:
+                    continue
+
+                piece = len(rectangles)
+                label[start_y][start_x] = piece
+                stack = [(start_x, start_y)]
+                cells = 0
+                min_x, min_y, max_x, max_y = start_x, start_y, start_x, start_y
+                while stack:
+                    x, y = stack.pop()
+                    cells += 1
+                    min_x, max_x = min(min_x, x), max(max_x, x)
+                    min_y, max_y = min(min_y, y), max(max_y, y)
+                    for nx, ny, blocked in (
+                        (x + 1, y, (x + 1, y) in v_cuts),
+                        (x - 1, y, (x, y) in v_cuts),
+                        (x, y + 1, (x, y + 1) in h_cuts),
+                        (x, y - 1, (x, y) in h_cuts),
+                    ):
+                        if (not blocked and 0 <= nx < width and 0 <= ny < height
+                                and filled[ny][nx] and label[ny][nx] == -1):
+                            label[ny][nx] = piece
+                            stack.append((nx, ny))
+
+                rect_w = max_x - min_x + 1
+                rect_h = max_y - min_y + 1
+                if cells != rect_w * rect_h:
+                    raise ValueError(f"Partition produced a non-rectangular piece at ({min_x},{min_y})")
+                rectangles.append((min_x, min_y, rect_w, rect_h))
+
+        return sorted(rectangles, key=lambda rect: (rect[1], rect[0]))
@@ -0,0 +1,179 @@
+import pygame
+
+
+class AIScheduler:
+    """
+    Distance-based level of detail for enemy AI.
+
+    Every enemy sits in one of three tiers:
+        full     - aggroed enemies, bosses, enemies in view, and idle enemies
+                   within NEAR_MARGIN of their aggro range; Enemy.update()
+                   runs every tick
+        reduced  - idle enemies farther out; they only spin and check the
+                   distance every mid_interval ticks, staggered so a tick
+                   handles 1/mid_interval of them
+        asleep   - idle enemies past sleep_radius; nothing runs until a
+                   spatial query around the player (every wake_interval
+                   ticks) or damage wakes them
+
+    An idle enemy only moves when pushed, and the player covers far less than
+    NEAR_MARGIN between two reduced ticks, so enemies reach the full tier
+    before the player can enter their aggro range: aggro triggers on the same
+    tick as with every enemy updated every tick. Enemies inside the view
+    stay in the full tier, so their idle spin on screen stays smooth. Off
+    screen, reduced enemies turn in mid_interval-tick steps and sleepers not
+    at all; an enemy returning to the full tier first turns through every
+    tick it skipped, so it faces the same way as without LOD (up to float
+    rounding).
+
+    Full-tier enemies update in the spatial hash's insertion order (the order
+    of Game.enemies), so bullet spawn order is unchanged too. With enabled
+    off, every enemy stays in the full tier. Given an EnemyBatch, the full
+    tier is updated through it in one go.
+    """
+
+    NEAR_MARGIN = 200  # Past an enemy's aggro range it still updates every tick
+    DEMOTE_MARGIN = 300  # Hysteresis: a full-tier enemy drops to reduced past its aggro range plus this
+
+    def __init__(self, enemy_hash, enabled=True, batch=None, mid_interval=4, wake_radius=1500, wake_interval=15):
+        """
+        Args:
+            enemy_hash: The game's SpatialHash of enemies (ordering and wake queries)
+            enabled: Demote idle enemies at all (off: update every enemy every tick)
+            batch: Optional EnemyBatch to run full-tier updates with
+            mid_interval: Ticks between updates of a reduced-tier enemy
+            wake_radius: Half-size of the square around the player that wakes sleepers
+            wake_interval: Ticks between wake queries
+        """
+        self.enemy_hash = enemy_hash
+        self.enabled = enabled
+        self.batch = batch
+        self.mid_interval = mid_interval
+        self.wake_radius = wake_radius
+        # Beyond the wake square's corners, so a woken enemy doesn't fall straight back asleep
+        self.sleep_radius = wake_radius * 1.5
+        self.wake_interval = wake_interval
+
+        self.full = {}  # Insertion-ordered sets: enemy -> None
+        self.reduced = [{} for _ in range(mid_interval)]  # One bucket per tick phase
+        self.asleep = {}
+        self.tier = {}  # id(enemy) -> 'full', 'reduced' or 'asleep'
+        self.idled = {}  # id(enemy) -> last tick a reduced or asleep enemy has turned through
+        self.ticks = 0
+        self.dt = 1
+
+    def reset(self, enemies):
+        """Start every enemy in the full tier; the first ticks sort them out"""
+        self.full = dict.fromkeys(enemies)
+        self.reduced = [{} for _ in range(self.mid_interval)]
+        self.asleep = {}
+        self.tier = {id(enemy): 'full' for enemy in enemies}
+        self.idled = {}
+        if self.batch:
+            self.batch.reset()
+
+    def remove(self, enemy):
+        """Forget a dead enemy (before it leaves the spatial hash)"""
+        tier = self.tier.pop(id(enemy), None)
+        self.idled.pop(id(enemy), None)
+        if tier == 'full':
+            del self.full[enemy]
+        elif tier == 'reduced':
+            del self.reduced[self.enemy_hash.sequence[id(enemy)] % self.mid_interval][enemy]
+        elif tier == 'asleep':
+            del self.asleep[enemy]
+
+    def wake(self, enemy):
+        """Move an enemy to the full tier (after taking damage, say)"""
+        if self.tier.get(id(enemy), 'full') != 'full':
+            self._catch_up(enemy, self.ticks)
+            self.remove(enemy)
+            self._set_tier(enemy, 'full')
+
+    def counts(self):
+        """Enemies per tier, for the profiler"""
+        return {
+            'ai_full': len(self.full),
+            'ai_reduced': sum(len(bucket) for bucket in self.reduced),
+            'ai_asleep': len(self.asleep),
+        }
+
+    def update(self, player_x, player_y, bullets, dt=1, view=None):
+        """
+        Run one tick of enemy AI
+
+        Args:
+            view: Optional world Rect of what is (nearly) on screen; enemies inside it update every tick
+        """
+        self.ticks += 1
+        self.dt = dt
+
+        if self.asleep and self.ticks % self.wake_interval == 0:
+            self._wake_near(player_x, player_y)
+
+        # Reduced tier: this tick's phase only, turning through the ticks since its last turn
+        bucket = self.reduced[self.ticks % self.mid_interval]
+        for enemy in list(bucket):
+            dx = player_x - enemy.x
+            dy = player_y - enemy.y
+            distance_sq = dx * dx + dy * dy
+            near = enemy.aggro_range + self.NEAR_MARGIN
+            in_view = view is not None and view.collidepoint(enemy.x, enemy.y)
+            if enemy.is_aggroed or distance_sq <= near * near or in_view:
+                del bucket[enemy]
+                self._catch_up(enemy, self.ticks - 1)  # This tick is the full update's
+                self._set_tier(enemy, 'full')
+            elif distance_sq > self.sleep_radius * self.sleep_radius:
+                del bucket[enemy]
+                self._set_tier(enemy, 'asleep')
+            else:
+                self._catch_up(enemy, self.ticks)
+
+        # Full tier: every tick, in game order
+        sequence = self.enemy_hash.sequence
+        full = sorted(self.full, key=lambda enemy: sequence[id(enemy)])
+        if self.batch:
+            self.batch.update(full, player_x, player_y, bullets, dt)
+        else:
+            for enemy in full:
+                enemy.update(player_x, player_y, bullets, dt)
+
+        for enemy in full:
+            if enemy.is_aggroed or enemy.is_boss or not self.enabled:
+                continue
+            if view is not None and view.collidepoint(enemy.x, enemy.y):
+                continue
+            dx = player_x - enemy.x
+            dy = player_y - enemy.y
+            far = enemy.aggro_range + self.DEMOTE_MARGIN
+            if dx * dx + dy * dy > far * far:
+                del self.full[enemy]
+                self.idled[id(enemy)] = self.ticks
+                self._set_tier(enemy, 'reduced')
+
+    def _set_tier(self, enemy, tier):
+        self.tier[id(enemy)] = tier
+        if tier == 'full':
+            self.idled.pop(id(enemy), None)
+            self.full[enemy] = None
+        elif tier == 'reduced':
+            self.reduced[self.enemy_hash.sequence[id(enemy)] % self.mid_interval][enemy] = None
+        else:
+            self.asleep[enemy] = None
+
+    def _catch_up(self, enemy, tick):
+        """Turn a reduced or asleep enemy through the ticks it skipped, up to and including tick"""
+        missed = tick - self.idled[id(enemy)]
+        if missed > 0:
+            enemy.idle(self.dt * missed)
+            self.idled[id(enemy)] = tick
+
+    def _wake_near(self, player_x, player_y):
+        """Move sleepers in the wake square to the reduced tier"""
+        radius = self.wake_radius
+        square = pygame.Rect(int(player_x - radius), int(player_y - radius), int(radius * 2), int(radius * 2))
+        for enemy in self.enemy_hash.query_rect(square):
+            if self.tier.get(id(enemy)) == 'asleep':
+                del self.asleep[enemy]
+                self._set_tier(enemy, 'reduced')
+
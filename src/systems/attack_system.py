@@ -1,14 +1,13 @@
 import math
 import random
 from src.configs.tank_configs import TANK_CONFIGS
-from src.entities.bullet import Bullet
 
 class ShootingSystem:
     """Handles shooting for all tank types from configuration"""
     
     @staticmethod
     def shoot(tank, bullets):
-        """Create bullets for any tank type based on configuration"""
+        """Spawn one bullet per cannon into the BulletPool in a single batch"""
         if tank.shoot_cooldown > 0:
             return
         
@@ -25,6 +24,9 @@ class ShootingSystem:
             bullet_speed *= config["bullet_speed_bonus"]
         
         offset = 30
+        bullet_xs = []
+        bullet_ys = []
+        bullet_angles = []
         
         # Create bullet for each cannon
         for cannon in config["cannons"]:
@@ -47,11 +49,16 @@ class ShootingSystem:
                 spread = config["spread"]
                 final_angle += random.uniform(-spread, spread)
             
-            # Create bullet
-            bullets.append(Bullet(
-                bullet_x, bullet_y, final_angle,
-                bullet_speed, bullet_damage, bullet_pen, "player"
-            ))
+            bullet_xs.append(bullet_x)
+            bullet_ys.append(bullet_y)
+            bullet_angles.append(final_angle)
         
-        # Set cooldown
-        tank.shoot_cooldown = tank.get_reload_speed() / config["reload_speed"]
\ No newline at end of file
+        # Create bullets
+        bullets.spawn_batch(
+            bullet_xs, bullet_ys, bullet_angles,
+            bullet_speed, bullet_damage, bullet_pen, "player"
+        )
+        
+        # Set cooldown: a reload lasts whole 60 Hz frames, and whatever the last tick
+        # overshot zero by counts towards it, so longer ticks keep the same fire rate
+        tank.shoot_cooldown += math.ceil(tank.get_reload_speed() / config["reload_speed"])
\ No newline at end of file
@@ -65,4 +65,47 @@ class CollisionSystem:
                 else:
                     return entity_rect.x, entity_rect.y + overlap_bottom
         
-        return None
\ No newline at end of file
+        return None
+    
+    @staticmethod
+    def find_overlapping_circles(entities):
+        """
+        Sort-and-sweep broad phase for circular entities (x, y, size)
+        
+        Entities are sorted by the left edge of their bounding box and each
+        one is only compared against the ones whose x-interval it overlaps.
+        
+        Args:
+            entities: list of objects with x, y and size (radius)
+        
+        Returns:
+            List of (i, j) index pairs, i < j, in ascending order, for every
+            pair whose circles overlap (centres exactly on top of each other
+            are skipped, matching the push response which needs a direction)
+        """
+        boxes = sorted(
+            (entity.x - entity.size, entity.x + entity.size, entity.y, entity.size, entity.x, index)
+            for index, entity in enumerate(entities)
+        )
+        
+        pairs = []
+        count = len(boxes)
+        for a in range(count):
+            _, max_x, y1, size1, x1, index1 = boxes[a]
+            for b in range(a + 1, count):
+                min_x2, _, y2, size2, x2, index2 = boxes[b]
+                if min_x2 >= max_x:
+                    break  # Sorted by left edge: nothing further can overlap
+                
+                min_dist = size1 + size2
+                dy = y2 - y1
+                if dy >= min_dist or -dy >= min_dist:
+                    continue
+                
+                dx = x2 - x1
+                dist_squared = dx * dx + dy * dy
+                if 0 < dist_squared < min_dist * min_dist:
+                    pairs.append((index1, index2) if index1 < index2 else (index2, index1))
+        
+        pairs.sort()
+        return pairs
@@ -0,0 +1,78 @@
+import math
+import pygame
+
+
+class DirtyRectRenderer:
+    """
+    Tracks the screen regions drawn each frame so only those are repainted and presented.
+
+    While the camera holds still, everything on screen outside last frame's
+    rects is untouched background. Repainting the background under those
+    rects wipes last frame's entities and widgets, and presenting last
+    frame's rects plus this frame's with pygame.display.update() updates
+    the window. When the camera scrolls, every pixel moves, so that frame
+    is a full redraw and a flip. So is a frame whose rects add up to more
+    than max_coverage of the screen, where repainting them piecewise would
+    cost more than one full draw (large debug aggro rings, for instance).
+
+    Usage each frame:
+        if dirty.begin_frame(camera_x, camera_y):
+            ...draw the whole background...
+        else:
+            ...repaint the background under dirty.previous...
+        dirty.add(...rects returned by each draw...)
+        dirty.end_frame()
+    """
+
+    def __init__(self, screen_size, max_coverage=1.0):
+        """
+        Args:
+            screen_size: (width, height) of the screen drawn to
+            max_coverage: Fraction of the screen area last frame's rects may add up to
+                          before the frame is redrawn in full instead
+        """
+        self.max_area = screen_size[0] * screen_size[1] * max_coverage
+        self.previous = []  # Rects drawn last frame
+        self.current = []   # Rects drawn this frame
+        self.full = True
+        self.last_camera = None
+        self.force_full = True
+
+    def begin_frame(self, camera_x, camera_y):
+        """
+        Start a frame
+
+        Returns:
+            True if this frame must be a full redraw (camera scrolled, invalidate() was
+            called or too much of the screen is dirty)
+        """
+        camera = (math.floor(camera_x), math.floor(camera_y))
+        self.full = (self.force_full or camera != self.last_camera or
+                     sum(rect.width * rect.height for rect in self.previous) > self.max_area)
+        self.last_camera = camera
+        self.force_full = False
+        self.current = []
+        return self.full
+
+    def add(self, rects):
+        """Record a rect, or an iterable of rects, drawn this frame (None is ignored)"""
+        if rects is None:
+            return
+        if isinstance(rects, pygame.Rect):
+            self.current.append(rects)
+        else:
+            self.current.extend(rect for rect in rects if rect is not None)
+
+    def end_frame(self, present=True):
+        """Show the frame: flip after a full redraw, otherwise update only last and this frame's rects"""
+        if present:
+            if self.full:
+                pygame.display.flip()
+            else:
+                pygame.display.update(self.previous + self.current)
+        self.previous = self.current
+        self.current = []
+
+    def invalidate(self):
+        """Make the next frame a full redraw (after something else drew over the screen)"""
+        self.force_full = True
@@ -0,0 +1,161 @@
+import math
+import numpy as np
+from operator import attrgetter
+from src.utils.enums import EnemyType
+
+# Enemy type codes used in the stats arrays
+TYPE_CODES = {enemy_type: i for i, enemy_type in enumerate(EnemyType)}
+SQUARE_TURRET = TYPE_CODES[EnemyType.SQUARE_TURRET]
+TRIANGLE_BLADE = TYPE_CODES[EnemyType.TRIANGLE_BLADE]
+PENTAGON_GUNNER = TYPE_CODES[EnemyType.PENTAGON_GUNNER]
+
+SHOOT_RANGE = 800
+
+
+class EnemyBatch:
+    """
+    Enemy.update() for a whole group of enemies in a few NumPy operations.
+
+    Enemy objects stay the source of truth (collisions, the spatial hash and
+    drawing all use them), so each update gathers their state into arrays,
+    runs aggro, facing, movement and cooldowns for every enemy at once,
+    writes back what changed and fires only the enemies that are ready.
+
+    Results match Enemy.update() bit for bit: the arithmetic is done in the
+    same order on float64, and facing angles use math.atan2, because NumPy's
+    vectorised arctan2 can differ from it in the last bit. Bullets are
+    spawned in list order, as the per-enemy loop would.
+
+    Static stats (type, speed, ranges, shoot delay) never change after an
+    enemy is built, so each enemy gets a row in the stat arrays the first
+    time it is updated and keeps it until reset().
+
+    The gathers and write-backs still cost some Python per enemy, so the
+    batch only pays off for large groups (roughly a few hundred enemies).
+    """
+
+    def __init__(self):
+        self.reset()
+
+    STATS = ('type_code', 'speed', 'aggro_range', 'deaggro_range', 'shoot_delay')
+
+    def reset(self, capacity=256):
+        """Forget every enemy's stats (new enemies, new level)"""
+        self.rows = {}  # enemy -> row in the stat arrays
+        self.count = 0
+        for stat in self.STATS:
+            setattr(self, stat, np.zeros(capacity, dtype=np.int8 if stat == 'type_code' else np.float64))
+
+    def _rows_of(self, enemies):
+        """Stat array rows of enemies, giving new enemies a row"""
+        try:
+            return np.fromiter(map(self.rows.__getitem__, enemies), np.intp, len(enemies))
+        except KeyError:
+            pass
+
+        new = [enemy for enemy in enemies if enemy not in self.rows]
+        end = self.count + len(new)
+        if end > len(self.speed):
+            capacity = max(end, len(self.speed) * 2)
+            for stat in self.STATS:
+                old = getattr(self, stat)
+                grown = np.zeros(capacity, dtype=old.dtype)
+                grown[:self.count] = old[:self.count]
+                setattr(self, stat, grown)
+
+        for row, enemy in enumerate(new, self.count):
+            self.rows[enemy] = row
+            self.type_code[row] = TYPE_CODES[enemy.type]
+            self.speed[row] = enemy.speed
+            self.aggro_range[row] = enemy.aggro_range
+            self.deaggro_range[row] = enemy.deaggro_range
+            self.shoot_delay[row] = enemy.shoot_delay
+        self.count = end
+        return np.fromiter(map(self.rows.__getitem__, enemies), np.intp, len(enemies))
+
+    def update(self, enemies, player_x, player_y, bullets, dt=1):
+        """
+        Same as calling enemy.update(player_x, player_y, bullets, dt) for each enemy in order
+
+        Args:
+            enemies: Sequence of Enemy objects
+        """
+        if not enemies:
+            return
+
+        rows = self._rows_of(enemies)
+        n = len(enemies)
+        x = np.fromiter((enemy.x for enemy in enemies), np.float64, n)
+        y = np.fromiter((enemy.y for enemy in enemies), np.float64, n)
+        was_aggroed = np.fromiter((enemy.is_aggroed for enemy in enemies), np.bool_, n)
+
+        # Distance to player
+        dx = player_x - x
+        dy = player_y - y
+        distance = np.sqrt(dx * dx + dy * dy)
+
+        # Aggro hysteresis
+        aggroed = np.where(was_aggroed, distance <= self.deaggro_range[rows], distance <= self.aggro_range[rows])
+
+        for enemy in filter(attrgetter('is_boss'), enemies):
+            enemy._update_boss_shield(dt)
+
+        acting = aggroed & (distance > 0)
+        act = np.flatnonzero(acting)
+        idle = np.flatnonzero(~acting)
+
+        # Idle enemies turn in place
+        if len(idle):
+            turned = np.array([enemies[i].angle for i in idle.tolist()], dtype=np.float64) + 0.02 * dt
+            for i, angle in zip(idle.tolist(), turned.tolist()):
+                enemies[i].angle = angle
+
+        # Aggro flags that flipped this tick
+        for i in np.flatnonzero(aggroed != was_aggroed).tolist():
+            enemies[i].is_aggroed = bool(aggroed[i])
+
+        if len(act) == 0:
+            return
+
+        # Facing (math.atan2 for bit-identical angles)
+        angles = list(map(math.atan2, dy[act].tolist(), dx[act].tolist()))
+
+        # Movement: unit vector towards the player, scaled per type rule
+        act_rows = rows[act]
+        act_dx, act_dy, act_distance = dx[act], dy[act], distance[act]
+        step = self.speed[act_rows] * dt
+        move_x = (act_dx / act_distance) * step
+        move_y = (act_dy / act_distance) * step
+        act_type = self.type_code[act_rows]
+        triangle = act_type == TRIANGLE_BLADE
+        square = (act_type == SQUARE_TURRET) & (act_distance > 400)
+        retreat = (act_type == PENTAGON_GUNNER) & (act_distance < 300)
+        advance = (act_type == PENTAGON_GUNNER) & (act_distance > 400)
+        new_x = x[act]
+        new_y = y[act]
+        new_x = np.where(triangle | advance, new_x + move_x, new_x)
+        new_y = np.where(triangle | advance, new_y + move_y, new_y)
+        new_x = np.where(square, new_x + move_x * 0.3, new_x)
+        new_y = np.where(square, new_y + move_y * 0.3, new_y)
+        new_x = np.where(retreat, new_x - move_x, new_x)
+        new_y = np.where(retreat, new_y - move_y, new_y)
+        moved = triangle | square | retreat | advance
+
+        # Cooldowns and the shoot-ready subset
+        cooldown = np.array([enemies[i].shoot_cooldown for i in act.tolist()], dtype=np.float64) - dt
+        delay = self.shoot_delay[act_rows]
+        ready = (cooldown <= 0) & (delay > 0) & (act_distance < SHOOT_RANGE)
+        overshoot = np.where(cooldown > -dt, cooldown, 0.0)
+        cooldown = np.where(ready, np.ceil(delay) + overshoot, cooldown)
+
+        for i, angle, enemy_x, enemy_y, has_moved, shoot_cooldown, fire in zip(
+                act.tolist(), angles, new_x.tolist(), new_y.tolist(), moved.tolist(),
+                cooldown.tolist(), ready.tolist()):
+            enemy = enemies[i]
+            enemy.angle = angle
+            if has_moved:
+                enemy.x = enemy_x
+                enemy.y = enemy_y
+            if fire:
+                enemy.shoot(bullets)
+            enemy.shoot_cooldown = shoot_cooldown
@@ -0,0 +1,219 @@
+import pygame
+import math
+from collections import OrderedDict
+from src.utils.constants import *
+from src.utils.enums import EnemyType
+from src.ui.text_cache import text_cache
+
+# Rotations per full turn; the drawn angle snaps to the nearest step
+ANGLE_STEPS = 256
+
+# Transparent colour of enemy sprites (no enemy is drawn in pure black)
+SPRITE_COLORKEY = (0, 0, 0)
+
+class EnemyRenderer:
+    """
+    Draws enemies from pre-rendered sprites
+
+    A sprite holds the enemy's outline (and boss shield) for one type, aggro
+    state, shield state and angle step. Sprites are drawn lazily and kept in
+    an LRU cache capped at MAX_BYTES, so a frame's enemies go to the screen
+    in a single Surface.blits call. Sprites are opaque with a colorkey and
+    RLE acceleration: outlines are mostly empty space, which RLE skips,
+    whereas per-pixel alpha would blend every pixel of the sprite. Health
+    bars and the debug aggro range change every frame and are still drawn
+    directly.
+    """
+
+    MAX_BYTES = 32 * 1024 * 1024
+
+    # (type, is_boss, size, is_aggroed, shield_active, angle step) -> (sprite, half size)
+    _sprites = OrderedDict()
+    _bytes = 0
+
+    @staticmethod
+    def draw_enemies(screen, enemies, camera_x, camera_y):
+        """
+        Draw a group of enemies: outlines in one batched blit, then aggro ranges and health bars
+
+        Returns:
+            List of the screen rects drawn to
+        """
+        positions = [(int(enemy.x - camera_x), int(enemy.y - camera_y)) for enemy in enemies]
+
+        blits = []
+        for enemy, (screen_x, screen_y) in zip(enemies, positions):
+            sprite, half = EnemyRenderer.get_sprite(enemy)
+            blits.append((sprite, (screen_x - half, screen_y - half)))
+        rects = screen.blits(blits)
+
+        for enemy, (screen_x, screen_y) in zip(enemies, positions):
+            # Optional: Draw aggro range indicator (for debugging)
+            if DEBUG_AGGRO_RANGE and not enemy.is_aggroed:
+                rects.append(pygame.draw.circle(screen, (100, 100, 100), (screen_x, screen_y), enemy.aggro_range, 1))
+
+            # Health bar
+            bar_width = 40 if not enemy.is_boss else 80
+            bar_height = 4 if not enemy.is_boss else 8
+            health_percent = enemy.health / enemy.max_health
+            rects.append(pygame.draw.rect(screen, UI_GRAY,
+                            (screen_x - bar_width//2, screen_y - enemy.size - 15, bar_width, bar_height)))
+
+            # Health bar color changes for boss
+            health_color = (255, 0, 0) if enemy.is_boss else CORRUPTION_PINK
+            pygame.draw.rect(screen, health_color,
+                            (screen_x - bar_width//2, screen_y - enemy.size - 15,
+                             int(bar_width * health_percent), bar_height))
+
+            # Boss name tag
+            if enemy.is_boss:
+                name_text = text_cache.render(text_cache.font(None, 24), "BOSS", (255, 50, 50))
+                text_rect = name_text.get_rect(center=(screen_x, screen_y - enemy.size - 30))
+                rects.append(screen.blit(name_text, text_rect))
+
+        return rects
+
+    @staticmethod
+    def reach(enemy):
+        """Farthest anything drawn for an enemy (outline, health bar, boss tag, aggro range) gets from its centre"""
+        reach = enemy.size + (40 if enemy.is_boss else 15)
+        if DEBUG_AGGRO_RANGE:
+            reach = max(reach, enemy.aggro_range + 1)
+        return reach
+
+    @staticmethod
+    def get_sprite(enemy):
+        """
+        Cached sprite for an enemy's current look
+
+        Returns:
+            (sprite, half size): blit at the enemy's centre minus half
+        """
+        if enemy.type == EnemyType.SQUARE_TURRET:
+            step = 0  # Drawn axis-aligned whatever the angle
+        elif enemy.type == EnemyType.TRIANGLE_BLADE:
+            step = round(enemy.angle / (2 * math.pi) * ANGLE_STEPS) % ANGLE_STEPS
+        else:
+            # A pentagon repeats every fifth of a turn
+            step = round((enemy.angle % (2 * math.pi / 5)) / (2 * math.pi) * ANGLE_STEPS)
+
+        key = (enemy.type, enemy.is_boss, enemy.size, enemy.is_aggroed, enemy.shield_active, step)
+        sprites = EnemyRenderer._sprites
+        sprite = sprites.get(key)
+        if sprite is not None:
+            sprites.move_to_end(key)
+            return sprite
+
+        sprite = EnemyRenderer._render_sprite(*key[:5], step * 2 * math.pi / ANGLE_STEPS)
+        sprites[key] = sprite
+        EnemyRenderer._bytes += EnemyRenderer._size(sprite[0])
+        while EnemyRenderer._bytes > EnemyRenderer.MAX_BYTES and len(sprites) > 1:
+            _, (evicted, _) = sprites.popitem(last=False)
+            EnemyRenderer._bytes -= EnemyRenderer._size(evicted)
+        return sprite
+
+    @staticmethod
+    def clear_cache():
+        EnemyRenderer._sprites.clear()
+        EnemyRenderer._bytes = 0
+
+    @staticmethod
+    def _size(surface):
+        return surface.get_pitch() * surface.get_height()
+
+    @staticmethod
+    def _render_sprite(enemy_type, is_boss, size, is_aggroed, shield_active, angle):
+        """Draw one enemy outline centred on a transparent sprite"""
+        half = size + 12  # Room for the shield ring
+        sprite = pygame.Surface((half * 2, half * 2))
+        sprite.fill(SPRITE_COLORKEY)
+        center_x, center_y = half, half
+
+        # Draw shield effect for boss
+        if shield_active:
+            pygame.draw.circle(sprite, (100, 200, 255), (center_x, center_y), size + 10, 2)
+            pygame.draw.circle(sprite, (100, 200, 255), (center_x, center_y), size + 8, 1)
+
+        # Choose color based on aggro state and type
+        if enemy_type == EnemyType.SQUARE_TURRET:
+            color = CORRUPTION_PINK if is_aggroed else CLEAN_BLUE
+            pygame.draw.rect(sprite, color,
+                           (center_x - size//2, center_y - size//2, size, size), 2)
+        elif enemy_type == EnemyType.TRIANGLE_BLADE:
+            color = CORRUPTION_ORANGE if is_aggroed else CORRUPTION_PINK
+            points = [
+                (center_x + math.cos(angle) * size,
+                 center_y + math.sin(angle) * size),
+                (center_x + math.cos(angle + 2.4) * size,
+                 center_y + math.sin(angle + 2.4) * size),
+                (center_x + math.cos(angle - 2.4) * size,
+                 center_y + math.sin(angle - 2.4) * size)
+            ]
+            pygame.draw.polygon(sprite, color, points, 2)
+        elif enemy_type == EnemyType.PENTAGON_GUNNER or enemy_type == EnemyType.BOSS:
+            if is_boss:
+                color = (255, 50, 50) if is_aggroed else (200, 100, 0)
+                thickness = 4
+            else:
+                color = (255, 100, 100) if is_aggroed else CORRUPTION_ORANGE
+                thickness = 2
+
+            points = []
+            for i in range(5):
+                vertex_angle = angle + (i * math.pi * 2 / 5)
+                points.append((center_x + math.cos(vertex_angle) * size,
+                             center_y + math.sin(vertex_angle) * size))
+            pygame.draw.polygon(sprite, color, points, thickness)
+        '''
+        elif enemy_type == EnemyType.SNIPER:
+            color = (150, 0, 200) if is_aggroed else (100, 0, 150)
+            # Draw octagon for sniper
+            points = []
+            for i in range(8):
+                vertex_angle = angle + (i * math.pi * 2 / 8)
+                points.append((center_x + math.cos(vertex_angle) * size,
+                             center_y + math.sin(vertex_angle) * size))
+            pygame.draw.polygon(sprite, color, points, 2)
+
+            # Draw sniper barrel
+            barrel_length = size * 1.5
+            barrel_end_x = center_x + math.cos(angle) * barrel_length
+            barrel_end_y = center_y + math.sin(angle) * barrel_length
+            pygame.draw.line(sprite, color, (center_x, center_y),
+                           (barrel_end_x, barrel_end_y), 3)
+        '''
+
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()  # Match the screen's pixel format
+        sprite.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+        return sprite, half
+
+
+class EnemyLayer:
+    """
+    Enemies sharing a z_index: one entry of the render queue, drawn as one batch
+
+    Enemies join when they spawn and leave when they die. cull, if given,
+    takes the layer's enemies and returns the ones worth drawing this frame.
+    """
+
+    def __init__(self, z_index, cull=None):
+        self.z_index = z_index
+        self.enemies = {}  # Insertion-ordered set: enemy -> None
+        self.cull = cull
+
+    def __len__(self):
+        return len(self.enemies)
+
+    def add(self, enemy):
+        self.enemies[enemy] = None
+
+    def remove(self, enemy):
+        self.enemies.pop(enemy, None)
+
+    def clear(self):
+        self.enemies.clear()
+
+    def draw(self, screen, camera_x, camera_y):
+        enemies = self.cull(self.enemies) if self.cull else list(self.enemies)
+        return EnemyRenderer.draw_enemies(screen, enemies, camera_x, camera_y)
@@ -0,0 +1,111 @@
+import csv
+import os
+import time
+import numpy as np
+
+
+class FrameProfiler:
+    """
+    Per-phase frame timer backed by a fixed-size ring buffer.
+
+    Usage each frame:
+        profiler.start_frame()
+        ...events...     profiler.mark('events')
+        ...player...     profiler.mark('player')
+        profiler.end_frame(enemies=..., bullets=...)
+
+    mark() charges the time since the previous mark (or start_frame) to
+    the named phase. While disabled every call returns immediately. Turning
+    the profiler on mid-frame takes effect from the next start_frame(), so
+    a frame is only recorded if it was timed from its start.
+    """
+
+    PHASES = (
+        'events', 'player', 'bullets', 'walls', 'enemy_ai', 'enemy_collisions', 'bullet_hits',
+        'draw_world', 'draw_entities', 'draw_ui', 'stat_ui', 'minimap', 'overlay', 'present'
+    )
+    COUNTS = ('enemies', 'bullets', 'walls', 'ai_full', 'ai_reduced', 'ai_asleep')
+
+    def __init__(self, capacity=600, enabled=False):
+        self.capacity = capacity
+        self.enabled = enabled
+        self.phase_index = {phase: i for i, phase in enumerate(self.PHASES)}
+
+        # Ring buffers: one row per frame
+        self.samples = np.zeros((capacity, len(self.PHASES)))  # milliseconds
+        self.counts = np.zeros((capacity, len(self.COUNTS)), dtype=np.int32)
+        self.frames_recorded = 0
+
+        self._current = [0.0] * len(self.PHASES)
+        self._last = 0.0
+        self._timing = False  # This frame's start_frame() ran while enabled
+
+    def start_frame(self):
+        self._timing = self.enabled
+        if not self._timing:
+            return
+        self._current = [0.0] * len(self.PHASES)
+        self._last = time.perf_counter()
+
+    def mark(self, phase):
+        """Charge the time since the last mark to phase"""
+        if not self._timing:
+            return
+        now = time.perf_counter()
+        self._current[self.phase_index[phase]] += (now - self._last) * 1000
+        self._last = now
+
+    def end_frame(self, **counts):
+        """Store the finished frame (and entity counts) in the ring buffer"""
+        if not self._timing:
+            return
+        self._timing = False
+        row = self.frames_recorded % self.capacity
+        self.samples[row] = self._current
+        self.counts[row] = [counts.get(name, 0) for name in self.COUNTS]
+        self.frames_recorded += 1
+
+    def recent(self, frames=60):
+        """
+        Average phase times and latest counts over the last few frames
+
+        Returns:
+            (dict phase -> mean ms, dict count name -> latest value)
+        """
+        available = min(frames, self.frames_recorded, self.capacity)
+        if available == 0:
+            return {phase: 0.0 for phase in self.PHASES}, {name: 0 for name in self.COUNTS}
+
+        rows = [(self.frames_recorded - 1 - i) % self.capacity for i in range(available)]
+        means = self.samples[rows].mean(axis=0)
+        latest = self.counts[rows[0]]
+        return (dict(zip(self.PHASES, means.tolist())),
+                dict(zip(self.COUNTS, latest.tolist())))
+
+    def export_csv(self, path):
+        """
+        Write the frames still held in the ring buffer, oldest first
+
+        Returns:
+            The path written, or None if nothing was recorded
+        """
+        if self.frames_recorded == 0:
+            return None
+
+        available = min(self.frames_recorded, self.capacity)
+        first = self.frames_recorded - available
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame', *self.PHASES, 'total', *self.COUNTS])
+            for frame in range(first, self.frames_recorded):
+                row = frame % self.capacity
+                times = self.samples[row]
+                writer.writerow([
+                    frame,
+                    *(f"{value:.4f}" for value in times),
+                    f"{times.sum():.4f}",
+                    *self.counts[row].tolist()
+                ])
+        return path
@@ -0,0 +1,90 @@
+import pygame
+from src.utils.constants import *
+
+
+class LiveInput:
+    """Reads events, keyboard and mouse straight from pygame"""
+
+    def advance(self):
+        """Called once at the start of every tick (nothing to do for live input)"""
+        pass
+
+    def get_events(self):
+        return pygame.event.get()
+
+    def get_keys(self):
+        return pygame.key.get_pressed()
+
+    def get_mouse_pos(self):
+        return pygame.mouse.get_pos()
+
+    def get_mouse_buttons(self):
+        return pygame.mouse.get_pressed()
+
+
+class KeyState:
+    """Indexable like pygame.key.get_pressed(), backed by a set of held keys"""
+
+    def __init__(self, pressed):
+        self.pressed = pressed
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class ScriptedInput:
+    """
+    Deterministic input for headless runs.
+
+    Holds the keys, mouse state and queued events the game sees on the
+    current tick. An optional script callable(input_source, tick) is run
+    at the start of each tick to change them. Game time comes from the
+    game's tick counter (Game.sim_time), not from here.
+    """
+
+    def __init__(self, script=None):
+        self.script = script
+        self.tick = -1  # advance() moves to tick 0 before the first update
+
+        self.pressed = set()
+        self.mouse_pos = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        self.mouse_buttons = (False, False, False)
+        self.pending_events = []
+
+    def advance(self):
+        """Step to the next tick and let the script set up its input"""
+        self.tick += 1
+        if self.script:
+            self.script(self, self.tick)
+
+    # ----- Script helpers -----
+
+    def hold(self, key):
+        self.pressed.add(key)
+
+    def release(self, key):
+        self.pressed.discard(key)
+
+    def tap(self, key):
+        """Queue a KEYDOWN event for this tick"""
+        self.pending_events.append(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+    def click(self, pos, button=1):
+        """Queue a MOUSEBUTTONDOWN event for this tick"""
+        self.pending_events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=button))
+
+    # ----- Game-facing interface (mirrors LiveInput) -----
+
+    def get_events(self):
+        events = self.pending_events
+        self.pending_events = []
+        return events
+
+    def get_keys(self):
+        return KeyState(self.pressed)
+
+    def get_mouse_pos(self):
+        return self.mouse_pos
+
+    def get_mouse_buttons(self):
+        return self.mouse_buttons
@@ -0,0 +1,56 @@
+import bisect
+
+
+class RenderQueue:
+    """
+    Draw list bucketed by z_index, kept up to date as things spawn and die.
+
+    Drawables register once with add() and leave with remove(), so a frame
+    walks the buckets in z order without building or sorting a list. Within
+    a bucket, drawables draw in the order they registered. A drawable's
+    z_index is read when it registers; remove and re-add it to move it.
+    """
+
+    def __init__(self):
+        self.buckets = {}  # z_index -> {drawable: None}, an insertion-ordered set
+        self.z_order = []  # Bucket keys, ascending
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.buckets.values())
+
+    def __contains__(self, drawable):
+        bucket = self.buckets.get(drawable.z_index)
+        return bucket is not None and drawable in bucket
+
+    def add(self, drawable):
+        """Register a drawable in the bucket for its z_index"""
+        bucket = self.buckets.get(drawable.z_index)
+        if bucket is None:
+            bucket = self.buckets[drawable.z_index] = {}
+            bisect.insort(self.z_order, drawable.z_index)
+        bucket[drawable] = None
+
+    def remove(self, drawable):
+        """Unregister a drawable (no-op if it is not queued)"""
+        bucket = self.buckets.get(drawable.z_index)
+        if bucket is not None:
+            bucket.pop(drawable, None)
+
+    def clear(self):
+        """Unregister everything"""
+        self.buckets.clear()
+        self.z_order.clear()
+
+    def draw(self, screen, camera_x, camera_y, dirty=None):
+        """
+        Draw every bucket, lowest z_index first (behind)
+
+        Args:
+            dirty: Optional DirtyRectRenderer that records the rects each draw returns
+        """
+        buckets = self.buckets
+        for z_index in self.z_order:
+            for drawable in buckets[z_index]:
+                rects = drawable.draw(screen, camera_x, camera_y)
+                if dirty:
+                    dirty.add(rects)
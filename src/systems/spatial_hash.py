@@ -0,0 +1,118 @@
+class SpatialHash:
+    """
+    Dynamic spatial hash for moving entities (anything with x/y attributes).
+
+    Entities are bucketed by the grid cell holding their centre and moved
+    between buckets incrementally when update() sees them change cell.
+    Each entity also keeps the sequence number it was inserted with, so
+    callers can break ties in the same order as the source list.
+    """
+
+    def __init__(self, cell_size=100):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> {entity: None}
+        self.entity_cells = {}  # id(entity) -> (cell_x, cell_y)
+        self.sequence = {}  # id(entity) -> insertion order
+        self._next_sequence = 0
+
+    def __len__(self):
+        return len(self.entity_cells)
+
+    def _key(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def clear(self):
+        """Forget every entity"""
+        self.cells.clear()
+        self.entity_cells.clear()
+        self.sequence.clear()
+        self._next_sequence = 0
+
+    def rebuild(self, entities):
+        """Clear and insert entities in list order"""
+        self.clear()
+        for entity in entities:
+            self.insert(entity)
+
+    def insert(self, entity):
+        """Add an entity at its current position"""
+        key = self._key(entity.x, entity.y)
+        self.cells.setdefault(key, {})[entity] = None
+        self.entity_cells[id(entity)] = key
+        self.sequence[id(entity)] = self._next_sequence
+        self._next_sequence += 1
+
+    def remove(self, entity):
+        """Remove an entity (no-op if it is not in the hash)"""
+        key = self.entity_cells.pop(id(entity), None)
+        if key is None:
+            return
+        del self.sequence[id(entity)]
+        bucket = self.cells[key]
+        del bucket[entity]
+        if not bucket:
+            del self.cells[key]
+
+    def update(self, entity):
+        """Move an entity to the cell matching its current position"""
+        old_key = self.entity_cells.get(id(entity))
+        if old_key is None:
+            self.insert(entity)
+            return
+
+        key = self._key(entity.x, entity.y)
+        if key == old_key:
+            return
+
+        bucket = self.cells[old_key]
+        del bucket[entity]
+        if not bucket:
+            del self.cells[old_key]
+        self.cells.setdefault(key, {})[entity] = None
+        self.entity_cells[id(entity)] = key
+
+    def nearby(self, x, y):
+        """
+        Yield entities in the cell containing (x, y) and its 8 neighbours.
+        Covers every entity within cell_size of the point.
+        """
+        cell_x, cell_y = self._key(x, y)
+        cells = self.cells
+        for ny in (cell_y - 1, cell_y, cell_y + 1):
+            for nx in (cell_x - 1, cell_x, cell_x + 1):
+                bucket = cells.get((nx, ny))
+                if bucket:
+                    yield from bucket
+
+    def query_rect(self, rect):
+        """
+        Get entities filed in any cell a rect overlaps
+
+        Args:
+            rect: pygame.Rect in world coordinates
+
+        Returns:
+            List of entities in insertion order. Entities are bucketed by
+            centre only; pad rect by their extent for an exact test.
+        """
+        size = self.cell_size
+        min_x, min_y = rect.left // size, rect.top // size
+        max_x, max_y = (rect.right - 1) // size, (rect.bottom - 1) // size
+
+        found = []
+        cells = self.cells
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(cells):
+            # Rect spans more cells than are occupied: scan the occupied ones
+            for (cell_x, cell_y), bucket in cells.items():
+                if min_x <= cell_x <= max_x and min_y <= cell_y <= max_y:
+                    found.extend(bucket)
+        else:
+            for cell_y in range(min_y, max_y + 1):
+                for cell_x in range(min_x, max_x + 1):
+                    bucket = cells.get((cell_x, cell_y))
+                    if bucket:
+                        found.extend(bucket)
+
+        sequence = self.sequence
+        found.sort(key=lambda entity: sequence[id(entity)])
+        return found
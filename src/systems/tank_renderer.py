@@ -1,38 +1,122 @@
 import pygame
+import copy
 import math
+from collections import OrderedDict
 from src.configs.tank_configs import TANK_CONFIGS
 from src.utils.constants import *
 
+# Rotations cached per tank type; the drawn angle snaps to the nearest step
+ANGLE_STEPS = 256
+
 class TankRenderer:
-    """Handles drawing all tank types from configuration"""
+    """
+    Handles drawing all tank types from configuration
+    
+    Each tank is composited (cannons, outlines, body) once per tank type,
+    body size and angle step into a sprite, lazily, so a frame draws it with
+    a single blit. Sprites live in an LRU cache capped at MAX_BYTES. Every
+    draw compares the tank's TANK_CONFIGS cannons with a copy of the ones its
+    sprites were drawn from (a plain == on a few small dicts), so editing a
+    config, even in place, redraws that type's sprites.
+    """
+    
+    CANNON_LENGTH = 40
+    CANNON_WIDTH = 12
+    MAX_BYTES = 16 * 1024 * 1024
+    
+    # (tank type name, size, angle step) -> (sprite, half size)
+    _sprites = OrderedDict()
+    _bytes = 0
+    # tank type name -> copy of the cannons its cached sprites were drawn from
+    _drawn_cannons = {}
     
     @staticmethod
     def draw_tank(screen, tank, camera_x, camera_y):
-        """Draw any tank type based on its configuration"""
+        """Draw any tank type based on its configuration, returning the screen rect drawn to"""
         screen_x = int(tank.x - camera_x)
         screen_y = int(tank.y - camera_y)
         
+        sprite, half = TankRenderer.get_sprite(tank.tank_type.name, tank.size, tank.angle)
+        return screen.blit(sprite, (screen_x - half, screen_y - half))
+    
+    @staticmethod
+    def get_sprite(type_name, size, angle):
+        """
+        Cached sprite of a tank at the angle step nearest to angle
+        
+        Returns:
+            (sprite, half size): blit at the tank's centre minus half
+        """
         # Get tank config
-        config = TANK_CONFIGS.get(tank.tank_type.name, TANK_CONFIGS["BASIC"])
+        if type_name not in TANK_CONFIGS:
+            type_name = "BASIC"
+        config = TANK_CONFIGS[type_name]
+        
+        if config["cannons"] != TankRenderer._drawn_cannons.get(type_name):
+            TankRenderer.invalidate(type_name)
+            TankRenderer._drawn_cannons[type_name] = copy.deepcopy(config["cannons"])
+        
+        step = round(angle / (2 * math.pi) * ANGLE_STEPS) % ANGLE_STEPS
+        key = (type_name, size, step)
+        sprites = TankRenderer._sprites
+        sprite = sprites.get(key)
+        if sprite is not None:
+            sprites.move_to_end(key)
+            return sprite
+        
+        sprite = TankRenderer._render_sprite(config, size, step * 2 * math.pi / ANGLE_STEPS)
+        sprites[key] = sprite
+        TankRenderer._bytes += TankRenderer._size(sprite[0])
+        while TankRenderer._bytes > TankRenderer.MAX_BYTES and len(sprites) > 1:
+            _, (evicted, _) = sprites.popitem(last=False)
+            TankRenderer._bytes -= TankRenderer._size(evicted)
+        return sprite
+    
+    @staticmethod
+    def invalidate(type_name):
+        """Drop a tank type's sprites (get_sprite does this itself when the type's cannons change)"""
+        for key in [key for key in TankRenderer._sprites if key[0] == type_name]:
+            sprite, _ = TankRenderer._sprites.pop(key)
+            TankRenderer._bytes -= TankRenderer._size(sprite)
+        TankRenderer._drawn_cannons.pop(type_name, None)
+    
+    @staticmethod
+    def clear_cache():
+        TankRenderer._sprites.clear()
+        TankRenderer._bytes = 0
+        TankRenderer._drawn_cannons.clear()
+    
+    @staticmethod
+    def _size(surface):
+        return surface.get_pitch() * surface.get_height()
+    
+    @staticmethod
+    def _render_sprite(config, size, angle):
+        """Composite one rotation of a tank, centred on a transparent sprite"""
+        # Farthest any cannon corner can reach from the centre
+        cannon_reach = math.hypot(TankRenderer.CANNON_LENGTH, TankRenderer.CANNON_WIDTH / 2)
+        reach = max([math.hypot(*cannon["position_offset"]) + cannon_reach for cannon in config["cannons"]]
+                    + [size - 8])
+        half = math.ceil(reach) + 2
+        sprite = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
         
-        cannon_length = 40
-        cannon_width = 12
         cannon_color = GREY
         
         # Draw all cannons (behind body)
         for cannon in config["cannons"]:
             TankRenderer._draw_cannon(
-                screen, screen_x, screen_y, 
-                tank.angle, cannon, 
-                cannon_length, cannon_width, cannon_color
+                sprite, half, half,
+                angle, cannon,
+                TankRenderer.CANNON_LENGTH, TankRenderer.CANNON_WIDTH, cannon_color
             )
         
         # Draw body (on top)
-        pygame.draw.circle(screen, CLEAN_BLUE, (screen_x, screen_y), tank.size - 8)
-        #pygame.draw.circle(screen, CLEAN_BLUE, (screen_x, screen_y), tank.size, 3)
+        pygame.draw.circle(sprite, CLEAN_BLUE, (half, half), size - 8)
+        #pygame.draw.circle(sprite, CLEAN_BLUE, (half, half), size, 3)
+        return sprite, half
     
     @staticmethod
-    def _draw_cannon(screen, screen_x, screen_y, base_angle, cannon_config, 
+    def _draw_cannon(screen, screen_x, screen_y, base_angle, cannon_config,
                      cannon_length, cannon_width, cannon_color):
         """Draw a single cannon"""
         # Calculate cannon angle
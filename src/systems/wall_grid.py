@@ -0,0 +1,68 @@
+class WallGrid:
+    """
+    Static uniform grid over wall rects for broad-phase collision checks.
+    Built once per level; each wall is bucketed into every cell it overlaps.
+    """
+
+    def __init__(self, walls, cell_size=100):
+        self.cell_size = cell_size
+        self.walls = list(walls)
+        self.cells = {}
+
+        for wall in self.walls:
+            for key in self._cell_keys(wall.rect):
+                self.cells.setdefault(key, []).append(wall)
+
+    def _cell_keys(self, rect):
+        """Yield every (cell_x, cell_y) key a rect overlaps"""
+        min_x, min_y, max_x, max_y = self._cell_span(rect)
+        for cell_y in range(min_y, max_y + 1):
+            for cell_x in range(min_x, max_x + 1):
+                yield cell_x, cell_y
+
+    def _cell_span(self, rect):
+        """Return (min_x, min_y, max_x, max_y) cell indices covered by a rect"""
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size,
+            (rect.bottom - 1) // size
+        )
+
+    def query(self, rect):
+        """
+        Get walls near a rect
+
+        Args:
+            rect: pygame.Rect in world coordinates
+
+        Returns:
+            List of walls sharing a grid cell with rect (each wall at most once).
+            Walls are candidates only; use collides_with for the exact test.
+        """
+        min_x, min_y, max_x, max_y = self._cell_span(rect)
+
+        # Fast path: rect sits inside a single cell
+        if min_x == max_x and min_y == max_y:
+            return self.cells.get((min_x, min_y), [])
+
+        nearby = []
+        seen = set()
+        for cell_y in range(min_y, max_y + 1):
+            for cell_x in range(min_x, max_x + 1):
+                for wall in self.cells.get((cell_x, cell_y), ()):
+                    if id(wall) not in seen:
+                        seen.add(id(wall))
+                        nearby.append(wall)
+        return nearby
+
+    def first_collision(self, rect):
+        """Return the first wall colliding with rect, or None"""
+        min_x, min_y, max_x, max_y = self._cell_span(rect)
+        for cell_y in range(min_y, max_y + 1):
+            for cell_x in range(min_x, max_x + 1):
+                for wall in self.cells.get((cell_x, cell_y), ()):
+                    if wall.collides_with(rect):
+                        return wall
+        return None
@@ -0,0 +1,116 @@
+import math
+import pygame
+from src.utils.constants import *
+from src.systems.wall_grid import WallGrid
+
+
+class StaticWorldLayer:
+    """
+    Background grid and static walls pre-rendered into fixed-size chunks.
+
+    Each chunk is baked the first time it scrolls into view and reused for
+    the rest of the level, so a frame costs one blit per visible chunk no
+    matter how many walls the map has. Walls that animate (enemy barriers)
+    are kept out of the bake and drawn on top every frame.
+    """
+
+    GRID_COLOR = (20, 40, 60)
+
+    def __init__(self, world_width, world_height, walls, chunk_size=512, grid_size=50):
+        self.world_width = world_width
+        self.world_height = world_height
+        self.chunk_size = chunk_size
+        self.grid_size = grid_size
+
+        self.static_walls = [wall for wall in walls if wall.wall_type != "enemy_barrier"]
+        self.dynamic_walls = [wall for wall in walls if wall.wall_type == "enemy_barrier"]
+
+        # Chunk-sized cells: each cell lists the walls a chunk has to bake
+        self._chunk_walls = WallGrid(self.static_walls, cell_size=chunk_size)
+        # Animated walls are looked up by view each frame
+        self._dynamic_grid = WallGrid(self.dynamic_walls, cell_size=chunk_size)
+        self.chunks = {}  # (chunk_x, chunk_y) -> Surface
+
+    def _bake_chunk(self, chunk_x, chunk_y):
+        """Render the grid and static walls for one chunk"""
+        origin_x = chunk_x * self.chunk_size
+        origin_y = chunk_y * self.chunk_size
+        width = min(self.chunk_size, self.world_width - origin_x)
+        height = min(self.chunk_size, self.world_height - origin_y)
+
+        surface = pygame.Surface((width, height))
+        surface.fill(BLACK)
+
+        # Grid lines that fall inside this chunk
+        first_x = -(-origin_x // self.grid_size) * self.grid_size
+        for x in range(first_x, origin_x + width, self.grid_size):
+            pygame.draw.line(surface, self.GRID_COLOR, (x - origin_x, 0), (x - origin_x, height))
+        first_y = -(-origin_y // self.grid_size) * self.grid_size
+        for y in range(first_y, origin_y + height, self.grid_size):
+            pygame.draw.line(surface, self.GRID_COLOR, (0, y - origin_y), (width, y - origin_y))
+
+        # Walls are drawn whole; the chunk surface clips whatever falls outside
+        chunk_rect = pygame.Rect(origin_x, origin_y, width, height)
+        for wall in self._chunk_walls.query(chunk_rect):
+            wall.draw(surface, (origin_x, origin_y))
+
+        self.chunks[(chunk_x, chunk_y)] = surface
+        return surface
+
+    def draw(self, screen, camera_x, camera_y):
+        """Blit the chunks overlapping the view, then the animated walls"""
+        # Floor once so neighbouring chunks line up without seams
+        view_x = math.floor(camera_x)
+        view_y = math.floor(camera_y)
+        self._draw_area(screen, view_x, view_y, screen.get_rect())
+
+    def draw_region(self, screen, camera_x, camera_y, rects):
+        """
+        Redraw only the parts of the view under the given screen rects
+        (dirty-rect rendering: everything else on screen is left as it is)
+        """
+        view_x = math.floor(camera_x)
+        view_y = math.floor(camera_y)
+        screen_rect = screen.get_rect()
+        previous_clip = screen.get_clip()
+        for rect in rects:
+            area = screen_rect.clip(rect)
+            if area.width and area.height:
+                screen.set_clip(area)
+                self._draw_area(screen, view_x, view_y, area)
+        screen.set_clip(previous_clip)
+
+    def dynamic_rects(self, camera_x, camera_y, view_size):
+        """Screen rects of the animated walls in view; they change every frame"""
+        view_x = math.floor(camera_x)
+        view_y = math.floor(camera_y)
+        view_rect = pygame.Rect(view_x, view_y, *view_size)
+        return [wall.rect.move(-view_x, -view_y) for wall in self._dynamic_grid.query(view_rect)
+                if wall.rect.colliderect(view_rect)]
+
+    def _draw_area(self, screen, view_x, view_y, area):
+        """Draw the world under one screen-space area, with the view's top-left at (view_x, view_y)"""
+        world_x = view_x + area.x
+        world_y = view_y + area.y
+
+        if (world_x < 0 or world_y < 0 or
+                world_x + area.width > self.world_width or world_y + area.height > self.world_height):
+            screen.fill(BLACK, area)  # Part of the view lies outside the baked world
+
+        size = self.chunk_size
+        first_cx = max(0, world_x // size)
+        first_cy = max(0, world_y // size)
+        last_cx = min((self.world_width - 1) // size, (world_x + area.width - 1) // size)
+        last_cy = min((self.world_height - 1) // size, (world_y + area.height - 1) // size)
+
+        for chunk_y in range(first_cy, last_cy + 1):
+            for chunk_x in range(first_cx, last_cx + 1):
+                chunk = self.chunks.get((chunk_x, chunk_y))
+                if chunk is None:
+                    chunk = self._bake_chunk(chunk_x, chunk_y)
+                screen.blit(chunk, (chunk_x * size - view_x, chunk_y * size - view_y))
+
+        world_rect = pygame.Rect(world_x, world_y, area.width, area.height)
+        for wall in self._dynamic_grid.query(world_rect):
+            if wall.rect.colliderect(world_rect):
+                wall.draw(screen, (view_x, view_y))
@@ -2,6 +2,8 @@
 import pygame as pg
 import os
 
+from src.ui.text_cache import text_cache
+
 WIDTH, HEIGHT = 1280, 720
 FPS = 60
 
@@ -27,16 +29,16 @@ class GameOverScreen:
             font_path = os.path.join(os.path.dirname(__file__), "fonts", "Sterion-BLLId.ttf")
             italic_path = os.path.join(os.path.dirname(__file__), "fonts", "SterionItalic-R99PA.ttf")
             
-            self.title_font = pg.font.Font(font_path, 65)
-            self.subtitle_font = pg.font.Font(italic_path, 22)
-            self.heading_font = pg.font.Font(font_path, 26)
-            self.score_font = pg.font.Font(font_path, 40)
+            self.title_font = text_cache.font(font_path, 65)
+            self.subtitle_font = text_cache.font(italic_path, 22)
+            self.heading_font = text_cache.font(font_path, 26)
+            self.score_font = text_cache.font(font_path, 40)
         except:
             print("Custom font not found, using default")
-            self.title_font = pg.font.SysFont("arial", 65, bold=True)
-            self.subtitle_font = pg.font.SysFont("arial", 22, italic=True)
-            self.heading_font = pg.font.SysFont("arial", 26, bold=True)
-            self.score_font = pg.font.SysFont("arial", 40, bold=True)
+            self.title_font = text_cache.sysfont("arial", 65, bold=True)
+            self.subtitle_font = text_cache.sysfont("arial", 22, italic=True)
+            self.heading_font = text_cache.sysfont("arial", 26, bold=True)
+            self.score_font = text_cache.sysfont("arial", 40, bold=True)
         
         # Create grid background
         self.bg_image = self.create_grid_background()
@@ -130,14 +132,14 @@ class GameOverScreen:
         self.screen.blit(panel_surface, panel_rect.topleft)
         
         # Title
-        title = self.title_font.render("SYSTEM FAILURE", True, RED)
-        title_shadow = self.title_font.render("SYSTEM FAILURE", True, (150, 30, 50))
+        title = text_cache.render(self.title_font, "SYSTEM FAILURE", RED)
+        title_shadow = text_cache.render(self.title_font, "SYSTEM FAILURE", (150, 30, 50))
         self.screen.blit(title_shadow, (WIDTH//2 - title.get_width()//2 + 3, HEIGHT//2 - 150))
         self.screen.blit(title, (WIDTH//2 - title.get_width()//2, HEIGHT//2 - 153))
             
         # Subtitle messages
-        subtitle1 = self.subtitle_font.render("The corruption overwhelmed your systems.", True, WHITE)
-        subtitle2 = self.subtitle_font.render("Humanity's last hope has fallen.", True, CYAN)
+        subtitle1 = text_cache.render(self.subtitle_font, "The corruption overwhelmed your systems.", WHITE)
+        subtitle2 = text_cache.render(self.subtitle_font, "Humanity's last hope has fallen.", CYAN)
         self.screen.blit(subtitle1, (WIDTH//2 - subtitle1.get_width()//2, HEIGHT//2 - 80))
         self.screen.blit(subtitle2, (WIDTH//2 - subtitle2.get_width()//2, HEIGHT//2 - 50))
         
@@ -146,8 +148,8 @@ class GameOverScreen:
         pg.draw.rect(self.screen, (10, 20, 35), score_box_rect)
         pg.draw.rect(self.screen, RED, score_box_rect, 2)
         
-        score_label = self.heading_font.render("FINAL SCORE", True, WHITE)
-        score_value = self.score_font.render(str(self.score), True, RED)
+        score_label = text_cache.render(self.heading_font, "FINAL SCORE", WHITE)
+        score_value = text_cache.render(self.score_font, str(self.score), RED)
         
         self.screen.blit(score_label, (WIDTH//2 - score_label.get_width()//2, HEIGHT//2 + 5))
         self.screen.blit(score_value, (WIDTH//2 - score_value.get_width()//2, HEIGHT//2 + 35))
@@ -160,7 +162,7 @@ class GameOverScreen:
         retry_color = BRIGHT_CYAN if retry_hovered else CYAN
         pg.draw.rect(self.screen, retry_color, self.retry_button)
         pg.draw.rect(self.screen, WHITE, self.retry_button, 2)
-        retry_text = self.heading_font.render("RETRY MISSION", True, DARK_BG)
+        retry_text = text_cache.render(self.heading_font, "RETRY MISSION", DARK_BG)
         self.screen.blit(retry_text, (self.retry_button.centerx - retry_text.get_width()//2,
                                       self.retry_button.centery - retry_text.get_height()//2))
         
@@ -168,7 +170,7 @@ class GameOverScreen:
         menu_hovered = self.menu_button.collidepoint(mx, my)
         pg.draw.rect(self.screen, (30, 35, 45) if not menu_hovered else (50, 55, 65), self.menu_button)
         pg.draw.rect(self.screen, WHITE, self.menu_button, 2)
-        menu_text = self.heading_font.render("MAIN MENU", True, WHITE)
+        menu_text = text_cache.render(self.heading_font, "MAIN MENU", WHITE)
         self.screen.blit(menu_text, (self.menu_button.centerx - menu_text.get_width()//2,
                                      self.menu_button.centery - menu_text.get_height()//2))
 
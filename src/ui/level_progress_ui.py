@@ -1,17 +1,18 @@
 import pygame
 from src.utils.constants import *
+from src.ui.text_cache import text_cache
 
 class LevelProgressUI:
     """UI for displaying level progress and next level button"""
     
     def __init__(self):
-        self.font = pygame.font.Font(None, 24)
-        self.button_font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 18)
+        self.font = text_cache.font(None, 24)
+        self.button_font = text_cache.font(None, 32)
+        self.small_font = text_cache.font(None, 18)
         self.next_level_button_rect = None
     
     def draw_enemy_progress_bar(self, screen, enemies_remaining, initial_enemy_count, level_complete):
-        """Draw enemy kill progress bar at top of screen"""
+        """Draw enemy kill progress bar at top of screen, returning the screen rect it covers"""
         bar_width = 500
         bar_height = 25
         bar_x = (SCREEN_WIDTH - bar_width) // 2
@@ -40,12 +41,14 @@ class LevelProgressUI:
         if level_complete:
             text = "ALL ENEMIES ELIMINATED!"
         
-        text_surface = self.font.render(text, True, WHITE)
+        text_surface = text_cache.render(self.font, text, WHITE)
         text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, bar_y + bar_height // 2))
         screen.blit(text_surface, text_rect)
+        
+        return text_rect.union((bar_x, bar_y, bar_width, bar_height))
     
     def draw_next_level_button(self, screen):
-        """Draw button to proceed to next level"""
+        """Draw button to proceed to next level, returning the screen rect it covers"""
         button_width = 300
         button_height = 60
         button_x = (SCREEN_WIDTH - button_width) // 2
@@ -64,14 +67,16 @@ class LevelProgressUI:
         pygame.draw.rect(screen, WHITE, self.next_level_button_rect, 3)
         
         # Draw button text
-        button_text = self.button_font.render("PROCEED TO NEXT LEVEL", True, WHITE)
+        button_text = text_cache.render(self.button_font, "PROCEED TO NEXT LEVEL", WHITE)
         text_rect = button_text.get_rect(center=self.next_level_button_rect.center)
         screen.blit(button_text, text_rect)
         
         # Draw instruction text below button
-        instruction = self.small_font.render("Click to continue", True, UI_CYAN)
+        instruction = text_cache.render(self.small_font, "Click to continue", UI_CYAN)
         inst_rect = instruction.get_rect(center=(SCREEN_WIDTH // 2, button_y + button_height + 30))
         screen.blit(instruction, inst_rect)
+        
+        return self.next_level_button_rect.union(inst_rect)
     
     def check_button_click(self, mouse_pos):
         """Check if next level button was clicked"""
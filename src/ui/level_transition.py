@@ -1,30 +1,41 @@
 import pygame
 import time
 from src.utils.constants import *
+from src.ui.text_cache import text_cache
 
 class LevelTransition:
     def __init__(self, current_level, next_level):
         self.current_level = current_level
         self.next_level = next_level
-        self.font_large = pygame.font.Font(None, 72)
-        self.font_medium = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 32)
+        self.font_large = text_cache.font(None, 72)
+        self.font_medium = text_cache.font(None, 48)
+        self.font_small = text_cache.font(None, 32)
         
-    def show(self, screen):
-        """Display transition screen for 4-5 seconds"""
+    def show(self, screen, loader=None):
+        """
+        Display transition screen for 4-5 seconds
+        
+        Args:
+            screen: Display surface
+            loader: Optional LevelLoader running in the background; the loading
+                    bar shows its progress and the screen stays up until it is done
+        
+        Returns:
+            False if the window was closed, True otherwise
+        """
         start_time = time.time()
         duration = 4.5  # seconds
         
         clock = pygame.time.Clock()
         
-        while time.time() - start_time < duration:
+        while time.time() - start_time < duration or (loader and not loader.done):
             # Handle events (allow closing window)
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     return False
             
             # Calculate progress (0 to 1)
-            progress = (time.time() - start_time) / duration
+            progress = min(1.0, (time.time() - start_time) / duration)
             
             # Draw background with fade effect
             screen.fill(BLACK)
@@ -50,7 +61,9 @@ class LevelTransition:
                                          SCREEN_HEIGHT // 2, CORRUPTION_PURPLE, self.font_medium, alpha)
             
             # Draw loading bar
-            if progress > 0.5:
+            if loader:
+                self._draw_loading_bar(screen, loader.progress)
+            elif progress > 0.5:
                 self._draw_loading_bar(screen, (progress - 0.5) / 0.5)
             
             # Draw tips
@@ -96,13 +109,14 @@ class LevelTransition:
         pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
         
         # Percentage text
-        percent_text = self.font_small.render(f"{int(progress * 100)}%", True, WHITE)
+        percent_text = text_cache.render(self.font_small, f"{int(progress * 100)}%", WHITE)
         text_rect = percent_text.get_rect(center=(SCREEN_WIDTH // 2, bar_y + bar_height // 2))
         screen.blit(percent_text, text_rect)
     
     def _draw_text_with_fade(self, screen, text, y_pos, color, font, alpha):
         """Draw text with fade effect"""
-        text_surface = font.render(text, True, color)
+        # The cached surface is shared with every other caller, so fade a copy
+        text_surface = text_cache.render(font, text, color).copy()
         text_surface.set_alpha(alpha)
         text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
         screen.blit(text_surface, text_rect)
\ No newline at end of file
@@ -5,6 +5,8 @@ import os
 import random
 import math
 
+from src.ui.text_cache import text_cache
+
 WIDTH, HEIGHT = 1280, 720
 FPS = 60
 
@@ -19,70 +21,65 @@ RED = (255, 50, 100)
 WHITE = (255, 255, 255)
 GRAY = (150, 160, 170)
 
-class NanoDrone:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.base_size = random.randint(6, 8)
-        self.speed_x = random.uniform(-80, 80)
-        self.speed_y = random.uniform(-60, 60)
-        self.color = random.choice([CYAN, BRIGHT_CYAN, PURPLE])
-        
-        # Pulsing animation for center light
-        self.pulse_timer = random.uniform(0, 3.14)
-        self.pulse_speed = random.uniform(3, 5)
-        
-    def update(self, dt):
-        self.x += self.speed_x * dt
-        self.y += self.speed_y * dt
-        
-        # Wrap around screen
-        if self.x < -20:
-            self.x = WIDTH + 20
-        elif self.x > WIDTH + 20:
-            self.x = -20
-        if self.y < -20:
-            self.y = HEIGHT + 20
-        elif self.y > HEIGHT + 20:
-            self.y = -20
-        
-        # Update pulse animation
-        self.pulse_timer += self.pulse_speed * dt
+DRONE_COLORS = (CYAN, BRIGHT_CYAN, PURPLE)
+DRONE_SIZES = (6, 7, 8)
+PULSE_STEPS = 16  # Distinct brightness levels of the pulsing centre light
+
+class DroneAtlas:
+    """
+    Every drone look baked once: one sprite per colour, body size and pulse step
+    Drawing a drone is then a single blit instead of eight surface allocations.
+    """
+    
+    _shared = None
+    
+    def __init__(self):
+        # (color, size, pulse step) -> (sprite, half size)
+        self.sprites = {}
+        for color in DRONE_COLORS:
+            for size in DRONE_SIZES:
+                for step in range(PULSE_STEPS):
+                    self.sprites[(color, size, step)] = self._bake(color, size, step / (PULSE_STEPS - 1))
+    
+    @classmethod
+    def shared(cls):
+        """Atlas shared by every menu instance (baked on first use)"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
     
-    def draw(self, screen):
-        x, y = int(self.x), int(self.y)
-        size = self.base_size
+    def get(self, color, size, pulse_timer):
+        """Sprite and half size for a drone at this point of its pulse"""
+        pulse_intensity = (math.sin(pulse_timer) + 1) / 2  # 0 to 1
+        return self.sprites[(color, size, round(pulse_intensity * (PULSE_STEPS - 1)))]
+    
+    @staticmethod
+    def _bake(color, size, pulse_intensity):
+        """Draw one drone centred on a transparent sprite"""
+        half = size * 3 + 1  # The main glow is the widest part
+        sprite = pg.Surface((half * 2, half * 2), pg.SRCALPHA)
+        x, y = half, half
         
         # Draw propeller glow effects (4 corners)
         glow_offset = size + 3
         glow_size = 4
-        glow_color = (*self.color, 100)  # Semi-transparent
-        
-        # Create glow surface for transparency
-        glow_surf = pg.Surface((glow_size * 3, glow_size * 3), pg.SRCALPHA)
-        
-        # Top-left propeller glow
-        self._draw_glow(screen, x - glow_offset, y - glow_offset, glow_size, glow_color)
-        # Top-right propeller glow
-        self._draw_glow(screen, x + glow_offset, y - glow_offset, glow_size, glow_color)
-        # Bottom-left propeller glow
-        self._draw_glow(screen, x - glow_offset, y + glow_offset, glow_size, glow_color)
-        # Bottom-right propeller glow
-        self._draw_glow(screen, x + glow_offset, y + glow_offset, glow_size, glow_color)
+        glow_color = (*color, 100)  # Semi-transparent
+        for dx, dy in ((-1, -1), (1, -1), (-1, 1), (1, 1)):
+            DroneAtlas._draw_glow(sprite, x + dx * glow_offset, y + dy * glow_offset, glow_size, glow_color)
         
         # Draw arms/connectors (cross shape)
         arm_length = size + 4
-        arm_color = (*self.color, 80)
+        arm_color = (*color, 80)
         
         # Horizontal arm
         arm_surf = pg.Surface((arm_length * 2, 2), pg.SRCALPHA)
         arm_surf.fill(arm_color)
-        screen.blit(arm_surf, (x - arm_length, y - 1))
+        sprite.blit(arm_surf, (x - arm_length, y - 1))
         
         # Vertical arm
         arm_surf_v = pg.Surface((2, arm_length * 2), pg.SRCALPHA)
         arm_surf_v.fill(arm_color)
-        screen.blit(arm_surf_v, (x - 1, y - arm_length))
+        sprite.blit(arm_surf_v, (x - 1, y - arm_length))
         
         # Draw drone body (rotated square/diamond)
         body_points = [
@@ -93,16 +90,15 @@ class NanoDrone:
         ]
         
         # Body with border
-        pg.draw.polygon(screen, self.color, body_points)
-        pg.draw.polygon(screen, self.color, body_points, 1)  # Border
+        pg.draw.polygon(sprite, color, body_points)
+        pg.draw.polygon(sprite, color, body_points, 1)  # Border
         
         # Main glow around body
         main_glow_surf = pg.Surface((size * 6, size * 6), pg.SRCALPHA)
-        pg.draw.circle(main_glow_surf, (*self.color, 30), (size * 3, size * 3), size * 3)
-        screen.blit(main_glow_surf, (x - size * 3, y - size * 3))
+        pg.draw.circle(main_glow_surf, (*color, 30), (size * 3, size * 3), size * 3)
+        sprite.blit(main_glow_surf, (x - size * 3, y - size * 3))
         
         # Center pulsing light (accent color)
-        pulse_intensity = (math.sin(self.pulse_timer) + 1) / 2  # 0 to 1
         center_size = int(2 + pulse_intensity * 2)
         accent_color = (255, 150, 255)  # Purple/pink accent
         
@@ -111,17 +107,54 @@ class NanoDrone:
         glow_alpha = int(100 + pulse_intensity * 100)
         pg.draw.circle(pulse_glow_surf, (*accent_color, glow_alpha), 
                       (center_size * 3, center_size * 3), center_size * 3)
-        screen.blit(pulse_glow_surf, (x - center_size * 3, y - center_size * 3))
+        sprite.blit(pulse_glow_surf, (x - center_size * 3, y - center_size * 3))
         
         # Center dot
-        pg.draw.circle(screen, accent_color, (x, y), center_size)
+        pg.draw.circle(sprite, accent_color, (x, y), center_size)
+        return sprite, half
     
-    def _draw_glow(self, screen, x, y, size, color):
+    @staticmethod
+    def _draw_glow(surface, x, y, size, color):
         """Helper to draw a glowing circle"""
         glow_surf = pg.Surface((size * 4, size * 4), pg.SRCALPHA)
         pg.draw.circle(glow_surf, color, (size * 2, size * 2), size * 2)
         pg.draw.circle(glow_surf, color, (size * 2, size * 2), size, 0)
-        screen.blit(glow_surf, (x - size * 2, y - size * 2))
+        surface.blit(glow_surf, (x - size * 2, y - size * 2))
+
+class NanoDrone:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.base_size = random.choice(DRONE_SIZES)
+        self.speed_x = random.uniform(-80, 80)
+        self.speed_y = random.uniform(-60, 60)
+        self.color = random.choice(DRONE_COLORS)
+        
+        # Pulsing animation for center light
+        self.pulse_timer = random.uniform(0, 3.14)
+        self.pulse_speed = random.uniform(3, 5)
+        
+    def update(self, dt):
+        self.x += self.speed_x * dt
+        self.y += self.speed_y * dt
+        
+        # Wrap around screen
+        if self.x < -20:
+            self.x = WIDTH + 20
+        elif self.x > WIDTH + 20:
+            self.x = -20
+        if self.y < -20:
+            self.y = HEIGHT + 20
+        elif self.y > HEIGHT + 20:
+            self.y = -20
+        
+        # Update pulse animation
+        self.pulse_timer += self.pulse_speed * dt
+    
+    def draw(self, screen, atlas):
+        """One blit of the pre-baked sprite for this drone's colour, size and pulse"""
+        sprite, half = atlas.get(self.color, self.base_size, self.pulse_timer)
+        screen.blit(sprite, (int(self.x) - half, int(self.y) - half))
 
 class MenuApp:
     def __init__(self):
@@ -135,21 +168,21 @@ class MenuApp:
             font_path = os.path.join(os.path.dirname(__file__), "fonts", "Sterion-BLLId.ttf")
             italic_path = os.path.join(os.path.dirname(__file__), "fonts", "SterionItalic-R99PA.ttf")
             
-            self.title_font = pg.font.Font(font_path, 72)
-            self.subtitle_font = pg.font.Font(italic_path, 22)
-            self.heading_font = pg.font.Font(font_path, 26)
-            self.body_font = pg.font.Font(font_path, 17)
-            self.small_font = pg.font.Font(italic_path, 15)
-            self.dev_font = pg.font.SysFont("arial", 20)
+            self.title_font = text_cache.font(font_path, 72)
+            self.subtitle_font = text_cache.font(italic_path, 22)
+            self.heading_font = text_cache.font(font_path, 26)
+            self.body_font = text_cache.font(font_path, 17)
+            self.small_font = text_cache.font(italic_path, 15)
+            self.dev_font = text_cache.sysfont("arial", 20)
             
         except:
             print("Custom font not found, using default")
-            self.title_font = pg.font.SysFont("arial", 72, bold=True)
-            self.subtitle_font = pg.font.SysFont("arial", 22, italic=True)
-            self.heading_font = pg.font.SysFont("arial", 26, bold=True)
-            self.body_font = pg.font.SysFont("arial", 17)
-            self.small_font = pg.font.SysFont("arial", 15, italic=True)
-            self.dev_font = pg.font.SysFont("arial", 20)
+            self.title_font = text_cache.sysfont("arial", 72, bold=True)
+            self.subtitle_font = text_cache.sysfont("arial", 22, italic=True)
+            self.heading_font = text_cache.sysfont("arial", 26, bold=True)
+            self.body_font = text_cache.sysfont("arial", 17)
+            self.small_font = text_cache.sysfont("arial", 15, italic=True)
+            self.dev_font = text_cache.sysfont("arial", 20)
         
         # Create grid background
         self.bg_image = self.create_grid_background()
@@ -164,6 +197,7 @@ class MenuApp:
 
         # Nano drones
         import random
+        self.drone_atlas = DroneAtlas.shared()
         self.drones = []
         for _ in range(15):  # Spawn 15 drones
             x = random.randint(0, WIDTH)
@@ -242,7 +276,7 @@ class MenuApp:
         
         # Draw drones FIRST (behind everything)
         for drone in self.drones:
-            drone.draw(self.screen)
+            drone.draw(self.screen, self.drone_atlas)
         
         # Draw laser scan
         self.draw_laser_scan()
@@ -262,19 +296,19 @@ class MenuApp:
         self.screen.blit(panel_surface, panel_rect.topleft)
         
         # Title
-        title = self.title_font.render("PROTOCOL: OUTBREAK", True, CYAN)
-        title_shadow = self.title_font.render("PROTOCOL: OUTBREAK", True, DARK_CYAN)
+        title = text_cache.render(self.title_font, "PROTOCOL: OUTBREAK", CYAN)
+        title_shadow = text_cache.render(self.title_font, "PROTOCOL: OUTBREAK", DARK_CYAN)
         self.screen.blit(title_shadow, (WIDTH//2 - title.get_width()//2 + 3, 73))
         self.screen.blit(title, (WIDTH//2 - title.get_width()//2, 70))
         
         # Subtitle
-        subtitle = self.subtitle_font.render("You are humanity's failsafe — a nano drone sent into the machine that once saved us.", True, WHITE)
+        subtitle = text_cache.render(self.subtitle_font, "You are humanity's failsafe — a nano drone sent into the machine that once saved us.", WHITE)
         self.screen.blit(subtitle, (WIDTH//2 - subtitle.get_width()//2, 150))
         
         # Mission Briefing Section
         y_offset = 185
         
-        heading = self.heading_font.render("MISSION BRIEFING", True, WHITE)
+        heading = text_cache.render(self.heading_font, "MISSION BRIEFING", WHITE)
         self.screen.blit(heading, (100, y_offset))
         y_offset += 40
         
@@ -283,13 +317,13 @@ class MenuApp:
             "consciousness. Your objective: infiltrate, survive, and destroy all infection points."
         ]
         for line in briefing_text:
-            text = self.body_font.render(line, True, WHITE)
+            text = text_cache.render(self.body_font, line, WHITE)
             self.screen.blit(text, (100, y_offset))
             y_offset += 26
         
         # Objectives Section
         y_offset += 12
-        objectives_heading = self.heading_font.render("OBJECTIVES", True, PURPLE)
+        objectives_heading = text_cache.render(self.heading_font, "OBJECTIVES", PURPLE)
         self.screen.blit(objectives_heading, (100, y_offset))
         y_offset += 35
         
@@ -305,22 +339,22 @@ class MenuApp:
             
             x_pos = 140
             if prefix:
-                t1 = self.body_font.render(prefix, True, WHITE)
+                t1 = text_cache.render(self.body_font, prefix, WHITE)
                 self.screen.blit(t1, (x_pos, y_offset))
                 x_pos += t1.get_width()
             if highlight:
-                t2 = self.body_font.render(highlight, True, RED)
+                t2 = text_cache.render(self.body_font, highlight, RED)
                 self.screen.blit(t2, (x_pos, y_offset))
                 x_pos += t2.get_width()
             if suffix:
-                t3 = self.body_font.render(suffix, True, WHITE)
+                t3 = text_cache.render(self.body_font, suffix, WHITE)
                 self.screen.blit(t3, (x_pos, y_offset))
             
             y_offset += 26
         
         # Controls Section
         y_offset += 12
-        controls_heading = self.heading_font.render("CONTROLS", True, CYAN)
+        controls_heading = text_cache.render(self.heading_font, "CONTROLS", CYAN)
         self.screen.blit(controls_heading, (100, y_offset))
         y_offset += 35
         
@@ -336,17 +370,17 @@ class MenuApp:
             pg.draw.rect(self.screen, DARK_CYAN, key_box)
             pg.draw.rect(self.screen, CYAN, key_box, 2)
             
-            key_text = self.body_font.render(key, True, WHITE)
+            key_text = text_cache.render(self.body_font, key, WHITE)
             self.screen.blit(key_text, (key_box.centerx - key_text.get_width()//2, key_box.centery - key_text.get_height()//2))
             
-            action_text = self.body_font.render(action, True, WHITE)
+            action_text = text_cache.render(self.body_font, action, WHITE)
             self.screen.blit(action_text, (115 + box_width + 20, y_offset))
             
             y_offset += 35
         
         # Enemy Types Section
         y_offset += 8
-        enemy_heading = self.heading_font.render("ENEMY TYPES", True, PURPLE)
+        enemy_heading = text_cache.render(self.heading_font, "ENEMY TYPES", PURPLE)
         self.screen.blit(enemy_heading, (100, y_offset))
         y_offset += 35
         
@@ -360,10 +394,10 @@ class MenuApp:
             # Draw colored circle bullet
             pg.draw.circle(self.screen, color, (115, y_offset + 8), 5)
             
-            name_text = self.body_font.render(name, True, WHITE)
+            name_text = text_cache.render(self.body_font, name, WHITE)
             self.screen.blit(name_text, (140, y_offset))
             
-            desc_text = self.body_font.render(desc, True, WHITE)
+            desc_text = text_cache.render(self.body_font, desc, WHITE)
             self.screen.blit(desc_text, (140 + name_text.get_width(), y_offset))
             
             y_offset += 26
@@ -382,12 +416,12 @@ class MenuApp:
         pg.draw.rect(self.screen, button_color, button_rect)
         pg.draw.rect(self.screen, WHITE, button_rect, 2)
 
-        button_text = self.heading_font.render("INITIATE INFILTRATION", True, DARK_BG)
+        button_text = text_cache.render(self.heading_font, "INITIATE INFILTRATION", DARK_BG)
         self.screen.blit(button_text, (button_rect.centerx - button_text.get_width()//2, 
                                     button_rect.centery - button_text.get_height()//2))
                 
         # Warning at bottom
-        warning = self.small_font.render("Warning: As you descend deeper, the corruption intensifies. Enemies adapt. Stay alert.", True, (255, 255, 255))
+        warning = text_cache.render(self.small_font, "Warning: As you descend deeper, the corruption intensifies. Enemies adapt. Stay alert.", (255, 255, 255))
         self.screen.blit(warning, (WIDTH//2 - warning.get_width()//2, HEIGHT - 63))  # Moved up
 
         # Developers section at very bottom
@@ -400,7 +434,7 @@ class MenuApp:
         bar.fill((0, 0, 0, 0))  # LAST NUMBER IS THE TRANSPARENCY
         self.screen.blit(bar, (0, HEIGHT - bar_height))
 
-        dev_label = self.dev_font.render(dev_text, True, WHITE)
+        dev_label = text_cache.render(self.dev_font, dev_text, WHITE)
         self.screen.blit(dev_label, (WIDTH//2 - dev_label.get_width()//2, HEIGHT - bar_height//2 - dev_label.get_height()//2 + 2))
 
 
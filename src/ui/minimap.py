@@ -1,5 +1,7 @@
 import pygame
 import math
+import numpy as np
+from src.levels.map_format import TILE_WALL, TILE_BARRIER
 
 class Minimap:
     def __init__(self, world_width, world_height):
@@ -19,9 +21,31 @@ class Minimap:
         self.player_color = (0, 255, 255)  # Cyan
         self.enemy_color = (255, 80, 120)  # Pink/Red
         self.wall_color = (100, 120, 150)  # Gray
+        self.barrier_color = (200, 50, 50)  # Red, like the barriers themselves
         
-        # Create surface with transparency
-        self.surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        # Background, grid and walls; built once per level on first draw
+        self.static_layer = None
+        self.tiles = None
+        self.walls = []
+        
+        # Markers are pre-rendered: a solid dot inside a soft glow
+        self.enemy_stamp = self._make_stamp(self.enemy_color, 4, 6, 80)
+        self.player_stamp = self._make_stamp(self.player_color, 5, 8, 100)
+    
+    def set_level(self, world_width, world_height, tiles=None, walls=()):
+        """
+        Point the minimap at a new level
+        
+        Args:
+            world_width, world_height: World size in units
+            tiles: 2D array of tile codes (map_format.TILE_CODES); preferred source of walls
+            walls: Wall objects, used when there is no tile grid
+        """
+        self.world_width = world_width
+        self.world_height = world_height
+        self.tiles = tiles
+        self.walls = list(walls)
+        self.static_layer = None
         
     def toggle(self):
         """Toggle minimap visibility"""
@@ -34,54 +58,104 @@ class Minimap:
         minimap_y = (world_y / self.world_height) * self.height
         return int(minimap_x), int(minimap_y)
     
-    def draw(self, screen, player, enemies, walls):
-        """Draw the minimap"""
-        if not self.visible:
-            return
-        
-        # Clear surface
-        self.surface.fill(self.background_color)
+    @staticmethod
+    def _make_stamp(color, radius, glow_radius, glow_alpha):
+        stamp = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(stamp, (*color, glow_alpha), (glow_radius, glow_radius), glow_radius)
+        pygame.draw.circle(stamp, color, (glow_radius, glow_radius), radius)
+        return stamp
+    
+    def _build_static_layer(self):
+        """Render background, grid and every wall and barrier at minimap resolution"""
+        layer = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        layer.fill(self.background_color)
         
         # Draw grid
         grid_spacing = 50
         for x in range(0, self.width, grid_spacing):
-            pygame.draw.line(self.surface, self.grid_color, (x, 0), (x, self.height), 1)
+            pygame.draw.line(layer, self.grid_color, (x, 0), (x, self.height), 1)
         for y in range(0, self.height, grid_spacing):
-            pygame.draw.line(self.surface, self.grid_color, (0, y), (self.width, y), 1)
-        
-        # Draw walls (optional - can be slow with many walls)
-        for wall in walls[:100]:  # Limit to first 100 walls for performance
-            wall_x, wall_y = self.world_to_minimap(wall.rect.x, wall.rect.y)
-            wall_w = int((wall.rect.width / self.world_width) * self.width)
-            wall_h = int((wall.rect.height / self.world_height) * self.height)
-            pygame.draw.rect(self.surface, self.wall_color, 
-                        (wall_x, wall_y, max(2, wall_w), max(2, wall_h)))
-
-        # Draw enemies
-        for enemy in enemies:
-            enemy_x, enemy_y = self.world_to_minimap(enemy.x, enemy.y)
-            pygame.draw.circle(self.surface, self.enemy_color, (enemy_x, enemy_y), 4)
-            # Draw small glow
-            glow_surf = pygame.Surface((12, 12), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, (*self.enemy_color, 80), (6, 6), 6)
-            self.surface.blit(glow_surf, (enemy_x - 6, enemy_y - 6))
+            pygame.draw.line(layer, self.grid_color, (0, y), (self.width, y), 1)
         
-        # Draw player (last, so it's on top)
-        player_x, player_y = self.world_to_minimap(player.x, player.y)
-        pygame.draw.circle(self.surface, self.player_color, (player_x, player_y), 5)
-        # Player glow
-        glow_surf = pygame.Surface((16, 16), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (*self.player_color, 100), (8, 8), 8)
-        self.surface.blit(glow_surf, (player_x - 8, player_y - 8))
+        if self.tiles is not None and np.size(self.tiles):
+            self._draw_tiles(layer)
+        else:
+            for wall in self.walls:
+                wall_x, wall_y = self.world_to_minimap(wall.rect.x, wall.rect.y)
+                wall_w = int((wall.rect.width / self.world_width) * self.width)
+                wall_h = int((wall.rect.height / self.world_height) * self.height)
+                color = self.barrier_color if wall.wall_type == "enemy_barrier" else self.wall_color
+                pygame.draw.rect(layer, color, (wall_x, wall_y, max(2, wall_w), max(2, wall_h)))
         
-        # Draw border
-        pygame.draw.rect(self.surface, self.border_color, 
-                        (0, 0, self.width, self.height), 3)
+        self.static_layer = layer
+    
+    def _draw_tiles(self, layer):
+        """
+        Paint the tile grid onto the layer, one minimap pixel per cell
+        
+        Each pixel takes the strongest tile it covers (barrier > wall > floor),
+        so walls thinner than a pixel still show when a big map is shrunk.
+        """
+        tiles = np.asarray(self.tiles)
+        kind = np.zeros(tiles.shape, dtype=np.uint8)
+        kind[tiles == TILE_WALL] = 1
+        kind[tiles == TILE_BARRIER] = 2
+        
+        # reduceat takes the max over each pixel's run of tiles, or repeats
+        # a tile when the map is smaller than the minimap
+        rows, columns = kind.shape
+        row_starts = np.arange(self.height) * rows // self.height
+        column_starts = np.arange(self.width) * columns // self.width
+        kind = np.maximum.reduceat(kind, row_starts, axis=0)
+        kind = np.maximum.reduceat(kind, column_starts, axis=1)
+        
+        # surfarray is indexed [x][y]
+        kind = kind.T
+        pixels = pygame.surfarray.pixels3d(layer)
+        alpha = pygame.surfarray.pixels_alpha(layer)
+        for code, color in ((1, self.wall_color), (2, self.barrier_color)):
+            mask = kind == code
+            pixels[mask] = color
+            alpha[mask] = 255
+        del pixels, alpha  # Unlock the surface
+    
+    def draw(self, screen, player, enemies):
+        """Draw the minimap, returning the screen rect it covers (None when hidden)"""
+        if not self.visible:
+            return None
+        
+        if self.static_layer is None:
+            self._build_static_layer()
         
         # Position minimap in top-right corner
         screen_x = self.margin
         screen_y = self.margin
-        screen.blit(self.surface, (screen_x, screen_y))
+        screen.blit(self.static_layer, (screen_x, screen_y))
+        
+        # Markers, clipped to the minimap
+        previous_clip = screen.get_clip()
+        screen.set_clip((screen_x, screen_y, self.width, self.height))
+        
+        # Draw enemies
+        enemy_offset = self.enemy_stamp.get_width() // 2
+        scale_x = self.width / self.world_width
+        scale_y = self.height / self.world_height
+        screen.blits([
+            (self.enemy_stamp, (screen_x + int(enemy.x * scale_x) - enemy_offset,
+                                screen_y + int(enemy.y * scale_y) - enemy_offset))
+            for enemy in enemies
+        ], False)
+        
+        # Draw player (last, so it's on top)
+        player_x, player_y = self.world_to_minimap(player.x, player.y)
+        player_offset = self.player_stamp.get_width() // 2
+        screen.blit(self.player_stamp, (screen_x + player_x - player_offset, screen_y + player_y - player_offset))
+        
+        screen.set_clip(previous_clip)
+        
+        # Draw border
+        return pygame.draw.rect(screen, self.border_color, 
+                                (screen_x, screen_y, self.width, self.height), 3)
         
         """
         # Draw "MINIMAP" label, remove quotes if you want it to show
@@ -0,0 +1,94 @@
+import pygame
+from src.utils.constants import *
+from src.ui.text_cache import text_cache
+
+class ProfilerOverlay:
+    """
+    Toggleable frame-timing overlay (F3)
+    Shows a bar per FrameProfiler phase, averaged over recent frames, plus entity counts.
+    The profiler only records while the overlay is visible (or profiling was forced on).
+    """
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.visible = False
+        self.font = text_cache.font(None, 18)
+
+        # Layout (right side, below the stats display)
+        self.width = 300
+        self.row_height = 16
+        self.label_width = 110
+        self.bar_max_width = 120
+        self.budget_ms = 1000 / FPS  # A full bar is one frame's budget
+        self.x = SCREEN_WIDTH - self.width - 20
+        self.y = 110
+        self.height = 40 + len(profiler.PHASES) * self.row_height + 40
+
+        self.background = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.background.fill((10, 15, 25, 200))
+        pygame.draw.rect(self.background, UI_CYAN, (0, 0, self.width, self.height), 1)
+
+        self.phase_colors = {
+            'events': (120, 120, 120),
+            'player': CLEAN_BLUE,
+            'bullets': (100, 180, 255),
+            'walls': (150, 150, 150),
+            'enemy_ai': CORRUPTION_PINK,
+            'enemy_collisions': (255, 100, 150),
+            'bullet_hits': CORRUPTION_ORANGE,
+            'draw_world': (80, 200, 120),
+            'draw_entities': (100, 255, 180),
+            'draw_ui': CORRUPTION_PURPLE,
+            'stat_ui': (180, 100, 255),
+            'minimap': (0, 255, 255),
+            'overlay': (90, 90, 90),
+            'present': WHITE,
+        }
+
+    def toggle(self):
+        """Show/hide the overlay; profiling runs only while it is shown"""
+        self.visible = not self.visible
+        self.profiler.enabled = self.visible
+
+    def get_rect(self):
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    def draw(self, screen):
+        """Draw the overlay, returning the screen rect it covers (None when hidden)"""
+        if not self.visible:
+            return None
+
+        phase_ms, counts = self.profiler.recent()
+        total = sum(phase_ms.values())
+
+        screen.blit(self.background, (self.x, self.y))
+
+        header = text_cache.render(self.font, f"FRAME {total:5.2f} ms  ({1000 / total if total else 0:4.0f} fps max)",
+                                   UI_CYAN)
+        screen.blit(header, (self.x + 8, self.y + 8))
+
+        row_y = self.y + 30
+        bar_x = self.x + 8 + self.label_width
+        for phase in self.profiler.PHASES:
+            ms = phase_ms[phase]
+            label = text_cache.render(self.font, phase, WHITE)
+            screen.blit(label, (self.x + 8, row_y))
+            value = text_cache.render(self.font, f"{ms:.2f}", WHITE)
+            screen.blit(value, (bar_x, row_y))
+
+            bar_width = int(min(1.0, ms / self.budget_ms) * self.bar_max_width)
+            pygame.draw.rect(screen, (40, 40, 40), (bar_x + 40, row_y + 2, self.bar_max_width, 10))
+            if bar_width > 0:
+                pygame.draw.rect(screen, self.phase_colors.get(phase, WHITE),
+                                 (bar_x + 40, row_y + 2, bar_width, 10))
+            row_y += self.row_height
+
+        # Counts, three to a line (entities, then enemy AI tiers)
+        count_items = [f"{name}: {value}" for name, value in counts.items()]
+        drawn = self.get_rect()
+        row_y += 10
+        for start in range(0, len(count_items), 3):
+            rendered = text_cache.render(self.font, "  ".join(count_items[start:start + 3]), UI_CYAN)
+            drawn.union_ip(screen.blit(rendered, (self.x + 8, row_y)))
+            row_y += self.row_height
+        return drawn
@@ -1,5 +1,6 @@
 import pygame
 from src.utils.constants import *
+from src.ui.text_cache import text_cache
 
 class StatUpgradeUI:
     """
@@ -8,8 +9,8 @@ class StatUpgradeUI:
     """
     
     def __init__(self):
-        self.font = pygame.font.Font(None, 20)
-        self.small_font = pygame.font.Font(None, 16)
+        self.font = text_cache.font(None, 20)
+        self.small_font = text_cache.font(None, 16)
         
         # UI positioning
         self.x = 20
@@ -126,13 +127,13 @@ class StatUpgradeUI:
         return pygame.Rect(button_x, y_pos + 2, self.button_size, self.button_size)
     
     def draw(self, screen, player):
-        """Draw the upgrade UI"""
+        """Draw the upgrade UI, returning the screen rect of its panel (None when hidden)"""
         if not self.visible:
-            return
+            return None
         
         # Background panel
         panel_height = 40 + (len(self.stat_order) * self.stat_height) + 10
-        pygame.draw.rect(screen, (20, 30, 40), 
+        panel_rect = pygame.draw.rect(screen, (20, 30, 40), 
                         (self.x - 5, self.y - 5, self.width + 10, panel_height),
                         border_radius=5)
         pygame.draw.rect(screen, UI_CYAN, 
@@ -140,12 +141,14 @@ class StatUpgradeUI:
                         2, border_radius=5)
         
         # Skill points display
-        points_text = self.font.render(f"SKILL POINTS: {player.skill_points}", True, WHITE)
+        points_text = text_cache.render(self.font, f"SKILL POINTS: {player.skill_points}", WHITE)
         screen.blit(points_text, (self.x + 5, self.y + 5))
         
         # Draw each stat
         for i, stat_key in enumerate(self.stat_order):
             self.draw_stat_row(screen, player, stat_key, i)
+        
+        return panel_rect
     
     def draw_stat_row(self, screen, player, stat_key, index):
         """Draw a single stat row"""
@@ -159,7 +162,7 @@ class StatUpgradeUI:
                            (self.x, y_pos, self.width - 30, self.stat_height))
         
         # Stat name
-        name_text = self.small_font.render(self.stat_names[stat_key], True, WHITE)
+        name_text = text_cache.render(self.small_font, self.stat_names[stat_key], WHITE)
         screen.blit(name_text, (self.x + 5, y_pos + 4))
         
         # Stat bar background
@@ -210,13 +213,13 @@ class StatUpgradeUI:
         
         # + symbol
         if current_value < 7:
-            plus_text = self.font.render("+", True, text_color)
+            plus_text = text_cache.render(self.font, "+", text_color)
             plus_rect = plus_text.get_rect(center=(button_x + self.button_size//2, 
                                                    button_y + self.button_size//2))
             screen.blit(plus_text, plus_rect)
         else:
             # Max indicator
-            max_text = self.small_font.render("MAX", True, (255, 215, 0))
+            max_text = text_cache.render(self.small_font, "MAX", (255, 215, 0))
             max_rect = max_text.get_rect(center=(button_x + self.button_size//2, 
                                                  button_y + self.button_size//2))
             screen.blit(max_text, max_rect)
\ No newline at end of file
@@ -0,0 +1,77 @@
+import pygame
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces, keyed by (font, text, colour, antialias)
+
+    Labels that never change are rendered once and reused every frame; labels
+    built from live values (HP, XP, counters) only re-render when the value
+    changes. Least recently used surfaces are dropped once the cache holds
+    more than max_bytes of pixel data.
+
+    Returned surfaces are shared: blit them, don't draw on them.
+
+    Fonts are part of the key, so screens that are built again each time they
+    show get their fonts from font()/sysfont(): the same arguments return the
+    same Font object, and the text rendered with it stays reusable instead of
+    piling up under fonts nothing uses any more.
+    """
+
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+        self._fonts = {}
+
+    def render(self, font, text, color, antialias=True):
+        """Same as font.render(text, antialias, color), but cached"""
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        self.bytes += TextCache._size(surface)
+        while self.bytes > self.max_bytes and len(self._surfaces) > 1:
+            _, evicted = self._surfaces.popitem(last=False)
+            self.bytes -= TextCache._size(evicted)
+        return surface
+
+    def font(self, path, size):
+        """Shared pygame.font.Font(path, size)"""
+        key = ('file', path, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = pygame.font.Font(path, size)
+        return font
+
+    def sysfont(self, name, size, bold=False, italic=False):
+        """Shared pygame.font.SysFont(name, size, bold, italic)"""
+        key = ('system', name, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+        return font
+
+    def clear(self):
+        self._surfaces.clear()
+        self.bytes = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    @staticmethod
+    def _size(surface):
+        return surface.get_pitch() * surface.get_height()
+
+
+# Shared by every UI module
+text_cache = TextCache()
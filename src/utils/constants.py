@@ -2,7 +2,22 @@
 # Screen settings
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
-FPS = 60
+FPS = 60  # Render frame cap
+
+# Fixed-timestep simulation
+SIM_TICK_RATE = 60  # Game logic updates per second, independent of render rate
+BASE_TICK_RATE = 60  # Speeds, cooldowns and delays are tuned in ticks of this rate
+MAX_FRAME_TIME = 0.25  # Seconds of lag the simulation catches up on per frame (avoids a spiral of death)
+
+# Debug drawing
+DEBUG_AGGRO_RANGE = True  # Outline the aggro range around enemies that haven't noticed the player
+
+# Enemy AI level of detail
+AI_LOD = True  # Update idle enemies far from the player less often, or not at all
+ENEMY_BATCH = False  # Update enemies with the NumPy EnemyBatch engine instead of one Enemy.update() each
+
+# Rendering
+DIRTY_RECTS = False  # Repaint and present only changed regions while the camera holds still
 
 # World width & Length
 WORLD_WIDTH = 3000
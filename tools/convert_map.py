@@ -2,14 +2,20 @@
 PNG to JSON Map Converter - Development Tool
 ============================================
 Run this script once when you create/edit a PNG map to convert it to JSON.
-Automatically skips files that are already up-to-date.
+Each JSON map is also compiled to a binary map (assets/maps/bin/*.map) with
+the wall rectangles already merged; the game loads that instead of the JSON.
+Automatically skips files that are already up-to-date: assets/maps/manifest.json
+records a content hash of every converted PNG and the converter settings used,
+so touching a file (e.g. a git checkout) does not force a rebuild.
 
 Usage:
     python tools/convert_map.py                          # Interactive mode
     python tools/convert_map.py level_1.png             # Convert specific file
-    python tools/convert_map.py --all                   # Convert all PNGs
+    python tools/convert_map.py --all                   # Convert all PNGs (in parallel)
     python tools/convert_map.py --all --force           # Force reconvert all
     python tools/convert_map.py level_1.png --force     # Force reconvert one
+    python tools/convert_map.py --all --merge greedy    # Compile binaries with another wall merge
+    python tools/convert_map.py --watch                 # Reconvert PNGs as they are saved
 
 After conversion, you never need to run this again unless you edit the PNG.
 """
@@ -19,37 +25,168 @@ After conversion, you never need to run this again unless you edit the PNG.
 # fffa00 the yellow is for a boss
 # ff7400 the orange is for stationary snipers
 import pygame
+import contextlib
+import hashlib
+import io
 import json
 import os
 import sys
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.levels.map_generator import MapGenerator, MERGE_ALGORITHM, MERGE_ALGORITHMS
+from src.levels.map_format import (
+    BinaryMap, TILE_NAMES, TILE_EMPTY, TILE_WALL, TILE_BARRIER,
+    TILE_PLAYER_SPAWN, TILE_ENEMY_SPAWN, TILE_BOSS_SPAWN, TILE_SNIPER_SPAWN
+)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANIFEST_PATH = os.path.join(BASE_DIR, 'assets', 'maps', 'manifest.json')
+
+# Bump when classification or the JSON layout changes so every map is rebuilt
+CONVERTER_VERSION = 2
+
+# --watch polling interval (seconds); a file is converted once it has been
+# unchanged for one interval, so editors that save in several writes are not caught halfway
+WATCH_INTERVAL = 0.25
+
+
+def file_digest(path):
+    """SHA-1 hex digest of a file's contents"""
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class ConversionManifest:
+    """
+    Content hashes of converted PNGs (assets/maps/manifest.json)
+    
+    {"maps": {"level_1.png": {"source": <sha1 of the PNG>, "settings": {...}}}}
+    """
+    
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    self.entries = json.load(f).get('maps', {})
+            except (OSError, ValueError):
+                print(f"⚠️  Ignoring unreadable manifest: {path}")
+    
+    def get(self, name):
+        return self.entries.get(name)
+    
+    def record(self, name, entry):
+        self.entries[name] = entry
+    
+    def save(self):
+        """Write the manifest atomically (a half-written file would force a full rebuild)"""
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump({'maps': self.entries}, f, indent=2, sort_keys=True)
+            f.write('\n')
+        os.replace(temp_path, self.path)
+
+
 class MapConverter:
-    def __init__(self, tile_size=50):
+    def __init__(self, tile_size=50, merge_algorithm=MERGE_ALGORITHM, manifest_path=MANIFEST_PATH):
         self.tile_size = tile_size
+        self.merge_algorithm = merge_algorithm
+        self.manifest = ConversionManifest(manifest_path)
         pygame.init()
     
-    def needs_conversion(self, png_path, json_path):
+    def settings(self):
+        """Converter settings that change the JSON output (the merge only affects binaries)"""
+        return {'tile_size': self.tile_size, 'converter': CONVERTER_VERSION}
+    
+    def needs_conversion(self, png_path, json_path, digest=None):
         """
         Check if PNG needs to be converted
+        
+        Args:
+            digest: file_digest() of the PNG, if already computed
+        
         Returns: (needs_conversion, reason)
         """
         # JSON doesn't exist
         if not os.path.exists(json_path):
             return True, "JSON file doesn't exist"
         
-        # Check if PNG is newer than JSON
-        png_time = os.path.getmtime(png_path)
-        json_time = os.path.getmtime(json_path)
+        entry = self.manifest.get(os.path.basename(png_path))
+        if entry is None:
+            # Maps converted before the manifest existed: trust the JSON if it is
+            # newer than the PNG, but record it with unknown settings (it may come
+            # from an older converter) so the next run rebuilds it
+            png_time = os.path.getmtime(png_path)
+            json_time = os.path.getmtime(json_path)
+            if png_time > json_time:
+                png_date = datetime.fromtimestamp(png_time).strftime('%Y-%m-%d %H:%M:%S')
+                json_date = datetime.fromtimestamp(json_time).strftime('%Y-%m-%d %H:%M:%S')
+                return True, f"Not in manifest and PNG modified after JSON (PNG: {png_date}, JSON: {json_date})"
+            return False, "Newer than the PNG (added to manifest; rebuilt on the next run)"
         
-        if png_time > json_time:
-            png_date = datetime.fromtimestamp(png_time).strftime('%Y-%m-%d %H:%M:%S')
-            json_date = datetime.fromtimestamp(json_time).strftime('%Y-%m-%d %H:%M:%S')
-            return True, f"PNG modified after JSON (PNG: {png_date}, JSON: {json_date})"
+        if entry.get('settings') != self.settings():
+            return True, "Converter settings changed"
+        
+        if digest is None:
+            digest = file_digest(png_path)
+        if entry.get('source') != digest:
+            return True, "PNG content changed"
         
         # JSON is up-to-date
         return False, "Already up-to-date"
     
+    def classify(self, image):
+        """
+        Classify every pixel of a map image at once
+        
+        Returns:
+            (height, width) uint8 array of tile codes (see map_format.TILE_CODES)
+        """
+        # surfarray is indexed [x][y]; transpose to rows
+        pixels = pygame.surfarray.array3d(image).transpose(1, 0, 2).astype(np.int16)
+        r, g, b = pixels[..., 0], pixels[..., 1], pixels[..., 2]
+        
+        # First matching colour wins, in this order
+        conditions = [
+            (g > 200) & (r < 100) & (b < 50),                # 3aff00 green: player spawn
+            (r > 200) & (b > 200) & (g < 50),                # ff00fa pink: enemy spawn
+            (r > 200) & (g < 50) & (b < 50),                 # ff0000 red: barrier
+            (r > 200) & (g > 200) & (b < 50),                # fffa00 yellow: boss
+            (r > 200) & (g >= 80) & (g <= 160) & (b < 50),   # ff7400 orange: sniper
+            (r < 128) & (g < 128) & (b < 128),               # dark: wall
+        ]
+        choices = [TILE_PLAYER_SPAWN, TILE_ENEMY_SPAWN, TILE_BARRIER,
+                   TILE_BOSS_SPAWN, TILE_SNIPER_SPAWN, TILE_WALL]
+        return np.select(conditions, choices, TILE_EMPTY).astype(np.uint8)
+    
+    def spawn_positions(self, tiles, code):
+        """World-space centres of every tile with code, in row-major order"""
+        rows, columns = np.nonzero(tiles == code)
+        half = self.tile_size // 2
+        return [[int(x) * self.tile_size + half, int(y) * self.tile_size + half]
+                for y, x in zip(rows, columns)]
+    
+    def compile_binary(self, json_path, force=False):
+        """
+        Write the binary map for a JSON map if it is missing or was compiled from an older JSON
+        
+        Returns:
+            True if a binary map was written
+        """
+        bin_path = BinaryMap.path_for(json_path)
+        if not force and BinaryMap.is_current(bin_path, json_path, self.merge_algorithm):
+            return False
+        
+        MapGenerator.write_binary_map(json_path, bin_path, self.merge_algorithm)
+        print(f"   📦 Binary map: {os.path.basename(bin_path)} ({os.path.getsize(bin_path)} bytes)")
+        return True
+    
     def convert(self, png_path, json_path=None, force=False):
         """
         Convert a single PNG to JSON
@@ -70,11 +207,16 @@ class MapConverter:
         os.makedirs(os.path.dirname(json_path), exist_ok=True)
         
         # Check if conversion is needed
-        needs_conv, reason = self.needs_conversion(png_path, json_path)
+        png_name = os.path.basename(png_path)
+        digest = file_digest(png_path)
+        needs_conv, reason = self.needs_conversion(png_path, json_path, digest)
         
         if not needs_conv and not force:
-            print(f"\n⏭️  Skipping: {os.path.basename(png_path)}")
+            print(f"\n⏭️  Skipping: {png_name}")
             print(f"   {reason}")
+            if self.manifest.get(png_name) is None:
+                self.manifest.record(png_name, {'source': digest, 'settings': None})
+            self.compile_binary(json_path)
             return True, 'skipped'
         
         try:
@@ -90,40 +232,18 @@ class MapConverter:
             print(f"   Size: {width}x{height} pixels → {width*self.tile_size}x{height*self.tile_size} world units")
             
             # Convert to grid
-            grid = []
-            wall_count = 0
-            barrier_count = 0
-            enemy_spawns = []
-            player_spawn = None
-
-            for y in range(height):
-                row = []
-                for x in range(width):
-                    color = image.get_at((x, y))
-
-                    if color.g > 200 and color.r < 100 and color.b < 50:
-                        row.append('player_spawn')
-                        world_x = (x * self.tile_size) + (self.tile_size // 2)
-                        world_y = (y * self.tile_size) + (self.tile_size // 2)
-                        player_spawn = [world_x,world_y]
-
-                    elif color.r > 200 and color.b > 200 and color.g < 50:
-                        row.append("enemy_spawn")
-                        world_x = (x * self.tile_size) + (self.tile_size // 2)
-                        world_y = (y * self.tile_size) + (self.tile_size // 2)
-                        enemy_spawns.append([world_x,world_y])
-
-                    elif color.r > 200 and color.g < 50 and color.b < 50:
-                        row.append('barrier')
-                        barrier_count += 1
-
-                    elif color.r < 128 and color.g < 128 and color.b < 128:
-                        row.append('wall')
-                        wall_count += 1
-                    else:
-                        row.append('empty')
-
-                grid.append(row)
+            tiles = self.classify(image)
+            names = np.array([TILE_NAMES[code] for code in range(len(TILE_NAMES))])
+            grid = names[tiles].tolist()
+            wall_count = int(np.count_nonzero(tiles == TILE_WALL))
+            barrier_count = int(np.count_nonzero(tiles == TILE_BARRIER))
+            enemy_spawns = self.spawn_positions(tiles, TILE_ENEMY_SPAWN)
+            boss_spawns = self.spawn_positions(tiles, TILE_BOSS_SPAWN)
+            sniper_spawns = self.spawn_positions(tiles, TILE_SNIPER_SPAWN)
+            
+            # The last green pixel is the spawn
+            player_spawns = self.spawn_positions(tiles, TILE_PLAYER_SPAWN)
+            player_spawn = player_spawns[-1] if player_spawns else None
 
             if player_spawn is None:
                 print("Did not create a spawn or did not use right color")
@@ -143,20 +263,27 @@ class MapConverter:
                     'barrier_pixel_count': barrier_count,
                     'player_spawn': player_spawn,
                     'enemy_spawns': enemy_spawns,
+                    'boss_spawns': boss_spawns,
+                    'sniper_spawns': sniper_spawns,
                     'converted_at': datetime.now().isoformat()
                 },
                 'grid': grid
             }
             
-            # Save JSON
+            # Save JSON (one line per grid row keeps large maps small and diffable)
             with open(json_path, 'w') as f:
-                json.dump(map_data, f, indent=2)
+                f.write(self.format_json(map_data))
             
             print(f"   Walls: {wall_count} pixels")
             print(f"   Barriers: {barrier_count} pixels")
             print(f"   Player spawn: {player_spawn}")  # ADD THIS
             print(f"   Enemy spawns: {len(enemy_spawns)} locations")  # ADD THIS
+            if boss_spawns or sniper_spawns:
+                print(f"   Boss spawns: {len(boss_spawns)}, sniper spawns: {len(sniper_spawns)}")
             print(f"   ✅ Saved: {os.path.basename(json_path)}")
+            
+            self.compile_binary(json_path, force=True)
+            self.manifest.record(png_name, {'source': digest, 'settings': self.settings()})
             return True, 'converted'
             
         except Exception as e:
@@ -164,6 +291,97 @@ class MapConverter:
             return False, 'error'
 
 
+    @staticmethod
+    def format_json(map_data):
+        """Indented metadata, one grid row per line"""
+        metadata = json.dumps(map_data['metadata'], indent=2).replace('\n', '\n  ')
+        rows = ',\n    '.join(json.dumps(row, separators=(',', ':')) for row in map_data['grid'])
+        return f'{{\n  "metadata": {metadata},\n  "grid": [\n    {rows}\n  ]\n}}\n'
+
+
+def _convert_worker(png_path, force, merge_algorithm):
+    """
+    Convert one PNG in a worker process
+    
+    Returns:
+        (status, captured output, manifest entry or None)
+    """
+    converter = MapConverter(tile_size=50, merge_algorithm=merge_algorithm)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        success, status = converter.convert(png_path, force=force)
+    return status, output.getvalue(), converter.manifest.get(os.path.basename(png_path))
+
+
+def convert_all(png_paths, force, merge_algorithm):
+    """
+    Convert PNGs concurrently in a process pool; output is printed in file order.
+    Workers send their manifest entries back so the manifest is written once, here.
+    
+    Returns:
+        Dict status -> count
+    """
+    counts = {'converted': 0, 'skipped': 0, 'error': 0}
+    manifest = ConversionManifest()
+    workers = min(len(png_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_convert_worker, path, force, merge_algorithm) for path in png_paths]
+        for path, future in zip(png_paths, futures):
+            status, output, entry = future.result()
+            print(output, end='')
+            counts[status] += 1
+            if entry is not None:
+                manifest.record(os.path.basename(path), entry)
+    manifest.save()
+    return counts
+
+
+def watch(png_dir, converter, interval=WATCH_INTERVAL):
+    """
+    Poll png_dir and reconvert PNGs whose contents change, until Ctrl+C
+    
+    Files are stat()ed every interval; one that changed is converted after it
+    has stayed unchanged for a full interval. The manifest hash check then
+    skips saves that did not change the pixels.
+    """
+    def snapshot():
+        stats = {}
+        for filename in find_png_files(png_dir):
+            try:
+                stat = os.stat(os.path.join(png_dir, filename))
+            except FileNotFoundError:
+                continue  # Deleted between listdir and stat
+            stats[filename] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+    
+    print(f"\n👀 Watching {png_dir} (Ctrl+C to stop)")
+    seen = snapshot()
+    pending = {}
+    try:
+        while True:
+            time.sleep(interval)
+            current = snapshot()
+            
+            for filename in seen.keys() - current.keys():
+                print(f"\n🗑️  Removed: {filename} (its JSON and binary map are kept)")
+                pending.pop(filename, None)
+            
+            for filename, stat in current.items():
+                if seen.get(filename) != stat:
+                    pending[filename] = stat  # Still being written; wait for it to settle
+                elif pending.get(filename) == stat:
+                    del pending[filename]
+                    start = time.perf_counter()
+                    success, status = converter.convert(os.path.join(png_dir, filename))
+                    converter.manifest.save()
+                    if status == 'converted':
+                        print(f"   ⏱️  Rebuilt in {(time.perf_counter() - start) * 1000:.0f} ms")
+            
+            seen = current
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
+
 def find_png_files(directory):
     """Find all PNG files in directory"""
     if not os.path.exists(directory):
@@ -176,11 +394,23 @@ def main():
     force = '--force' in sys.argv or '-f' in sys.argv
     args = [arg for arg in sys.argv[1:] if arg not in ['--force', '-f']]
     
-    converter = MapConverter(tile_size=50)
+    # --merge <algorithm> picks the wall merge compiled into binary maps
+    merge_algorithm = MERGE_ALGORITHM
+    if '--merge' in args:
+        index = args.index('--merge')
+        if index + 1 >= len(args) or args[index + 1] not in MERGE_ALGORITHMS:
+            print(f"❌ --merge needs one of: {', '.join(MERGE_ALGORITHMS)}")
+            return
+        merge_algorithm = args[index + 1]
+        del args[index:index + 2]
+        if merge_algorithm != MERGE_ALGORITHM:
+            print(f"⚠️  The game only loads binaries built with '{MERGE_ALGORITHM}'; "
+                  f"these will fall back to JSON")
+    
+    converter = MapConverter(tile_size=50, merge_algorithm=merge_algorithm)
     
     # Setup paths
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    png_dir = os.path.join(base_dir, 'assets', 'maps', 'png')
+    png_dir = os.path.join(BASE_DIR, 'assets', 'maps', 'png')
     
     print("=" * 60)
     print("🗺️  PNG → JSON Map Converter")
@@ -210,20 +440,11 @@ def main():
             
             print(f"\nFound {len(png_files)} PNG file(s)")
             
-            converted = 0
-            skipped = 0
-            errors = 0
-            
-            for png_file in png_files:
-                png_path = os.path.join(png_dir, png_file)
-                success, status = converter.convert(png_path, force=force)
-                
-                if status == 'converted':
-                    converted += 1
-                elif status == 'skipped':
-                    skipped += 1
-                elif status == 'error':
-                    errors += 1
+            png_paths = [os.path.join(png_dir, png_file) for png_file in png_files]
+            counts = convert_all(png_paths, force, merge_algorithm)
+            converted = counts['converted']
+            skipped = counts['skipped']
+            errors = counts['error']
             
             print(f"\n{'='*60}")
             print(f"Summary:")
@@ -236,6 +457,16 @@ def main():
             if skipped > 0 and not force:
                 print("\n💡 Tip: Use --force to reconvert all files")
         
+        # Bring everything up to date, then keep converting as PNGs are saved
+        elif arg == "--watch" or arg == "-w":
+            png_paths = [os.path.join(png_dir, png_file) for png_file in find_png_files(png_dir)]
+            if png_paths:
+                counts = convert_all(png_paths, force, merge_algorithm)
+                print(f"\n✅ Converted {counts['converted']}, up-to-date {counts['skipped']}"
+                      + (f", ❌ errors {counts['error']}" if counts['error'] else ""))
+            converter.manifest = ConversionManifest()  # Pick up what the workers recorded
+            watch(png_dir, converter)
+        
         # Convert specific file
         else:
             filename = arg if arg.endswith('.png') else arg + '.png'
@@ -249,6 +480,7 @@ def main():
                 return
             
             success, status = converter.convert(png_path, force=force)
+            converter.manifest.save()
             
             print(f"\n{'='*60}")
             if status == 'converted':
@@ -293,20 +525,11 @@ def main():
             return
         
         elif choice == 'a':
-            converted = 0
-            skipped = 0
-            errors = 0
-            
-            for png_file in png_files:
-                png_path = os.path.join(png_dir, png_file)
-                success, status = converter.convert(png_path, force=False)
-                
-                if status == 'converted':
-                    converted += 1
-                elif status == 'skipped':
-                    skipped += 1
-                elif status == 'error':
-                    errors += 1
+            png_paths = [os.path.join(png_dir, png_file) for png_file in png_files]
+            counts = convert_all(png_paths, False, merge_algorithm)
+            converted = counts['converted']
+            skipped = counts['skipped']
+            errors = counts['error']
             
             print(f"\n{'='*60}")
             print(f"Summary:")
@@ -317,17 +540,10 @@ def main():
             print(f"{'='*60}")
         
         elif choice == 'f':
-            converted = 0
-            errors = 0
-            
-            for png_file in png_files:
-                png_path = os.path.join(png_dir, png_file)
-                success, status = converter.convert(png_path, force=True)
-                
-                if status in ['converted', 'skipped']:
-                    converted += 1
-                elif status == 'error':
-                    errors += 1
+            png_paths = [os.path.join(png_dir, png_file) for png_file in png_files]
+            counts = convert_all(png_paths, True, merge_algorithm)
+            converted = counts['converted'] + counts['skipped']
+            errors = counts['error']
             
             print(f"\n{'='*60}")
             print(f"✅ Force converted {converted}/{len(png_files)} file(s)")
@@ -340,6 +556,7 @@ def main():
             if 0 <= idx < len(png_files):
                 png_path = os.path.join(png_dir, png_files[idx])
                 success, status = converter.convert(png_path, force=force)
+                converter.manifest.save()
                 
                 print(f"\n{'='*60}")
                 if status == 'converted':